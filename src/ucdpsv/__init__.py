@@ -24,12 +24,52 @@
 
 """Unified Chip Design Platform - SystemVerilog Support."""
 
-from .svexprresolver import SvDecl, SvExprResolver, get_resolver
-from .svimporter import import_params_ports
+from .svbackend import HdlParserBackend, SvBackend
+from .svcache import SvCache, get_fingerprint, get_svcache, get_templatehash
+from .svexprresolver import SvDecl, SvExprResolver, SvInst, get_resolver, get_structdecl, get_svinst, get_svinsts
+from .svfileheader import SvFileHeader, get_copyright, get_fileheader
+from .svimporter import SvImport, SvModFactory, freeze_svfile, get_svimports, import_params_ports
+from .svlibindex import SvLibEntry, SvLibFile, SvLibIndex
+from .svoptions import SvOptions, get_svoptions
+from .svpackage import SvPackage, import_svpackages
+from .svscanner import SvScanner
+from .svserver import SvServer, request_svserver
+from .svvariant import SvVariant, generate_variants
+from .svwatcher import SvWatcher
 
 __all__ = [
+    "HdlParserBackend",
+    "SvBackend",
+    "SvCache",
     "SvDecl",
     "SvExprResolver",
+    "SvFileHeader",
+    "SvImport",
+    "SvInst",
+    "SvLibEntry",
+    "SvLibFile",
+    "SvLibIndex",
+    "SvModFactory",
+    "SvOptions",
+    "SvPackage",
+    "SvScanner",
+    "SvServer",
+    "SvVariant",
+    "SvWatcher",
+    "freeze_svfile",
+    "generate_variants",
+    "get_copyright",
+    "get_fileheader",
+    "get_fingerprint",
     "get_resolver",
+    "get_structdecl",
+    "get_svcache",
+    "get_svimports",
+    "get_svinst",
+    "get_svinsts",
+    "get_svoptions",
+    "get_templatehash",
     "import_params_ports",
+    "import_svpackages",
+    "request_svserver",
 ]
@@ -0,0 +1,70 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Parser Backends.
+
+`SvImporter` reads module headers via a backend, which returns the `hdl_parser` datamodel:
+
+* `HdlParserBackend`: Full parser from `hdl_parser` (default).
+* `SvScanner`: Fast scanner for module headers only.
+
+    >>> import ucdpsv as usv
+    >>> def _build(self):
+    ...     usv.import_params_ports(self, backend=usv.SvScanner())
+"""
+
+from abc import abstractmethod
+from pathlib import Path
+
+import hdl_parser as hdl
+import ucdp as u
+
+
+class SvBackend(u.Object):
+    """
+    Parser Backend.
+
+    Backends are immutable and hashable, as parse results are cached per backend.
+    """
+
+    @abstractmethod
+    def parse_text(self, text: str, filepath: Path | None = None) -> hdl.File:
+        """Parse `text` and return all modules."""
+
+    def parse_file(self, filepath: Path) -> hdl.File:
+        """Parse `filepath` and return all modules."""
+        return self.parse_text(filepath.read_text(), filepath=filepath)
+
+
+class HdlParserBackend(SvBackend):
+    """Backend using `hdl_parser`."""
+
+    def parse_text(self, text: str, filepath: Path | None = None) -> hdl.File:
+        """Parse `text` and return all modules."""
+        return hdl.parse_text(text, file_path=filepath)
+
+
+DEFAULT_BACKEND = HdlParserBackend()
@@ -0,0 +1,335 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Render Cache.
+
+Parameterized hierarchies often contain modules with different module names, but identical content.
+The module body (`logic`) of these modules is rendered once per fingerprint and reused afterwards:
+
+    >>> import ucdpsv as usv
+    >>> data = {"svcache": usv.SvCache()}
+
+`u.generate(mod, "hdl", data=data)` uses this cache for all generated files.
+The same cache can be handed over to multiple `u.generate` calls.
+The cache keeps the text of every module body in memory. With a cache, module bodies are rendered
+to one text, instead of being written line-by-line to the output.
+
+With a `path`, rendered text is additionally stored in a cache directory, which can be shared
+between workspaces and CI jobs, like `ccache`:
+
+    >>> from pathlib import Path
+    >>> svcache = usv.SvCache(path=Path("/shared/ucdp-sv-cache"), max_size=1 << 30)
+
+Entries are keyed by module fingerprint, template hash and tool versions.
+The least recently used entries are removed, as soon as the directory exceeds `max_size` bytes.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from hashlib import sha256
+from importlib import metadata
+from pathlib import Path
+from sys import version_info
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any
+
+import ucdp as u
+
+from .svoptions import DEFAULT_SVOPTIONS, SvOptions
+
+
+class SvCache(u.Object):
+    """
+    Rendered SystemVerilog Per Key.
+
+    The key is built from the module fingerprint (see `get_fingerprint`) and the render arguments.
+
+    Attributes:
+        path: Optional cache directory, shared between processes.
+        max_size: Maximum size of the cache directory in bytes.
+    """
+
+    path: Path | None = None
+    max_size: int | None = None
+
+    _items: dict[str, str] = u.PrivateField(default_factory=dict)
+    _lock: Lock = u.PrivateField(default_factory=Lock)
+    _hits: int = u.PrivateField(default=0)
+    _misses: int = u.PrivateField(default=0)
+    _evictions: int = u.PrivateField(default=0)
+    _size: int | None = u.PrivateField(default=None)
+
+    @property
+    def hits(self) -> int:
+        """Number of Cache Hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of Cache Misses."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of Entries Removed From The Cache Directory."""
+        return self._evictions
+
+    @property
+    def stat(self) -> str:
+        """Statistics."""
+        return f"SvCache: {self._hits} hits, {self._misses} misses, {self._evictions} evictions"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        """
+        Return Cached Text For `key` Or Render And Store It.
+
+            >>> import ucdpsv as usv
+            >>> svcache = usv.SvCache()
+            >>> svcache.get_or_render("key", lambda: "text")
+            'text'
+            >>> svcache.get_or_render("key", lambda: "other")
+            'text'
+            >>> svcache.hits, svcache.misses
+            (1, 1)
+        """
+        with self._lock:
+            text = self._items.get(key)
+            if text is not None:
+                self._hits += 1
+                return text
+        filepath = self._get_filepath(key)
+        text = _read(filepath) if filepath else None
+        with self._lock:
+            if text is not None:
+                self._hits += 1
+                return self._items.setdefault(key, text)
+            self._misses += 1
+        text = render()
+        if filepath:
+            # the cache directory might be read-only or owned by others - the rendered text is valid anyway
+            try:
+                size = _write(filepath, text)
+                self._evict(size)
+            except OSError:
+                pass
+        with self._lock:
+            return self._items.setdefault(key, text)
+
+    def clear(self) -> None:
+        """Remove All Cached Text From Memory And Reset Statistics."""
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _get_filepath(self, key: str) -> Path | None:
+        if self.path is None:
+            return None
+        digest = sha256(f"{get_toolversions()}\0{key}".encode()).hexdigest()
+        return Path(self.path) / digest[:2] / digest
+
+    def _evict(self, written: int) -> None:
+        """
+        Remove Least Recently Used Files, As Soon As The Directory Exceeds `max_size`.
+
+        The directory is scanned once and whenever the size, tracked by the `written` bytes, exceeds `max_size`.
+        Writes of other processes are noticed on the next scan.
+        """
+        if self.max_size is None:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += written
+                if self._size <= self.max_size:
+                    return
+        entries = []
+        for filepath in Path(self.path).glob("*/*"):  # type: ignore[arg-type]
+            if filepath.suffix:
+                # skip temporary files of concurrent writers
+                continue
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, filepath))
+        size = sum(entry[1] for entry in entries)
+        evictions = 0
+        for _, filesize, filepath in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                filepath.unlink(missing_ok=True)
+            except OSError:
+                continue
+            size -= filesize
+            evictions += 1
+        with self._lock:
+            self._size = size
+            self._evictions += evictions
+
+
+_DATAMODEL_LOCK = Lock()
+
+
+def get_datamodelcache(datamodel: Any, name: str) -> dict[Any, Any]:
+    """
+    Return Cache `name` Stored In `datamodel`.
+
+    The cache lives as long as the datamodel, which is created per generation.
+    Files are rendered concurrently, so the cache is created just once and
+    entries should be added via `setdefault`, to keep the first one on races.
+    Without `datamodel`, a new cache is returned on every call.
+
+        >>> from makolator import Datamodel
+        >>> datamodel = Datamodel()
+        >>> get_datamodelcache(datamodel, "example") is get_datamodelcache(datamodel, "example")
+        True
+    """
+    if datamodel is None:
+        return {}
+    cache = getattr(datamodel, name, None)
+    if cache is None:
+        with _DATAMODEL_LOCK:
+            cache = getattr(datamodel, name, None)
+            if cache is None:
+                cache = {}
+                setattr(datamodel, name, cache)
+    return cache
+
+
+def get_svcache(datamodel: Any = None) -> SvCache | None:
+    """
+    Return `SvCache` stored in `datamodel`.
+
+    `None` is returned, if `datamodel` does not contain `svcache`.
+
+        >>> import ucdpsv as usv
+        >>> usv.get_svcache() is None
+        True
+    """
+    return getattr(datamodel, "svcache", None)
+
+
+@lru_cache
+def get_toolversions() -> str:
+    """Versions of Python and All Packages Involved In Rendering."""
+    versions = [f"python={version_info.major}.{version_info.minor}.{version_info.micro}"]
+    versions.extend(f"{name}={_get_version(name)}" for name in ("ucdp", "ucdp-sv", "mako", "makolator", "aligntext"))
+    return " ".join(versions)
+
+
+def _get_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def get_templatehash(namespace: Any) -> str:
+    """
+    Return Hash Of All Template Files Of The Mako `namespace` And Its Inherited Templates.
+
+    Within a template, use `usv.get_templatehash(self)`.
+    """
+    hash_ = sha256()
+    while namespace is not None:
+        filename = getattr(namespace, "filename", None)
+        if filename:
+            hash_.update(_get_filehash(filename, Path(filename).stat().st_mtime_ns).encode())
+        namespace = getattr(namespace, "inherits", None)
+    return hash_.hexdigest()
+
+
+@lru_cache
+def _get_filehash(filename: str, mtime_ns: int) -> str:
+    return sha256(Path(filename).read_bytes()).hexdigest()
+
+
+def _read(filepath: Path) -> str | None:
+    try:
+        text = filepath.read_text(encoding="utf-8")
+    except OSError:
+        # missing or inaccessible
+        return None
+    # refresh least recently used order - the cache might be read-only or owned by others
+    try:
+        os.utime(filepath)
+    except OSError:
+        pass
+    return text
+
+
+def _write(filepath: Path, text: str) -> int:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    # write atomically, as other processes might read concurrently
+    with NamedTemporaryFile("w", encoding="utf-8", dir=filepath.parent, delete=False, suffix=".tmp") as file:
+        file.write(text)
+    size = Path(file.name).stat().st_size
+    Path(file.name).replace(filepath)
+    return size
+
+
+def get_fingerprint(mod: u.BaseMod, svoptions: SvOptions | None = None) -> str:
+    """
+    Return Fingerprint Of Everything Rendered Into The Module Body.
+
+    The module name is not part of the fingerprint:
+    modules with identical fingerprint render to identical logic, even if their module names differ.
+    """
+    hash_ = sha256()
+    for item in _iter_fingerprint(mod, svoptions or DEFAULT_SVOPTIONS):
+        hash_.update(item.encode())
+        hash_.update(b"\0")
+    return hash_.hexdigest()
+
+
+def _iter_fingerprint(mod: u.BaseMod, svoptions: SvOptions) -> Iterator[str]:
+    yield repr(svoptions)
+    for level, ident in mod.namespace.leveliter():
+        yield f"{level}:{ident!r}"
+    for inst in mod.insts:
+        yield repr((inst.name, inst.libname, inst.modname, inst.virtual, inst.doc))
+        yield from (repr(ident) for ident in inst.namespace if isinstance(ident, u.Param))
+        yield from (repr(ident) for ident in inst.params + inst.consts)
+        yield from (repr(assign) for assign in mod.get_instcons(inst).iter())
+    for flipflop in mod.flipflops:
+        yield repr((flipflop.clk, flipflop.rst_an, flipflop.rst, flipflop.ena))
+        yield from (repr(assign) for assign in flipflop)
+    for mux in mod.muxes:
+        yield repr((mux.name, mux.doc))
+        yield from (repr(assign) for assign in mux.defaults())
+        for sel, conds in mux:
+            yield repr(sel)
+            for cond, assigns in conds.items():
+                yield repr(cond)
+                yield from (repr(assign) for assign in assigns)
+    yield from (repr(assign) for assign in mod.assigns.iter())
@@ -24,14 +24,20 @@
 
 """SystemVerilog Expression Resolver."""
 
-from collections.abc import Iterable, Iterator
-from typing import ClassVar, Literal, TypeAlias
+import re
+from collections.abc import Container, Iterable, Iterator
+from functools import lru_cache
+from sys import intern
+from typing import Any, ClassVar, Literal, TypeAlias
 
 import ucdp as u
 from aligntext import Align
 from matchor import matchs
 from ucdp.ifdef import Ifdefs
 
+from .svcache import get_datamodelcache
+from .svoptions import SvOptions
+
 DIRKEYWORDS = {
     u.IN: "input",
     u.OUT: "output",
@@ -55,6 +61,47 @@ def _is_const(ident: u.Ident) -> bool:
 
 
 LevelIter: TypeAlias = Iterator[tuple[int | None, u.Ident | u.Assign]]
+IntLiteral: TypeAlias = tuple[int, int | u.Expr, bool]
+
+
+class SvAlign(Align):
+    """
+    Align With Compact Row Storage.
+
+    `Align` copies every row into a fresh list of normalized cells.
+    The resolver already delivers rows as tuples of strings, which are stored as they are.
+
+    With `lean`, the cells are just joined by their separators without any padding.
+    """
+
+    def __init__(self, rtrim: bool = False, strip_empty_cols: bool = False, lean: bool = False):
+        super().__init__(rtrim=rtrim, strip_empty_cols=strip_empty_cols)
+        self.lean = lean
+
+    def add_row(self, *cols) -> None:
+        """Add a row with `cols`."""
+        if len(cols) == 1 and isinstance(cols[0], tuple):
+            cols = cols[0]
+        if None in cols:
+            cols = tuple("" if cell is None else cell for cell in cols)
+        self._rows.append((True, cols))
+        self._maxcols = max(self._maxcols, len(cols))
+
+    def _get(self) -> Iterator[str]:
+        if not self.lean:
+            yield from super()._get()
+            return
+        sepfirst, separators = self._get_separators()
+        collapse = self.strip_empty_cols
+        rtrim = self.rtrim
+        for rowalign, row in self._rows:
+            if rowalign:
+                line = sepfirst + "".join(
+                    [f"{cell}{sep}" for cell, sep in zip(row, separators, strict=False) if cell or not collapse]
+                )
+            else:
+                line = row
+            yield line.rstrip() if rtrim else line
 
 
 class SvExprResolver(u.ExprResolver):
@@ -76,7 +123,11 @@ class SvExprResolver(u.ExprResolver):
     """
 
     ff_dly: str = ""
+    structs: bool = False
+    lean: bool = False
+    coalesce_slices: bool = False
     _opremap: ClassVar[dict[str, str]] = {"//": "/"}
+    _structrefs: dict[str, str] | None = u.PrivateField(default=None)
 
     @staticmethod
     def _get_rail_value(value: int) -> str:
@@ -88,8 +139,7 @@ class SvExprResolver(u.ExprResolver):
 
     def _get_uint_value(self, value: int, width: int | u.Expr) -> str:
         if isinstance(width, int):
-            hexstr = f"{value:X}".zfill((width + 3) // 4)
-            return f"{width}'h{hexstr}"
+            return _get_hexfmt(width, False).format(value)
 
         # parameterized width
         width = self.resolve(width)
@@ -101,9 +151,7 @@ class SvExprResolver(u.ExprResolver):
     def _get_sint_value(self, value: int, width: int | u.Expr) -> str:
         if isinstance(width, int):
             wrap = 1 << width
-            value = (value + wrap) % wrap
-            hexstr = f"{value:X}".zfill((width + 3) // 4)
-            return f"{width}'sh{hexstr}"
+            return _get_hexfmt(width, True).format((value + wrap) % wrap)
 
         # parameterized width
         width = self.resolve(width)
@@ -133,6 +181,46 @@ class SvExprResolver(u.ExprResolver):
     def _resolve_log2expr(self, expr: u.Log2Expr) -> str:
         return f"$clog2({self.resolve(expr.expr)})"
 
+    def _resolve_concatexpr(self, expr: u.ConcatExpr) -> str:
+        if not self.coalesce_slices:
+            return super()._resolve_concatexpr(expr)
+        items = []
+        for item, slice_ in _coalesce_slices(expr.items):
+            if slice_ is None:
+                items.append(self._resolve(item))
+            else:
+                items.append(f"{self._resolve(item)}{self._resolve_slice(slice_, opt=True)}")
+        if len(items) == 1:
+            return items[0]
+        return f"{{{', '.join(items)}}}"
+
+    def _resolve_ident(self, ident: u.Ident) -> str:
+        if self.structs:
+            structref = self._get_structrefs().get(ident.name)
+            if structref is not None:
+                return structref
+        return super()._resolve_ident(ident)
+
+    def _get_structrefs(self) -> dict[str, str]:
+        """Struct Member References (`struct.member`) By Flattened Member Name."""
+        structrefs = self._structrefs
+        if structrefs is None:
+            # fill completely before publishing - concurrent readers must not see a partial map
+            structrefs = {}
+            if isinstance(self.namespace, u.Idents):
+                for _, ident in self.namespace.leveliter():
+                    if get_structdecl(ident.type_) is not None:
+                        for child, item in zip(_get_structchilds(ident), ident.type_.values(), strict=True):
+                            structrefs[child.name] = f"{ident.name}.{item.name}"
+            self._structrefs = structrefs
+        return structrefs
+
+    def get_refname(self, name: str) -> str:
+        """Return Reference To Identifier `name`, considering struct members."""
+        if self.structs:
+            return self._get_structrefs().get(name, name)
+        return name
+
     def get_paramdecls(self, idents: u.Idents, is_last: bool = True, indent: int = 0) -> Align:
         """Return `Align` With Parameter Declarations."""
         return self._get_paramdecls(idents.leveliter(filter_=_is_param), "parameter", ",", is_last, indent)
@@ -142,14 +230,18 @@ class SvExprResolver(u.ExprResolver):
         return self._get_paramdecls(idents.leveliter(filter_=_is_const), "localparam", ";", False, indent)
 
     def _get_paramdecls(self, leveliter: LevelIter, keyword: str, sep: str, is_last: bool, indent: int) -> Align:
-        align = Align(rtrim=True, strip_empty_cols=True)
+        align = SvAlign(rtrim=True, strip_empty_cols=True, lean=self.lean)
         pre = " " * indent
         align.set_separators(" ", first=pre)
-        for ident, svdecl, svsep in self._iter_idents(align, pre, leveliter, sep, is_last):
+        levelidents = tuple(leveliter)
+        svdefaults = self._get_int_values((ident.name, ident.type_, None) for _, ident in levelidents)
+        for ident, svdecl, svsep in self._iter_idents(align, pre, iter(levelidents), sep, is_last):
             name = ident.name
             svdims = self.get_dims(ident.type_)
-            svdefault = self.get_default(ident.type_)
-            svcomment = _get_comment(ident.doc.comment_or_title)
+            svdefault = svdefaults.get(name)
+            if svdefault is None:
+                svdefault = self.get_default(ident.type_)
+            svcomment = "" if self.lean else _get_comment(ident.doc.comment_or_title)
             svdefault = f"{svdefault}{svsep}"
             align.add_row((keyword, *svdecl, name, svdims, "=", svdefault, svcomment))
         return align
@@ -193,53 +285,64 @@ class SvExprResolver(u.ExprResolver):
         ports: bool = False,
         no_comments: bool = False,
     ) -> Align:
-        align = Align(rtrim=True, strip_empty_cols=True)
+        align = SvAlign(rtrim=True, strip_empty_cols=True, lean=self.lean)
         pre = " " * indent
         align.set_separators(" ", first=pre)
         wirenames = u.split(wirenames)
-        for ident, svdecl, svsep in self._iter_idents(align, pre, leveliter, sep, is_last, no_comments=no_comments):
+        for ident, svdecl, svsep in self._iter_idents(
+            align, pre, leveliter, sep, is_last, no_comments=no_comments, structs="all"
+        ):
             name = ident.name
+            if isinstance(ident.type_, u.BaseStructType):
+                _add_structdecl(align, pre, ident, svdecl, svsep, port=ports, lean=self.lean)
+                continue
             svdims = self.get_dims(ident.type_)
             if svdims:
-                svdims = f"{svdims}{svsep}"
+                svdims = intern(f"{svdims}{svsep}")
             else:
                 name = f"{name}{svsep}"
-            comments = [ident.doc.comment_or_title]
-            try:
-                clkrel = ident.clkrel
-                if clkrel:
-                    comments.insert(0, clkrel.info)
-            except AttributeError:
-                pass
-            svcomment = _get_comment(u.join_names(*comments, concat=" - "))
+            svcomment = "" if self.lean else _get_signalcomment(ident)
             if ports:
                 align.add_row((*_get_port_decl(ident, svdecl), name, svdims, svcomment))
             else:
                 align.add_row((*svdecl, name, svdims, svcomment))
         return align
 
-    def get_instparams(self, mod: u.BaseMod, is_last: bool = True, indent: int = 0) -> Align:
-        """Return `Align` With Parameter Declarations."""
-        align = Align(rtrim=True)
+    def get_instparams(
+        self, mod: u.BaseMod, is_last: bool = True, indent: int = 0, params: Iterable[u.Param] | None = None
+    ) -> Align:
+        """
+        Return `Align` With Parameter Declarations.
+
+        `params` are the parameters with value of `mod` (see `SvInst`). They are determined, if not given.
+        """
+        align = SvAlign(rtrim=True, lean=self.lean)
         pre = " " * indent
         align.set_separators("(", ")", "", first=pre)
-
-        def filter_(ident):
-            return isinstance(ident, u.Param) and ident.value is not None
-
-        leveliter: LevelIter = ((None, ident) for ident in mod.namespace.iter(filter_=filter_))
+        if params is None:
+            params = _get_instparams(mod)
+        leveliter: LevelIter = ((None, ident) for ident in params)
         for ident, _, svsep in self._iter_idents(align, pre, leveliter, ",", is_last):
             name = f".{ident.name}"
             expr = self.get_value(ident)
-            svcomment = _get_comment(ident.doc.comment_or_title, pre=" ")
+            svcomment = "" if self.lean else _get_comment(ident.doc.comment_or_title, pre=" ")
             align.add_row(name, expr, svsep, svcomment)
         return align
 
     def get_instcons(
-        self, instcons: u.Assigns, skips: u.Names | None = None, is_last: bool = True, indent: int = 0
+        self,
+        instcons: u.Assigns,
+        skips: u.Names | None = None,
+        is_last: bool = True,
+        indent: int = 0,
+        sources: dict[str, str] | None = None,
     ) -> Align:
-        """Return `Align` With Parameter Declarations."""
-        align = Align(rtrim=True)
+        """
+        Return `Align` With Parameter Declarations.
+
+        `sources` replace the resolved sources of the given ports.
+        """
+        align = SvAlign(rtrim=True, lean=self.lean)
         pre = " " * indent
         align.set_separators("(", ")", "", first=pre)
         skips = u.split(skips)
@@ -250,55 +353,137 @@ class SvExprResolver(u.ExprResolver):
         else:
             instconstiter = ((None, inst) for inst in instcons.iter())
 
-        for assign, _, svsep in self._iter_idents(align, pre, instconstiter, ",", is_last):
-            target = assign.target
-            comments = []
-            if target.suffix != target.direction.suffix:
-                comments.append(DIRCOMMENT[target.direction])
-            if isinstance(target.type_, u.RailType):
-                comments.append("RAIL")
+        memberassigns = {assign.name: assign for assign in instcons.iter()} if self.structs else {}
+        # partly connected output structs are connected member-wise
+        flatnames = {
+            assign.name
+            for assign in memberassigns.values()
+            if isinstance(assign.type_, u.BaseStructType) and self._is_partly_connected(assign.target, memberassigns)
+        }
+        instconsdecls = self._iter_idents(align, pre, instconstiter, ",", is_last, structs="all", flatnames=flatnames)
+        for assign, _, svsep in instconsdecls:
+            source, svcomment = self._get_instcon(assign, memberassigns)
+            if sources:
+                source = sources.get(assign.name, source)
+            align.add_row(f".{assign.name}", source, svsep, svcomment)
+        return align
 
-            source = assign.source
+    @staticmethod
+    def group_insts(insts: Iterable[u.BaseMod]) -> list[list[u.BaseMod]]:
+        """
+        Group Instances To Instance Arrays.
+
+        Instances of the same module with identical parameters, named `<base>0` to `<base>N-1`, form one group.
+        All other instances form a group on their own.
+        """
+        groups: list[list[u.BaseMod]] = []
+        groupmap: dict[tuple[str, type, str], list[u.BaseMod]] = {}
+        for inst in insts:
+            mat = _RE_INSTINDEX.fullmatch(inst.name)
+            if mat is None:
+                groups.append([inst])
+                continue
+            key = (mat.group(1), inst.__class__, inst.modname)
+            group = groupmap.get(key)
+            if group is None:
+                groupmap[key] = group = []
+                groups.append(group)
+            group.append(inst)
+
+        result: list[list[u.BaseMod]] = []
+        for group in groups:
+            if len(group) > 1 and _is_instarray(group):
+                result.append(group)
+            else:
+                result.extend([inst] for inst in group)
+        return result
+
+    def get_instloop_sources(self, instcons: Iterable[u.Assigns], genvar: str) -> dict[str, str] | None:
+        """
+        Return Sources Of Instance Array Connections Depending On `genvar`.
+
+        Connections which are identical for all instances are omitted.
+        `None` is returned, if any connection cannot be expressed by `genvar`.
+        """
+        instassigns = [tuple(instcons_.iter()) for instcons_ in instcons]
+        sources: dict[str, str] = {}
+        for assigns in zip(*instassigns, strict=True):
+            name = assigns[0].name
+            values = [assign.source for assign in assigns]
+            if any(assign.name != name for assign in assigns):
+                return None
+            # expressions overload `==`, so compare their representation
+            reprs = [repr(value) for value in values]
+            if all(valuerepr == reprs[0] for valuerepr in reprs[1:]):
+                continue
+            source = self._get_loop_source(values, genvar)
             if source is None:
-                source = u.TODO
-
-            if isinstance(source, u.Default):
-                comments.append(source.note)
-                if target.direction == u.IN:
-                    source = self.get_default(target.type_)
-                else:
-                    source = ""
-            elif isinstance(source, u.Note):
-                source = f"/* {source.note} */"
+                return None
+            sources[name] = source
+        return sources
+
+    def _get_loop_source(self, values: list[Any], genvar: str) -> str | None:
+        """Express Slices Of The Same Identifier With Linear Increasing Offset By `genvar`."""
+        loopslice = _get_loopslice(values)
+        if loopslice is None:
+            return None
+        ident, offset, step, width = loopslice
+        index = genvar if step == 1 else f"{step}*{genvar}"
+        if offset:
+            index = f"{offset} + {index}"
+        name = self._resolve(ident)
+        if width == 1:
+            return f"{name}[{index}]"
+        return f"{name}[{index} +: {width}]"
+
+    def _get_instcon(self, assign: u.Assign, memberassigns: dict[str, u.Assign]) -> tuple[str, str]:
+        """Return Source And Comment Of Instance Connection."""
+        target = assign.target
+        source = assign.source
+        if source is None and memberassigns and isinstance(target.type_, u.BaseStructType):
+            source = self._get_struct_source(target, memberassigns)
+        if source is None:
+            source = u.TODO
+
+        note = None
+        if isinstance(source, u.Default):
+            note = source.note
+            if target.direction == u.IN:
+                source = self.get_default(target.type_)
             else:
-                source = self.resolve(source)
-            if target.clkrel:
-                comments.append(target.clkrel.info)
-            comments.append(target.doc.comment_or_title)
-            svcomment = _get_comment(u.join_names(*comments, concat=" - "), pre=" ")
-            align.add_row(f".{assign.name}", source, svsep, svcomment)
-        return align
+                source = ""
+        elif isinstance(source, u.Note):
+            source = f"/* {source.note} */"
+        elif not isinstance(source, str):
+            source = self.resolve(source)
+        if self.lean:
+            return source, ""
+        return source, _get_instconcomment(target, note)
 
     def get_defaults(self, assigns: Iterable[u.Assign], indent: int = 0, oper: str = "=") -> Align:
         """Get Assigns."""
-        align = Align(rtrim=True, strip_empty_cols=True)
+        align = SvAlign(rtrim=True, strip_empty_cols=True, lean=self.lean)
         pre = " " * indent
         align.set_separators(" ", first=pre)
+        assigns = tuple(assigns)
+        svvalues = self._get_int_values((assign.name, assign.type_, None) for assign in assigns)
         levelassigns: LevelIter = ((0, assign) for assign in assigns)
         for ident, _, _ in self._iter_idents(align, pre, levelassigns):
-            svvalue = self.get_value(ident)
-            align.add_row((ident.name, f"{oper} {svvalue};"))
+            svvalue = svvalues.get(ident.name)
+            if svvalue is None:
+                svvalue = self.get_value(ident)
+            align.add_row((self.get_refname(ident.name), f"{oper} {svvalue};"))
         return align
 
     def get_assigns(self, assigns: u.Assigns, indent: int, oper: str = "") -> Align:  # noqa: C901
         """Get Systemverilog Continuous Assigns."""
-        align = Align(rtrim=True, strip_empty_cols=True)
+        align = SvAlign(rtrim=True, strip_empty_cols=True, lean=self.lean)
         pre = " " * indent
         align.set_separators(" ", first=pre)
         levelassigns: LevelIter = ((None, assign) for assign in assigns)
         if oper:
             for assign, _, _ in self._iter_idents(align, pre, levelassigns):
-                name = assign.target.name
+                name = self.get_refname(assign.target.name)
                 source = assign.source
                 if source is not None:
                     source = self.resolve(source)
@@ -310,8 +495,8 @@ class SvExprResolver(u.ExprResolver):
                 elif direction in (u.IN, u.BWD):
                     align.add_row((source, oper, f"{name};"))
         else:
-            for assign, _, _ in self._iter_idents(align, pre, levelassigns):
-                name = assign.target.name
+            for assign, _, _ in self._iter_idents(align, pre, levelassigns, structs="assigned"):
+                name = self.get_refname(assign.target.name)
                 source = assign.source
                 if source is not None:
                     source = self.resolve(source)
@@ -324,8 +509,15 @@ class SvExprResolver(u.ExprResolver):
                     align.add_row(("tran", f"u_tran_{name}", f"({name},", "", f"{source});"))
         return align
 
-    def get_decl(self, type_: u.BaseType) -> SvDecl | None:  # noqa: C901, PLR0911, PLR0912
+    def get_decl(self, type_: u.BaseType) -> SvDecl | None:
         """Get SV Declaration."""
+        svdecl = self._get_decl(type_)
+        if svdecl is None:
+            return None
+        keyword, dims = svdecl
+        return keyword, intern(dims)
+
+    def _get_decl(self, type_: u.BaseType) -> SvDecl | None:  # noqa: C901, PLR0911, PLR0912
         dims = []
         while isinstance(type_, u.ArrayType):
             if type_.packed:
@@ -377,16 +569,55 @@ class SvExprResolver(u.ExprResolver):
         while isinstance(type_, u.ArrayType) and not type_.packed:
             dims.append(self._resolve_slice(type_.slice_).replace(" ", ""))
             type_ = type_.itemtype
-        return "".join(dims)
+        return intern("".join(dims))
 
     def get_default(self, type_: u.BaseType) -> str:
         """Get SV Default."""
+        if isinstance(type_, u.BaseStructType) and get_structdecl(type_) is not None:
+            return f"{{{', '.join(self.get_default(item.type_) for item in type_.values())}}}"
         return self._resolve_value(type_)
 
     def get_value(self, ident: u.Ident) -> str:
         """Get SV Value."""
         return self._resolve_value(ident.type_, value=getattr(ident, "value", None))
 
+    def _get_int_values(self, items: Iterable[tuple[str, u.BaseType, Any]]) -> dict[str, str]:
+        """Values of all fixed-width integer `items` (name, type, value), formatted in one batch, by name."""
+        names: list[str] = []
+        literals: list[IntLiteral] = []
+        for name, type_, itemvalue in items:
+            if not isinstance(type_, (u.UintType, u.SintType)) or not isinstance(type_.width, int):
+                continue
+            value = type_.default if itemvalue is None else itemvalue
+            if isinstance(value, int):
+                names.append(name)
+                literals.append((value, type_.width, isinstance(type_, u.SintType)))
+        return dict(zip(names, self.get_int_literals(literals), strict=True))
+
+    def get_int_literals(self, literals: Iterable[IntLiteral]) -> list[str]:
+        """
+        Format Integer Literals.
+
+        Args:
+            literals: Tuples of value, width and signedness.
+
+        The format of every width is determined once and reused for all values.
+
+            >>> import ucdpsv as usv
+            >>> resolver = usv.SvExprResolver()
+            >>> resolver.get_int_literals([(5, 18, False), (-5, 18, True), (0, 18, False)])
+            ["18'h00005", "18'sh3FFFB", "18'h00000"]
+        """
+        svvalues = []
+        for value, width, signed in literals:
+            if not isinstance(width, int):
+                svvalues.append(self._get_sint_value(value, width) if signed else self._get_uint_value(value, width))
+            elif signed:
+                svvalues.append(_get_hexfmt(width, True).format(value & ((1 << width) - 1)))
+            else:
+                svvalues.append(_get_hexfmt(width, False).format(value))
+        return svvalues
+
     @staticmethod
     def _get_define(define: u.Define) -> str:
         return f"`{define.name[1:]}"
@@ -399,8 +630,15 @@ class SvExprResolver(u.ExprResolver):
         sep: str = ";",
         is_last: bool = False,
         no_comments: bool = False,
+        *,
+        structs: Literal["", "all", "assigned"] = "",
+        flatnames: Container[str] = (),
     ) -> Iterator[tuple[u.Ident, SvDecl, str]]:
-        decls = [(level, ident, self.get_decl(ident.type_)) for level, ident in leveliter]
+        no_comments = no_comments or self.lean
+        if structs and self.structs:
+            decls = self._get_structdecls(leveliter, assigned=structs == "assigned", flatnames=flatnames)
+        else:
+            decls = [(level, ident, self.get_decl(ident.type_)) for level, ident in leveliter]
         endmap = _get_endmap(decls) if is_last else set()
         pendlevel: int | None = None
         ifdefstack: list[str] = []
@@ -424,6 +662,56 @@ class SvExprResolver(u.ExprResolver):
                 pendlevel = _add_declcomment(align, level, ident, pendlevel, svdecl, pre)
         _add_ifdef(pre, align, ifdefstack)
 
+    def _get_structdecls(
+        self, leveliter: LevelIter, assigned: bool = False, flatnames: Container[str] = ()
+    ) -> list[tuple[int | None, u.Ident | u.Assign, SvDecl | None]]:
+        """
+        Declarations, with packed structs instead of their members.
+
+        With `assigned`, struct assignments without source are kept as member-wise assignments.
+        Structs named in `flatnames` are kept member-wise too.
+        """
+        decls: list[tuple[int | None, u.Ident | u.Assign, SvDecl | None]] = []
+        membernames: set[str] = set()
+        for level, ident in leveliter:
+            name = ident.name
+            if name in membernames:
+                continue
+            structdecl = get_structdecl(ident.type_)
+            if structdecl is not None and name not in flatnames and (not assigned or ident.source is not None):
+                target = ident.target if isinstance(ident, u.Assign) else ident
+                membernames.update(child.name for child in _get_structchilds(target))
+                decls.append((level, ident, (structdecl, "")))
+            else:
+                decls.append((level, ident, self.get_decl(ident.type_)))
+        return decls
+
+    def _get_struct_source(self, target: u.Ident, memberassigns: dict[str, u.Assign]) -> str | None:
+        """Packed Struct Connection From Member-Wise Connections."""
+        sources: list[str | None] = []
+        for child in _get_structchilds(target):
+            memberassign = memberassigns.get(child.name)
+            source = memberassign.source if memberassign is not None else None
+            if source is None or isinstance(source, u.Note):
+                sources.append(self.get_default(child.type_) if target.direction == u.IN else None)
+            else:
+                sources.append(self.resolve(source))
+        if any(source is None for source in sources):
+            return None
+        return f"{{{', '.join(sources)}}}"  # type: ignore[arg-type]
+
+    @staticmethod
+    def _is_partly_connected(target: u.Ident, memberassigns: dict[str, u.Assign]) -> bool:
+        """Output Struct With Connected And Unconnected Members."""
+        if target.direction == u.IN:
+            return False
+        connected = []
+        for child in _get_structchilds(target):
+            memberassign = memberassigns.get(child.name)
+            source = memberassign.source if memberassign is not None else None
+            connected.append(source is not None and not isinstance(source, u.Note))
+        return any(connected) and not all(connected)
+
     def get_ident_expr(self, type_: u.BaseScalarType, name: str, op: Literal[0, 1, "", "~"] | None) -> str | None:
         """Get Ident Expression."""
         if op is None:
@@ -440,26 +728,290 @@ class SvExprResolver(u.ExprResolver):
             width = self._resolve(width)
         return f"'{{{width}{{{itemvalue}}}}}"
 
+    @staticmethod
+    def group_flipflops(flipflops: Iterable[u.FlipFlop], merge: bool = False) -> list[list[u.FlipFlop]]:
+        """
+        Group Flip-Flops By Process.
+
+        Every flip-flop group gets its own process by default.
+        With `merge`, all flip-flops sharing clock and asynchronous reset are combined into one process.
+        """
+        if not merge:
+            return [[flipflop] for flipflop in flipflops]
+        groups: dict[tuple[str, str], list[u.FlipFlop]] = {}
+        for flipflop in flipflops:
+            groups.setdefault((flipflop.clk.name, flipflop.rst_an.name), []).append(flipflop)
+        return list(groups.values())
+
     def split_mux_conds(self, sel, conds):
-        """Split Multiplexer Conditions."""
-        cases, defaultcase = [], None
-        default = sel.type_.default
+        """
+        Split Multiplexer Conditions.
 
-        for cond, assigns in conds.items():
+        All conditions are encoded in one pass. Cases with identical assignments are merged into one case item,
+        as long as this cannot change the priority of the case items.
+        Assignments are returned as lists, to iterate just once over the mux targets.
+        """
+        default = sel.type_.default
+        is_default = self._get_is_default(sel.type_)
+        cases: list[tuple[list[str], list[u.Assign]]] = []
+        keys: list[tuple[tuple[str, str | None], ...]] = []
+        defaultcase = None
+        values: set[int] = set()
+        reorderable = True
+
+        for cond, condassigns in conds.items():
             condstr = self._resolve(cond)
-            is_range = isinstance(cond, u.RangeExpr)
+            assigns = list(condassigns)
+            if isinstance(cond, u.RangeExpr):
+                reorderable = False
+                if default in cond.range_:
+                    defaultcase = condstr, assigns
+                    continue
+            else:
+                try:
+                    value = int(cond)
+                except (ValueError, TypeError):
+                    value = None
+                if value is None or value in values:
+                    reorderable = False
+                else:
+                    values.add(value)
+                if is_default(cond, value):
+                    defaultcase = condstr, assigns
+                    continue
+            cases.append(([condstr], assigns))
+            keys.append(tuple((assign.name, self._get_mux_source(assign)) for assign in assigns))
+
+        return _merge_cases(cases, keys, reorderable), defaultcase
+
+    @staticmethod
+    def _get_is_default(type_: u.BaseScalarType):
+        default = type_.default
+        if isinstance(type_, u.BaseEnumType):
             try:
-                is_default = default in cond.range_ if is_range else default == sel.type_.encode(cond)
+                defaultvalue = type_.get_bykey(default).value
             except ValueError:
-                is_default = False
-            if is_default:
-                defaultcase = condstr, assigns
-            elif is_range:
-                cases.append((condstr, assigns))
-            else:
-                cases.append((condstr, assigns))
+                return lambda cond, value: False
+
+            def is_enum_default(cond, value) -> bool:
+                try:
+                    return bool(defaultvalue == cond)
+                except ValueError:
+                    return False
+
+            return is_enum_default
 
-        return cases, defaultcase
+        return lambda cond, value: value is not None and value == default
+
+    def _get_mux_source(self, assign: u.Assign) -> str | None:
+        if assign.source is None:
+            return None
+        return self._resolve(assign.source)
+
+
+def _get_instparams(inst: u.BaseMod) -> tuple[u.Param, ...]:
+    def filter_(ident):
+        return isinstance(ident, u.Param) and ident.value is not None
+
+    return tuple(inst.namespace.iter(filter_=filter_))
+
+
+@lru_cache
+def _get_hexfmt(width: int, signed: bool) -> str:
+    """Return Format String For Hexadecimal Literal With `width`."""
+    base = "sh" if signed else "h"
+    return f"{width}'{base}{{:0{(width + 3) // 4}X}}"
+
+
+def _merge_cases(cases, keys, reorderable: bool) -> list[tuple[str, list[u.Assign]]]:
+    """
+    Merge Cases With Identical Assignments.
+
+    Non-adjacent cases are just merged, if all conditions are distinct constants (`reorderable`).
+    """
+    merged: list[tuple[list[str], list[u.Assign]]] = []
+    positions: dict[tuple, int] = {}
+    for (condstrs, assigns), key in zip(cases, keys, strict=True):
+        position = positions.get(key)
+        if position is not None and (reorderable or position == len(merged) - 1):
+            merged[position][0].extend(condstrs)
+        else:
+            positions[key] = len(merged)
+            merged.append((condstrs, assigns))
+    return [(", ".join(condstrs), assigns) for condstrs, assigns in merged]
+
+
+@lru_cache
+def get_structdecl(type_: u.BaseType) -> str | None:
+    """
+    Packed Struct Declaration.
+
+    Just structs with forward members of fixed-width scalar types can be represented as packed struct.
+    Clocks and resets are never packed.
+    All other structs are flattened.
+
+        >>> import ucdp as u
+        >>> import ucdpsv as usv
+        >>> class PairType(u.AStructType):
+        ...     def _build(self) -> None:
+        ...         self._add("valid", u.BitType())
+        ...         self._add("data", u.UintType(8))
+        >>> usv.get_structdecl(PairType())
+        'struct packed {logic valid; logic [7:0] data;}'
+        >>> usv.get_structdecl(u.UintType(8))
+    """
+    if not isinstance(type_, u.BaseStructType):
+        return None
+    resolver = SvExprResolver()
+    members = [_get_packed_member(resolver, item) for item in type_.values()]
+    if not members or None in members:
+        return None
+    return intern(f"struct packed {{{' '.join(members)}}}")  # type: ignore[arg-type]
+
+
+def _get_packed_member(resolver: SvExprResolver, item: u.StructItem) -> str | None:
+    """Packed Struct Member Declaration, if `item` can be packed."""
+    type_ = item.type_
+    if item.orientation != u.FWD or item.ifdefs or isinstance(type_, (u.ClkType, u.RstAnType, u.RstType)):
+        return None
+    svdecl = resolver.get_decl(type_)
+    if svdecl is None or resolver.get_dims(type_):
+        return None
+    keyword, dims = svdecl
+    if keyword not in _PACKED_KEYWORDS or not _RE_FIXED_DIMS.fullmatch(dims):
+        return None
+    return f"{keyword} {dims} {item.name};" if dims else f"{keyword} {item.name};"
+
+
+_PACKED_KEYWORDS = frozenset(("logic", "bit", "logic signed", "bit signed"))
+_RE_FIXED_DIMS = re.compile(r"(\[\d+:\d+\])*")
+
+
+def _get_structchilds(ident: u.Ident) -> list[u.Ident]:
+    """Direct Members Of Struct Identifier `ident`."""
+    return [child for level, child in ident.leveliter() if level == 1]
+
+
+def _add_structdecl(
+    align: Align, pre: str, ident: u.Ident, svdecl: SvDecl, svsep: str, *, port: bool, lean: bool = False
+) -> None:
+    """Add Packed Struct Declaration - just as spacer, to keep the struct out of the alignment."""
+    svcomment = "" if lean else _get_comment(ident.doc.comment_or_title, pre=" ")
+    if port:
+        dirkeyword = DIRKEYWORDS[ident.direction]
+        svdecl0 = svdecl[0] if ident.direction == u.OUT else f"wire {svdecl[0]}"
+        align.add_spacer(f"{pre}{dirkeyword:<6} {svdecl0} {ident.name}{svsep}{svcomment}")
+    else:
+        align.add_spacer(f"{pre}{svdecl[0]} {ident.name}{svsep}{svcomment}")
+
+
+_RE_INSTINDEX = re.compile(r"(.*?)(0|[1-9][0-9]*)")
+
+
+def _is_instarray(insts: list[u.BaseMod]) -> bool:
+    """Instances Are Named `<base>0` to `<base>N-1` And Share Their Parameters."""
+    base = _RE_INSTINDEX.fullmatch(insts[0].name).group(1)  # type: ignore[union-attr]
+    if [inst.name for inst in insts] != [f"{base}{idx}" for idx in range(len(insts))]:
+        return False
+    params = [(param.name, param.value) for param in insts[0].params]
+    return all([(param.name, param.value) for param in inst.params] == params for inst in insts[1:])
+
+
+def _get_loopslice(values: list[Any]) -> tuple[u.Ident, int, int, int] | None:
+    """Identifier, Offset, Step and Width, if `values` are equally spaced slices of the same identifier."""
+    first = values[0]
+    if not isinstance(first, u.SliceOp) or not isinstance(first.one, u.Ident):
+        return None
+    width = first.slice_.width
+    identrepr = repr(first.one)
+    rights = []
+    for value in values:
+        if not isinstance(value, u.SliceOp) or repr(value.one) != identrepr:
+            return None
+        slice_ = value.slice_
+        if not isinstance(slice_.right, int) or slice_.width != width or slice_.left != slice_.right + width - 1:
+            return None
+        rights.append(slice_.right)
+    offset = rights[0]
+    step = rights[1] - offset
+    if not isinstance(width, int) or step <= 0 or rights != list(range(offset, offset + step * len(rights), step)):
+        return None
+    return first.one, offset, step, width
+
+
+def _get_signalcomment(ident: u.Ident) -> str:
+    """Return Systemverilog Comment For Port Or Signal."""
+    comments = [ident.doc.comment_or_title]
+    try:
+        clkrel = ident.clkrel
+        if clkrel:
+            comments.insert(0, clkrel.info)
+    except AttributeError:
+        pass
+    return _get_comment(u.join_names(*comments, concat=" - "))
+
+
+def _get_instconcomment(target: u.Ident, note: str | None) -> str:
+    """Return Systemverilog Comment For Instance Connection."""
+    comments = []
+    if target.suffix != target.direction.suffix:
+        comments.append(DIRCOMMENT[target.direction])
+    if isinstance(target.type_, u.RailType):
+        comments.append("RAIL")
+    if note:
+        comments.append(note)
+    if target.clkrel:
+        comments.append(target.clkrel.info)
+    comments.append(target.doc.comment_or_title)
+    return _get_comment(u.join_names(*comments, concat=" - "), pre=" ")
+
+
+def _coalesce_slices(items: Iterable[u.Expr]) -> list[tuple[u.Expr, u.Slice | None]]:
+    """
+    Merge Adjacent Descending Constant Slices Of The Same Identifier.
+
+    Returns the expression and the merged slice, which is `None` for untouched expressions
+    and for slices covering the entire identifier.
+    """
+    runs: list[list] = []
+    for item in items:
+        bounds = _get_slicebounds(item)
+        if bounds is None:
+            runs.append([item, None, None])
+            continue
+        ident, left, right = bounds
+        if runs and runs[-1][1] is not None and repr(runs[-1][0]) == repr(ident) and runs[-1][2] == left + 1:
+            runs[-1][2] = right
+        else:
+            runs.append([ident, left, right])
+
+    coalesced: list[tuple[u.Expr, u.Slice | None]] = []
+    for expr, left, right in runs:
+        if left is None or _is_fullwidth(expr, left, right):
+            coalesced.append((expr, None))
+        else:
+            coalesced.append((expr, u.Slice(left=left, right=right)))
+    return coalesced
+
+
+def _is_fullwidth(ident: u.Ident, left: int, right: int) -> bool:
+    # a parameterized width is not known at render time - its default must not decide
+    width = ident.type_.width
+    return isinstance(width, int) and right == 0 and left == width - 1
+
+
+def _get_slicebounds(item: u.Expr) -> tuple[u.Ident, int, int] | None:
+    """Identifier And Bounds Of A Descending Constant Slice Of A Vector."""
+    if isinstance(item, u.SliceOp) and isinstance(item.one, u.Ident):
+        ident, slice_ = item.one, item.slice_
+        if (
+            isinstance(ident.type_, (u.UintType, u.BitType))
+            and isinstance(slice_.left, int)
+            and isinstance(slice_.right, int)
+            and slice_.left >= slice_.right
+        ):
+            return ident, slice_.left, slice_.right
+    return None
 
 
 def _get_comment(comment, level=0, pre="") -> str:
@@ -467,7 +1019,8 @@ def _get_comment(comment, level=0, pre="") -> str:
     if comment:
         comment = comment.split("\n", maxsplit=1)[0]
         fill = "  " * level
-        return f"{pre}// {fill}{comment}"
+        # identical cells repeat across thousands of rows - share one string object per render
+        return intern(f"{pre}// {fill}{comment}")
     return ""
 
 
@@ -536,12 +1089,69 @@ def _add_declcomment(align: Align, level: int | None, ident: u.Ident | u.Assign,
 
 def _get_port_decl(ident: u.Ident, svdecl: SvDecl) -> tuple[str, str, str]:
     dirkeyword = DIRKEYWORDS[ident.direction]
-    svdecl0 = svdecl[0].replace("logic", "wire") if ident.direction != u.OUT else svdecl[0]
+    svdecl0 = intern(svdecl[0].replace("logic", "wire")) if ident.direction != u.OUT else svdecl[0]
     return dirkeyword, svdecl0, svdecl[1]
 
 
-def get_resolver(mod: u.BaseMod, inst: u.BaseMod | None = None) -> SvExprResolver:
+def get_resolver(mod: u.BaseMod, inst: u.BaseMod | None = None, svoptions: SvOptions | None = None) -> SvExprResolver:
     """Get SvExprResolver for `mod`."""
+    svoptions = svoptions or SvOptions()
+    kwargs = {
+        "structs": svoptions.structs,
+        "lean": svoptions.lean,
+        "coalesce_slices": svoptions.coalesce_slices,
+    }
     if inst is not None:
-        return SvExprResolver(namespace=mod.namespace, remap=inst.params + inst.consts)
-    return SvExprResolver(namespace=mod.namespace)
+        return SvExprResolver(namespace=mod.namespace, remap=inst.params + inst.consts, **kwargs)
+    return SvExprResolver(namespace=mod.namespace, **kwargs)
+
+
+class SvInst(u.Object):
+    """
+    Instance Information, Shared By All Instance Related Template Functions.
+
+    Attributes:
+        inst: Instance.
+        instcons: Instance Connections.
+        params: Parameters with value.
+        resolver: Resolver with remapped parameters and constants of the instance.
+    """
+
+    inst: u.BaseMod
+    instcons: u.Assigns
+    params: tuple[u.Param, ...]
+    resolver: SvExprResolver
+
+
+def get_svinsts(mod: u.BaseMod, svoptions: SvOptions | None = None, datamodel: Any = None) -> dict[str, SvInst]:
+    """
+    Return Information Of All Instances Of `mod` By Instance Name.
+
+    The table is built once per module and options within `datamodel`.
+    """
+    cache = get_datamodelcache(datamodel, "svinsts")
+    key = (id(mod), svoptions)
+    svinsts = cache.get(key)
+    if svinsts is None:
+        svinsts = {
+            inst.name: SvInst(
+                inst=inst,
+                instcons=mod.get_instcons(inst),
+                params=_get_instparams(inst),
+                resolver=get_resolver(mod, inst=inst, svoptions=svoptions),
+            )
+            for inst in mod.insts
+        }
+        svinsts = cache.setdefault(key, svinsts)
+    return svinsts
+
+
+def get_svinst(
+    mod: u.BaseMod, inst: u.BaseMod | str, svoptions: SvOptions | None = None, datamodel: Any = None
+) -> SvInst:
+    """Return Information Of Instance `inst` of `mod` (see `get_svinsts`)."""
+    name = inst if isinstance(inst, str) else inst.name
+    try:
+        return get_svinsts(mod, svoptions=svoptions, datamodel=datamodel)[name]
+    except KeyError:
+        raise ValueError(f"{inst} is not a sub-module of {mod}") from None
@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+File Header Information.
+
+Copyright notice, data model file and update reference are facts of the module class.
+`sv.mako` determines them once per class and generation and stores them within the datamodel:
+
+    >>> import ucdp as u
+    >>> import ucdpsv as usv
+    >>> from makolator import Datamodel
+    >>> class ExampleMod(u.AMod):
+    ...     def _build(self):
+    ...         pass
+    >>> datamodel = Datamodel()
+    >>> fileheader = usv.get_fileheader(ExampleMod(), datamodel=datamodel)
+    >>> fileheader is usv.get_fileheader(ExampleMod(), datamodel=datamodel)
+    True
+"""
+
+from pathlib import Path
+from typing import Any
+
+import ucdp as u
+
+from .svcache import get_datamodelcache
+
+
+class SvFileHeader(u.Object):
+    """
+    File Header Information.
+
+    Attributes:
+        copyright: Copyright notice from the source code of the module class.
+        filepath: Source code of the module class, relative to the output directory.
+        topmodref: Reference to update the module, if it can be generated standalone.
+    """
+
+    copyright: str
+    filepath: Path
+    topmodref: u.TopModRef | None
+
+
+def get_copyright(obj: Any, datamodel: Any = None) -> str:
+    """
+    Return Copyright Notice From Source Code Of `obj`.
+
+    Like `u.get_copyright`, but determined once per class within `datamodel`.
+    """
+    cache = get_datamodelcache(datamodel, "svfileheaders")
+    key = obj if isinstance(obj, Path) else obj.__class__
+    copyright_ = cache.get(key)
+    if copyright_ is None:
+        copyright_ = cache.setdefault(key, u.get_copyright(obj))
+    return copyright_
+
+
+def get_fileheader(mod: u.BaseMod, basedir: Path | None = None, datamodel: Any = None) -> SvFileHeader:
+    """
+    Return File Header Information Of `mod`.
+
+    Args:
+        mod: Module.
+
+    Keyword Args:
+        basedir: Output Directory.
+        datamodel: Datamodel of the generation. Information is determined once per class within `datamodel`.
+    """
+    cache = get_datamodelcache(datamodel, "svfileheaders")
+    modcls = mod.__class__
+    key = (modcls, mod.libname, mod.modname, basedir)
+    fileheader = cache.get(key)
+    if fileheader is None:
+        clskey = (modcls, basedir)
+        filepath = cache.get(clskey)
+        if filepath is None:
+            filepath = cache.setdefault(clskey, u.modutil.get_file(modcls, basedir=basedir))
+        fileheader = SvFileHeader(
+            copyright=get_copyright(mod, datamodel=datamodel),
+            filepath=filepath,
+            topmodref=u.TopModRef.from_mod(mod),
+        )
+        fileheader = cache.setdefault(key, fileheader)
+    return fileheader
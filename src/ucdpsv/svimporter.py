@@ -26,13 +26,23 @@
 
 # ruff: noqa: PLW2901
 
+import json
 import re
+from functools import cache, lru_cache, wraps
+from hashlib import sha256
+from importlib import metadata
 from pathlib import Path
+from threading import Lock, RLock
 from typing import Any, TypeAlias
 
 import hdl_parser as hdl
 import ucdp as u
 from matchor import match
+from ucdp.modref import get_modclsname
+
+from .svbackend import DEFAULT_BACKEND, SvBackend
+from .svlibindex import SvLibIndex, scan_svfile
+from .svpackage import SvPackage
 
 Attrs: TypeAlias = dict[str, Any]
 AttrsDict: TypeAlias = dict[str, Attrs]
@@ -41,6 +51,9 @@ Item: TypeAlias = hdl.Param | hdl.Port
 
 _RE_WIDTH = re.compile(r"\[([^\:]+)\s*\:\s*([^\]+])\](.*)")
 _RE_MINUS1 = re.compile(r"(.+?)(-\s*1)")
+_RE_PKGREF = re.compile(r"(?<!['\w$])(?:([A-Za-z_]\w*)\s*::\s*)?([A-Za-z_]\w*)")
+_RE_HEADERIMPORTS = re.compile(rb"\w+\s+(?:(?:static|automatic)\s+)?[\w$]+((?:\s*import\s[^;]*;)*)")
+_RE_PKGIMPORT = re.compile(rb"([A-Za-z_]\w*)\s*::\s*\*")
 DIRMAP = {"input": u.IN, "output": u.OUT, "inout": u.INOUT}
 
 
@@ -51,9 +64,14 @@ def import_params_ports(
     paramattrs: AttrsDict | AttrsList | None = None,
     constattrs: AttrsDict | AttrsList | None = None,
     portattrs: AttrsDict | AttrsList | None = None,
+    *,
+    libindex: SvLibIndex | None = None,
+    svpackages: tuple[SvPackage, ...] = (),
+    backend: SvBackend = DEFAULT_BACKEND,
+    lazy: bool = False,
 ) -> None:
     """Import Parameter and Ports."""
-    importer = SvImporter()
+    importer = SvImporter(libindex=libindex, svpackages=svpackages, backend=backend, lazy=lazy)
     if paramattrs:
         importer.add_paramattrs(paramattrs)
     if constattrs:
@@ -64,11 +82,26 @@ def import_params_ports(
 
 
 class SvImporter(u.Object):
-    """Importer."""
+    """
+    Importer.
+
+    Attributes:
+        libindex: Library Index to locate modules.
+        svpackages: Packages referenced by the module headers.
+        backend: Parser Backend.
+        lazy: Import ports on first access of `mod.ports`, `mod.portssignals` or `mod.namespace`.
+            Ports with `route` or `clkrel` attributes are imported immediately.
+    """
 
     paramattrs: AttrsList = u.Field(default_factory=list)
     constattrs: AttrsList = u.Field(default_factory=list)
     portattrs: AttrsList = u.Field(default_factory=list)
+    libindex: SvLibIndex | None = None
+    svpackages: tuple[SvPackage, ...] = ()
+    backend: SvBackend = DEFAULT_BACKEND
+    lazy: bool = False
+
+    _pkgimports: dict[str, frozenset[str]] = u.PrivateField(default_factory=dict)
 
     def add_paramattrs(self, paramattrs: AttrsDict | AttrsList) -> None:
         """Add Parameter Attributes."""
@@ -116,14 +149,28 @@ class SvImporter(u.Object):
             mod: Module which will receive parameters, constant and ports.
 
         Keyword Args:
-            filelistname: Name of filelist which will be looked up in `mod.filelists`.
+            filelistname: Name of filelist which will be looked up in `mod.filelists`,
+                if there is no explicit `filepath` and `mod.modname` is not within `libindex`.
             filepath: Explicit File Path.
             no_params: Skip Import of Parameter
             no_consts: Skip Import of Constants
             no_ports: Skip Import of Ports
         """
-        filepath = filepath or self._find_filepath(mod, filelistname)
-        file = hdl.parse_file(filepath)
+        libindex = self.libindex
+        use_libindex = filepath is None and libindex is not None and mod.modname in libindex
+        if use_libindex:
+            filepath = libindex[mod.modname].filepath
+        else:
+            filepath = filepath or self._find_filepath(mod, filelistname)
+        filehash = get_filehash(filepath)
+        self._add_pkgimports(mod, filepath, filehash)
+        _record_svimport(
+            SvImport(modcls=mod.__class__, filelistname=filelistname, filepath=filepath, filehash=filehash)
+        )
+        if use_libindex:
+            file = libindex.parse(mod.modname, backend=self.backend)
+        else:
+            file = _parse_file(filepath, filehash, self.backend)
         for module in file.modules:
             if module.name == mod.modname:
                 if not no_params:
@@ -131,7 +178,10 @@ class SvImporter(u.Object):
                 if not no_consts:
                     self._import_params(mod, self.constattrs, module.localparams, mod.add_const)
                 if not no_ports:
-                    self._import_ports(mod, module.ports)
+                    if self.lazy and not self._has_eager_portattrs():
+                        _LazyPorts(self, mod, module.ports).install()
+                    else:
+                        self._import_ports(mod, module.ports)
                 break
         else:
             raise ValueError(f"{filepath} does not contain module {mod.modname}")
@@ -154,7 +204,7 @@ class SvImporter(u.Object):
     def _get_param_type(self, mod: u.BaseMod, param: hdl.Param) -> u.BaseType:
         type_ = self._get_type(mod, param)
         if param.default:
-            parsed_default = SvImporter._parse(mod, param.default)
+            parsed_default = self._parse(mod, param.default)
             if type_:
                 try:
                     type_ = type_.new(default=parsed_default)
@@ -171,7 +221,8 @@ class SvImporter(u.Object):
     def _get_param_defaulttype(self, **kwargs) -> u.BaseType:
         return u.IntegerType(**kwargs)
 
-    def _import_ports(self, mod: u.BaseMod, ports: tuple[hdl.Port, ...]) -> None:
+    def _import_ports(self, mod: u.BaseMod, ports: tuple[hdl.Port, ...], add_func=None) -> None:
+        add_func = add_func or mod.add_port
         portdict = self._by_name(mod, ports)
         while portdict:
             port = portdict.get(next(iter(portdict.keys())))  # first element
@@ -185,7 +236,11 @@ class SvImporter(u.Object):
             # create
             if port.ifdefs:
                 attrs.setdefault("ifdefs", port.ifdefs)
-            mod.add_port(type_, name, direction=direction, **attrs)
+            add_func(type_, name, direction=direction, **attrs)
+
+    def _has_eager_portattrs(self) -> bool:
+        # routes and clock relations refer to the module build
+        return any(key in attrs for _, attrs in self.portattrs for key in _EAGER_PORTATTRS)
 
     def _get_port_defaulttype(self) -> u.BaseType:
         return u.BitType()
@@ -323,8 +378,7 @@ class SvImporter(u.Object):
         attrs.pop("type_")
         return type_, name, attrs
 
-    @staticmethod
-    def _get_type(mod: u.BaseMod, item: Item) -> u.BaseMod | None:
+    def _get_type(self, mod: u.BaseMod, item: Item) -> u.BaseMod | None:
         ptype = item.ptype
         dtype = getattr(item, "dtype", "").split(" ")
         dim = item.dim
@@ -336,64 +390,512 @@ class SvImporter(u.Object):
         if not ptype and not dim and not dim_unpacked:
             return type_
 
-        if item.ptype == "integer":
-            type_ = u.IntegerType()
+        if item.ptype in ("integer", "int"):
+            type_ = _INTEGERTYPE
         elif dim:
-            width, left, right, sdir, dim = SvImporter._resolve_dim(mod, dim)
+            width, left, right, sdir, dim = self._resolve_dim(mod, dim)
             # if sdir != u.DOWN:
             #     raise ValueError(f"{mod}: {dim} is not DOWNTO")
-            if "signed" in dtype:
-                type_ = u.SintType(width=width, right=right)
-            else:
-                type_ = u.UintType(width=width, right=right)
+            type_ = _get_vectortype("signed" in dtype, width, right)
         else:
-            type_ = u.BitType()
+            type_ = _BITTYPE
 
         while dim:
-            width, left, right, sdir, dim = SvImporter._resolve_dim(mod, dim)
-            type_ = u.ArrayType(type_, width, left=left, right=right, direction=sdir, packed=True)
+            width, left, right, sdir, dim = self._resolve_dim(mod, dim)
+            type_ = _get_arraytype(type_, width, left=left, right=right, direction=sdir, packed=True)
 
         while dim_unpacked:
-            width, left, right, sdir, dim_unpacked = SvImporter._resolve_dim(mod, dim_unpacked)
-            type_ = u.ArrayType(type_, width, left=left, right=right, direction=sdir, packed=False)
+            width, left, right, sdir, dim_unpacked = self._resolve_dim(mod, dim_unpacked)
+            type_ = _get_arraytype(type_, width, left=left, right=right, direction=sdir, packed=False)
 
         return type_
 
-    @staticmethod
-    def _resolve_dim(mod: u.BaseMod, dim: str) -> tuple[int | u.Expr, int | u.Expr, u.SliceDirection, str]:
-        m = _RE_WIDTH.match(dim)
+    def _resolve_dim(self, mod: u.BaseMod, dim: str) -> tuple[int | u.Expr, int | u.Expr, u.SliceDirection, str]:
+        m = _RE_WIDTH.match(self._resolve_pkgrefs(mod, dim))
         if not m:
             raise ValueError(f"Unknown dimension {dim}")
         left, right, rem = m.groups()
-        rexpr = SvImporter._parse(mod, right)
-        lexpr = SvImporter._parse(mod, left)
+        rexpr = self._parse(mod, right)
+        lexpr = self._parse(mod, left)
         # determine width
         if lexpr >= rexpr:
-            wexpr = SvImporter._plus1(mod, left, lexpr)
+            wexpr = self._plus1(mod, left, lexpr)
             if rexpr:
                 wexpr -= rexpr
             sdir = u.DOWN
         else:
-            wexpr = SvImporter._plus1(mod, right, rexpr)
+            wexpr = self._plus1(mod, right, rexpr)
             if lexpr:
                 wexpr -= lexpr
             sdir = u.UP
         return wexpr, lexpr, rexpr, sdir, rem
 
-    @staticmethod
-    def _parse(mod: u.BaseMod, value: str) -> int | u.Expr:
+    def _parse(self, mod: u.BaseMod, value: str) -> int | u.Expr:
+        value = self._resolve_pkgrefs(mod, value)
         try:
             return int(value)
         except ValueError:
             return mod.parser(value)
 
-    @staticmethod
-    def _plus1(mod: u.BaseMod, value: str, expr: int | u.Expr) -> int | u.Expr:
+    def _add_pkgimports(self, mod: u.BaseMod, filepath: Path, filehash: str) -> None:
+        if self.svpackages:
+            self._pkgimports[mod.modname] = _get_pkgimports(filepath, filehash, mod.modname)
+
+    def _resolve_pkgrefs(self, mod: u.BaseMod, value: str) -> str:
+        """
+        Replace References To Package Constants By Their Value.
+
+        Unqualified names are just looked up in the packages imported via `import pkg::*`.
+        """
+        svpackages = self.svpackages
+        if not svpackages:
+            return value
+
+        def sub(mat: re.Match) -> str:
+            pkgname, name = mat.groups()
+            if pkgname:
+                candidates = [svpackage for svpackage in svpackages if svpackage.name == pkgname]
+            elif name in mod.namespace:
+                # module parameters hide wildcard imports
+                return mat.group(0)
+            else:
+                pkgimports = self._pkgimports.get(mod.modname, frozenset())
+                candidates = [svpackage for svpackage in svpackages if svpackage.name in pkgimports]
+            for svpackage in candidates:
+                pkgvalue = svpackage.get_value(name)
+                if pkgvalue is not None:
+                    return str(pkgvalue) if pkgvalue >= 0 else f"({pkgvalue})"
+            return mat.group(0)
+
+        return _RE_PKGREF.sub(sub, value)
+
+    def _plus1(self, mod: u.BaseMod, value: str, expr: int | u.Expr) -> int | u.Expr:
         m = _RE_MINUS1.fullmatch(value)
         if m:
-            return SvImporter._parse(mod, m.group(1))
+            return self._parse(mod, m.group(1))
         return expr + 1
 
 
+_EAGER_PORTATTRS = ("route", "clkrel")
+_INTEGERTYPE = u.IntegerType()
+_BITTYPE = u.BitType()
+
+
+def _get_vectortype(signed: bool, width: int | u.Expr, right: int | u.Expr) -> u.UintType | u.SintType:
+    """Return Shared Instance For Constant Dimensions - Types Are Immutable."""
+    if isinstance(width, int) and isinstance(right, int):
+        return _get_const_vectortype(signed, width, right)
+    if signed:
+        return u.SintType(width=width, right=right)
+    return u.UintType(width=width, right=right)
+
+
+@cache
+def _get_const_vectortype(signed: bool, width: int, right: int) -> u.UintType | u.SintType:
+    if signed:
+        return u.SintType(width=width, right=right)
+    return u.UintType(width=width, right=right)
+
+
+def _get_arraytype(
+    itemtype: u.BaseType,
+    width: int | u.Expr,
+    *,
+    left: int | u.Expr,
+    right: int | u.Expr,
+    direction: u.SliceDirection,
+    packed: bool,
+) -> u.ArrayType:
+    """Return Shared Instance For Constant Dimensions And Shared Item Types - Types Are Immutable."""
+    if all(isinstance(value, int) for value in (width, left, right)) and _is_shared(itemtype):
+        return _get_const_arraytype(itemtype, width, left=left, right=right, direction=direction, packed=packed)
+    return u.ArrayType(itemtype, width, left=left, right=right, direction=direction, packed=packed)
+
+
+@cache
+def _get_const_arraytype(
+    itemtype: u.BaseType, width: int, *, left: int, right: int, direction: u.SliceDirection, packed: bool
+) -> u.ArrayType:
+    arraytype = u.ArrayType(itemtype, width, left=left, right=right, direction=direction, packed=packed)
+    _SHARED_ARRAYTYPES.add(id(arraytype))
+    return arraytype
+
+
+# ids of cached array types. Cached types are never released, so the ids stay unique.
+_SHARED_ARRAYTYPES: set[int] = set()
+
+
+def _is_shared(type_: u.BaseType) -> bool:
+    # Just shared types are used as key, as expressions within other types do not compare by value.
+    if type_ is _INTEGERTYPE or type_ is _BITTYPE:
+        return True
+    if isinstance(type_, u.ArrayType):
+        return id(type_) in _SHARED_ARRAYTYPES
+    return isinstance(type_.width, int) and isinstance(type_.right, int)
+
+
+class _LazyPorts:
+    """
+    Ports Of `mod`, Which Are Imported On First Access.
+
+    `mod.namespace`, `mod.portssignals` and `mod.ports` become `_LazyIdents` until then.
+    Accesses from other threads wait for the import. A failed import is repeated and fails on every access.
+
+    ucdp has no hook for this: `install` and `_add_locked` depend on `u.Idents` being a `dict`.
+    """
+
+    def __init__(self, importer: SvImporter, mod: u.BaseMod, ports: tuple[hdl.Port, ...]):
+        self.importer = importer
+        self.mod = mod
+        self.ports = ports
+        self.idents = (mod.namespace, mod.portssignals, mod.ports)
+        self.is_imported = False
+        self.is_importing = False
+        self.names: list[str] = []
+        self.lock = RLock()
+
+    def install(self) -> None:
+        # depends on ucdp internals
+        for idents in self.idents:
+            idents.__class__ = _LazyIdents
+            idents.lazyports = self
+
+    def import_ports(self) -> None:
+        with self.lock:
+            if self.is_imported or self.is_importing:
+                # already done or in progress by this thread
+                return
+            self.is_importing = True
+            try:
+                self.importer._import_ports(self.mod, self.ports, add_func=self._add_port)
+            except BaseException:
+                for idents in self.idents:
+                    for name in self.names:
+                        dict.pop(idents, name, None)
+                self.names.clear()
+                raise
+            finally:
+                self.is_importing = False
+            self.is_imported = True
+            # `lazyports` stays, as other threads might be within a `_LazyIdents` method already
+            for idents in self.idents:
+                idents.__class__ = u.Idents
+
+    def _add_port(
+        self,
+        type_: u.BaseType,
+        name: str,
+        direction: u.Direction,
+        *,
+        title: str | None = None,
+        descr: str | None = None,
+        comment: str | None = None,
+        ifdefs: u.Ifdefs | str | None = None,
+    ) -> None:
+        mod = self.mod
+        if not any(idents.is_locked for idents in self.idents):
+            port = mod.add_port(type_, name, direction, title=title, descr=descr, comment=comment, ifdefs=ifdefs)
+            if port is not None:
+                self.names.append(name)
+            return
+        self._add_locked(type_, name, direction, title=title, descr=descr, comment=comment, ifdefs=ifdefs)
+
+    def _add_locked(
+        self,
+        type_: u.BaseType,
+        name: str,
+        direction: u.Direction,
+        *,
+        title: str | None = None,
+        descr: str | None = None,
+        comment: str | None = None,
+        ifdefs: u.Ifdefs | str | None = None,
+    ) -> None:
+        # like `mod.add_port`, as the ports belong to the module since its build - depends on ucdp internals
+        mod = self.mod
+        rifdefs = u.resolve_ifdefs(mod.defines, u.cast_ifdefs(ifdefs))
+        if rifdefs is None:
+            return
+        doc = u.doc_from_type(type_, title, descr, comment)
+        port = u.Port(type_, name, direction=direction, doc=doc, ifdefs=rifdefs)
+        for idents in self.idents:
+            if name in dict.keys(idents):
+                raise u.DuplicateError(f"Name {name!r} already taken by {dict.__getitem__(idents, name)!r}")
+        for idents in self.idents:
+            dict.__setitem__(idents, name, port)
+        self.names.append(name)
+
+
+def _import_ports_first(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self.lazyports.import_ports()
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _LazyIdents(u.Idents):
+    """Identifiers With Ports Pending For Import. Any Access Imports Them, Except Locking."""
+
+    lazyports: _LazyPorts
+
+    __getitem__ = _import_ports_first(u.Idents.__getitem__)
+    __contains__ = _import_ports_first(u.Idents.__contains__)
+    __iter__ = _import_ports_first(u.Idents.__iter__)
+    __len__ = _import_ports_first(u.Idents.__len__)
+    __eq__ = _import_ports_first(u.Idents.__eq__)
+    __hash__ = None
+    keys = _import_ports_first(u.Idents.keys)
+    values = _import_ports_first(u.Idents.values)
+    items = _import_ports_first(u.Idents.items)
+    get = _import_ports_first(u.Idents.get)
+    set_default = _import_ports_first(u.Idents.set_default)
+    _set_items = _import_ports_first(u.Idents._set_items)
+
+
+class SvModFactory(u.Object):
+    """
+    Module Classes For All Modules Of SystemVerilog Files Or A Library Index.
+
+    Leaf cells like standard-cell wrappers or memory macros do not need a hand-written module class:
+
+        >>> import ucdpsv as usv
+        >>> from pathlib import Path
+        >>> factory = usv.SvModFactory(pymodname=__name__, filepaths=(Path("tests/testdata/sv/top1.sv"),))
+        >>> factory.modnames
+        ('top1', 'top2', 'top3', 'top4', 'top0')
+        >>> factory["top2"]
+        <class '...Top2Mod'>
+
+    Classes are created on first access and parameters and ports are imported on instantiation.
+    Within the python module `pymodname`, classes are accessible like hand-written ones via:
+
+        >>> def __getattr__(name):
+        ...     return factory.get_modcls_by_clsname(name)
+
+    Attributes:
+        pymodname: Python Module, which owns the classes. Library name and module files are derived from it.
+        libindex: Library Index. Modules are located via index.
+        filepaths: Files. Used if there is no `libindex`.
+        filelistname: Name of the filelist, which contains the SystemVerilog file.
+        svpackages: Packages referenced by the module headers.
+        backend: Parser Backend.
+        lazy: Import ports on first access (see `SvImporter`).
+    """
+
+    pymodname: str
+    libindex: SvLibIndex | None = None
+    filepaths: tuple[Path, ...] = ()
+    filelistname: str = "hdl"
+    svpackages: tuple[SvPackage, ...] = ()
+    backend: SvBackend = DEFAULT_BACKEND
+    lazy: bool = False
+
+    _locations: dict[str, Path] | None = u.PrivateField(default=None)
+    _clsnames: dict[str, str] | None = u.PrivateField(default=None)
+    _modclss: dict[str, type[u.AMod]] = u.PrivateField(default_factory=dict)
+    _lock: Lock = u.PrivateField(default_factory=Lock)
+
+    @property
+    def modnames(self) -> tuple[str, ...]:
+        """Names of All Modules."""
+        return tuple(self._get_locations())
+
+    def __contains__(self, modname: str) -> bool:
+        return modname in self._get_locations()
+
+    def __getitem__(self, modname: str) -> type[u.AMod]:
+        with self._lock:
+            modcls = self._modclss.get(modname)
+            if modcls is None:
+                filepath = self._get_locations()[modname]
+                modcls = self._modclss[modname] = self._create_modcls(modname, filepath)
+            return modcls
+
+    def __len__(self) -> int:
+        return len(self._get_locations())
+
+    def get_modcls_by_clsname(self, clsname: str) -> type[u.AMod]:
+        """
+        Return Module Class By Class Name.
+
+        Raises:
+            AttributeError: There is no module with class name `clsname`.
+        """
+        if self._clsnames is None:
+            self._clsnames = {get_modclsname(modname): modname for modname in self._get_locations()}
+        try:
+            modname = self._clsnames[clsname]
+        except KeyError:
+            raise AttributeError(f"module {self.pymodname!r} has no attribute {clsname!r}") from None
+        return self[modname]
+
+    def _get_locations(self) -> dict[str, Path]:
+        locations = self._locations
+        if locations is None:
+            if self.libindex is not None:
+                locations = {modname: entry.filepath for modname, entry in self.libindex.entries.items()}
+            else:
+                locations = {}
+                for filepath in self.filepaths:
+                    for modname, _, _ in scan_svfile(filepath):
+                        locations.setdefault(modname, filepath)
+            self._locations = locations
+        return locations
+
+    def _create_modcls(self, modname: str, filepath: Path) -> type[u.AMod]:
+        factory = self
+
+        def _build(self) -> None:
+            import_params_ports(
+                self,
+                filelistname=factory.filelistname,
+                filepath=None if factory.libindex else filepath,
+                libindex=factory.libindex,
+                svpackages=factory.svpackages,
+                backend=factory.backend,
+                lazy=factory.lazy,
+            )
+
+        clsname = get_modclsname(modname)
+        namespace = {
+            "__module__": self.pymodname,
+            "__qualname__": clsname,
+            "__doc__": f"Module `{modname}` imported from `{filepath.name}`.",
+            "filelists": (u.ModFileList(name=self.filelistname, filepaths=(filepath,)),),
+            "_build": _build,
+            "modname": property(lambda self: modname, doc="Module Name."),
+            "topmodname": property(lambda self: modname, doc="Top Module Name."),
+        }
+        return type(clsname, (u.AMod,), namespace)
+
+
+class SvImport(u.Object):
+    """
+    SystemVerilog File Imported By A Module Class.
+
+    Attributes:
+        modcls: Module Class.
+        filelistname: Name of the filelist.
+        filepath: Imported File.
+        filehash: Hash of the file content at import time.
+    """
+
+    modcls: type[u.BaseMod]
+    filelistname: str
+    filepath: Path
+    filehash: str
+
+
+_SVIMPORTS: dict[tuple[type[u.BaseMod], Path], SvImport] = {}
+_SVIMPORTS_LOCK = Lock()
+
+
+def get_svimports(modcls: type[u.BaseMod] | None = None) -> tuple[SvImport, ...]:
+    """
+    Return Dependency Graph Of Module Classes And Their Imported SystemVerilog Files.
+
+    Args:
+        modcls: Limit to imports of the given module class.
+    """
+    with _SVIMPORTS_LOCK:
+        svimports = tuple(_SVIMPORTS.values())
+    if modcls is not None:
+        svimports = tuple(svimport for svimport in svimports if svimport.modcls is modcls)
+    return svimports
+
+
+def _record_svimport(svimport: SvImport) -> None:
+    with _SVIMPORTS_LOCK:
+        _SVIMPORTS[(svimport.modcls, svimport.filepath)] = svimport
+
+
+def get_filehash(filepath: Path) -> str:
+    """Hash Of The Content Of `filepath`."""
+    return sha256(Path(filepath).read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _parse_file(filepath: Path, filehash: str, backend: SvBackend) -> hdl.File:
+    """Parse `filepath` once per content and backend, or load its snapshot if up-to-date."""
+    return _load_snapshot(get_snapshotpath(filepath), filehash, backend) or backend.parse_file(filepath)
+
+
+@lru_cache(maxsize=256)
+def _get_pkgimports(filepath: Path, filehash: str, modname: str) -> frozenset[str]:
+    """Packages Imported Via `import pkg::*` Outside Of Any Module Or By The Header Of Module `modname`."""
+    data = filepath.read_bytes()
+    imports = []
+    pos = 0
+    for name, start, end in scan_svfile(filepath):
+        imports.append(data[pos:start])
+        if name == modname:
+            mat = _RE_HEADERIMPORTS.match(data, start)
+            if mat:
+                imports.append(mat.group(1))
+            break
+        pos = end
+    return frozenset(mat.group(1).decode() for text in imports for mat in _RE_PKGIMPORT.finditer(text))
+
+
+def get_snapshotpath(filepath: Path) -> Path:
+    """
+    Return Default Snapshot Path For `filepath`.
+
+        >>> from pathlib import Path
+        >>> get_snapshotpath(Path("ip/ram.sv")).name
+        'ram.sv.snapshot.json'
+    """
+    return filepath.with_name(f"{filepath.name}.snapshot.json")
+
+
+def freeze_svfile(filepath: Path, backend: SvBackend = DEFAULT_BACKEND) -> Path:
+    """
+    Parse `filepath` once with `backend` and write a snapshot of all module headers to `get_snapshotpath(filepath)`.
+
+    The importer loads the snapshot instead of parsing `filepath`, as long as the content of `filepath`
+    and the version of `hdl_parser` are unchanged and the importer uses the same `backend`.
+
+    Args:
+        filepath: SystemVerilog File.
+
+    Keyword Args:
+        backend: Parser Backend.
+
+    Returns:
+        Snapshot File.
+    """
+    snapshotpath = get_snapshotpath(filepath)
+    file = backend.parse_file(filepath)
+    snapshot = {
+        "hdl_parser": _get_parser_version(),
+        "backend": repr(backend),
+        "filehash": get_filehash(filepath),
+        "file": file.model_dump(mode="json", exclude_defaults=True, exclude={"modules": {"__all__": {"insts"}}}),
+    }
+    snapshotpath.write_text(json.dumps(snapshot, separators=(",", ":")))
+    return snapshotpath
+
+
+def _load_snapshot(snapshotpath: Path, filehash: str, backend: SvBackend) -> hdl.File | None:
+    try:
+        snapshot = json.loads(snapshotpath.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if (
+        snapshot.get("filehash") != filehash
+        or snapshot.get("hdl_parser") != _get_parser_version()
+        or snapshot.get("backend") != repr(backend)
+    ):
+        return None
+    return hdl.File.model_validate(snapshot["file"])
+
+
+@lru_cache
+def _get_parser_version() -> str:
+    return metadata.version("hdl-parser")
+
+
 def _svfilter(ident: u.Ident) -> bool:
     return not isinstance(ident.type_, u.BaseStructType)
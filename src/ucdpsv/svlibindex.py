@@ -0,0 +1,249 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Library Index.
+
+Maps every module name within a directory tree to its file and byte range:
+
+    >>> import ucdpsv as usv
+    >>> from pathlib import Path
+    >>> libindex = usv.SvLibIndex.build([Path("tests/testdata/sv")])
+    >>> libindex["adder"].filepath.name
+    'adder.sv'
+
+The index is persisted via `save` and `load`. `build` with an existing index scans just modified files.
+The importer uses the index to locate a module and parses just its byte range:
+
+    >>> def _build(self):
+    ...     usv.import_params_ports(self, libindex=libindex)
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import hdl_parser as hdl
+import ucdp as u
+
+from .svbackend import DEFAULT_BACKEND, SvBackend
+
+# Comments and strings are matched, just to skip them.
+_RE_SCAN = re.compile(
+    rb"//[^\n]*"
+    rb"|/\*.*?\*/"
+    rb'|"(?:\\.|[^"\\])*"'
+    rb"|\b(?:macro)?module\s+(?:(?:static|automatic)\s+)?([A-Za-z_][A-Za-z0-9_$]*)"
+    rb"|\b(endmodule)\b",
+    re.DOTALL,
+)
+# Preprocessor directives and package imports, a module might depend on.
+_RE_CONTEXT = re.compile(rb"`(?:define|undef|ifdef|ifndef|elsif|else|endif|include)\b|\bimport\b")
+
+ModRange = tuple[str, int, int]
+
+
+class SvLibEntry(u.Object):
+    """
+    Module Location.
+
+    Attributes:
+        modname: Module Name.
+        filepath: File.
+        start: Byte offset of the `module` keyword.
+        end: Byte offset behind `endmodule`.
+    """
+
+    modname: str
+    filepath: Path
+    start: int
+    end: int
+
+
+class SvLibFile(u.Object):
+    """
+    Scanned File.
+
+    Attributes:
+        stat: Modification time and size at scan time.
+        modranges: Name and byte range of all modules.
+    """
+
+    stat: tuple[int, int]
+    modranges: tuple[ModRange, ...]
+
+
+class SvLibIndex(u.Object):
+    """
+    SystemVerilog Library Index.
+
+    Attributes:
+        entries: Module locations by module name. The first file in sorted order wins on duplicates.
+        files: All scanned files.
+    """
+
+    entries: dict[str, SvLibEntry] = u.Field(default_factory=dict)
+    files: dict[Path, SvLibFile] = u.Field(default_factory=dict)
+
+    def __contains__(self, modname: str) -> bool:
+        return modname in self.entries
+
+    def __getitem__(self, modname: str) -> SvLibEntry:
+        return self.entries[modname]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def build(
+        dirpaths: Iterable[Path],
+        patterns: Iterable[str] = ("*.sv", "*.v"),
+        maxworkers: int = 1,
+        index: "SvLibIndex | None" = None,
+    ) -> "SvLibIndex":
+        """
+        Scan All Files Matching `patterns` Within `dirpaths` Recursively.
+
+        Args:
+            dirpaths: Directories.
+
+        Keyword Args:
+            patterns: File name patterns.
+            maxworkers: Number of processes for scanning.
+            index: Previous index. Files with unchanged modification time and size are not scanned again.
+        """
+        filepaths = sorted({path for dirpath in dirpaths for pattern in patterns for path in dirpath.rglob(pattern)})
+        stats = {filepath: _get_stat(filepath) for filepath in filepaths}
+
+        # reuse unchanged
+        files: dict[Path, SvLibFile] = {}
+        if index is not None:
+            files.update(
+                (filepath, libfile) for filepath, libfile in index.files.items() if stats.get(filepath) == libfile.stat
+            )
+
+        scanpaths = [filepath for filepath in filepaths if filepath not in files]
+        if maxworkers > 1 and len(scanpaths) > 1:
+            chunksize = max(1, len(scanpaths) // (4 * maxworkers))
+            with ProcessPoolExecutor(max_workers=maxworkers) as exe:
+                scanned = list(exe.map(scan_svfile, scanpaths, chunksize=chunksize))
+        else:
+            scanned = [scan_svfile(filepath) for filepath in scanpaths]
+        for filepath, modranges in zip(scanpaths, scanned, strict=True):
+            files[filepath] = SvLibFile(stat=stats[filepath], modranges=tuple(modranges))
+
+        files = {filepath: files[filepath] for filepath in filepaths}
+        entries: dict[str, SvLibEntry] = {}
+        for filepath, libfile in files.items():
+            for modname, start, end in libfile.modranges:
+                if modname not in entries:
+                    entries[modname] = SvLibEntry(modname=modname, filepath=filepath, start=start, end=end)
+        return SvLibIndex(entries=entries, files=files)
+
+    def save(self, filepath: Path) -> None:
+        """Save Index To `filepath`."""
+        data = [[str(path), *libfile.stat, libfile.modranges] for path, libfile in self.files.items()]
+        filepath.write_text(json.dumps(data, separators=(",", ":")))
+
+    @staticmethod
+    def load(filepath: Path) -> "SvLibIndex":
+        """Load Index From `filepath`."""
+        files: dict[Path, SvLibFile] = {}
+        entries: dict[str, SvLibEntry] = {}
+        for path, mtime_ns, size, modranges in json.loads(filepath.read_text()):
+            libpath = Path(path)
+            libfile = files[libpath] = SvLibFile(stat=(mtime_ns, size), modranges=tuple(map(tuple, modranges)))
+            for modname, start, end in libfile.modranges:
+                if modname not in entries:
+                    entries[modname] = SvLibEntry(modname=modname, filepath=libpath, start=start, end=end)
+        return SvLibIndex(entries=entries, files=files)
+
+    def parse(self, modname: str, backend: SvBackend = DEFAULT_BACKEND) -> hdl.File:
+        """
+        Parse Just The Byte Range Of Module `modname` With `backend`.
+
+        The whole file is parsed, if there are preprocessor directives or package imports outside of the module.
+        The file is scanned again and its index entries are updated, if it has been modified since indexing.
+        """
+        entry = self.entries[modname]
+        filepath = entry.filepath
+        stat = _get_stat(filepath)
+        libfile = self.files.get(filepath)
+        if libfile is None or stat != libfile.stat:
+            self._update(filepath, stat)
+            entry = self.entries.get(modname)
+            if entry is None or entry.filepath != filepath:
+                raise ValueError(f"{filepath} does not contain module {modname} anymore")
+        return _parse_range(filepath, entry.start, entry.end, stat, backend)
+
+    def _update(self, filepath: Path, stat: tuple[int, int]) -> None:
+        modranges = tuple(scan_svfile(filepath))
+        libfile = self.files.get(filepath)
+        if libfile is not None:
+            for name, _, _ in libfile.modranges:
+                entry = self.entries.get(name)
+                if entry is not None and entry.filepath == filepath:
+                    del self.entries[name]
+        self.files[filepath] = SvLibFile(stat=stat, modranges=modranges)
+        for name, start, end in modranges:
+            if name not in self.entries:
+                self.entries[name] = SvLibEntry(modname=name, filepath=filepath, start=start, end=end)
+
+
+def scan_svfile(filepath: Path) -> list[ModRange]:
+    """
+    Return Name And Byte Range Of All Modules Within `filepath`.
+
+    Just `module` keywords outside of comments and strings are considered.
+    """
+    data = filepath.read_bytes()
+    modranges: list[ModRange] = []
+    modname = None
+    start = 0
+    for mat in _RE_SCAN.finditer(data):
+        name, end = mat.groups()
+        if name:
+            modname, start = name.decode(), mat.start()
+        elif end and modname:
+            modranges.append((modname, start, mat.end()))
+            modname = None
+    return modranges
+
+
+@lru_cache(maxsize=256)
+def _parse_range(filepath: Path, start: int, end: int, stat: tuple[int, int] | None, backend: SvBackend) -> hdl.File:
+    data = filepath.read_bytes()
+    if _RE_CONTEXT.search(data, 0, start) or _RE_CONTEXT.search(data, end):
+        # the module range is not parseable on its own
+        return backend.parse_text(data.decode(), filepath=filepath)
+    return backend.parse_text(data[start:end].decode(), filepath=filepath)
+
+
+def _get_stat(filepath: Path) -> tuple[int, int]:
+    stat = filepath.stat()
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,82 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Output Options.
+
+The options are handed over to `sv.mako` via the datamodel:
+
+    >>> import ucdp as u
+    >>> import ucdpsv as usv
+    >>> svoptions = usv.SvOptions(merge_flipflops=True)
+    >>> data = {"svoptions": svoptions}
+
+`u.generate(mod, "hdl", data=data)` uses these options for all generated files.
+"""
+
+from typing import Any
+
+import ucdp as u
+
+
+class SvOptions(u.Object):
+    """
+    SystemVerilog Output Options.
+
+    Attributes:
+        merge_flipflops: Emit one `always_ff` process per clock and asynchronous reset,
+                         instead of one process per flip-flop group.
+        structs: Emit packed structs instead of flattened struct members,
+                 for all structs with forward members of fixed-width scalar types.
+                 All modules of the hierarchy need to be generated with this option.
+        generate_loops: Emit instances `<base>0` to `<base>N-1` of the same module as `generate for` loop,
+                        if all connections are identical or linear slices of the same identifier.
+                        The instances become `gen_<base>[idx].<base>` in the hierarchy.
+        lean: Skip all comments and column alignment within the module, for machine-consumed output.
+        coalesce_slices: Merge adjacent descending constant slices of the same identifier within concatenations,
+                         i.e. `{a[7], a[6], a[5:4]}` becomes `a[7:4]`.
+    """
+
+    merge_flipflops: bool = False
+    structs: bool = False
+    generate_loops: bool = False
+    lean: bool = False
+    coalesce_slices: bool = False
+
+
+DEFAULT_SVOPTIONS = SvOptions()
+
+
+def get_svoptions(datamodel: Any = None) -> SvOptions:
+    """
+    Return `SvOptions` stored in `datamodel`.
+
+    Defaults are returned, if `datamodel` does not contain `svoptions`.
+
+        >>> import ucdpsv as usv
+        >>> usv.get_svoptions()
+        SvOptions()
+    """
+    return getattr(datamodel, "svoptions", None) or DEFAULT_SVOPTIONS
@@ -0,0 +1,219 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Package Import.
+
+Widths and constants of vendor IPs are often defined within a SystemVerilog `package`:
+
+    >>> import ucdpsv as usv
+    >>> from pathlib import Path
+    >>> svpackages = usv.import_svpackages(Path("tests/testdata/importer/pkg.sv"))
+    >>> svpackage = svpackages[0]
+    >>> svpackage.name
+    'top_pkg'
+    >>> svpackage.namespace['WIDTH']
+    Const(IntegerType(default=8), 'WIDTH')
+    >>> svpackage.typedefs['data_t']
+    UintType(8)
+
+Every file is parsed once per content. All importing modules share the resulting `SvPackage`s:
+
+    >>> def _build(self):
+    ...     usv.import_params_ports(self, svpackages=svpackages)
+
+References like `top_pkg::WIDTH` and names imported via `import top_pkg::*` are resolved to their values.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import ucdp as u
+
+# Comments are matched, just to skip them.
+_RE_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_RE_PACKAGE = re.compile(r"\bpackage\s+(?:(?:static|automatic)\s+)?([A-Za-z_]\w*)\s*;(.*?)\bendpackage\b", re.DOTALL)
+_RE_PARAM = re.compile(r"(?:parameter|localparam)\s+(.*)", re.DOTALL)
+_RE_ASSIGN = re.compile(r"(.*?)\b([A-Za-z_]\w*)\s*=\s*(.+)", re.DOTALL)
+_RE_TYPEDEF = re.compile(
+    r"typedef\s+(?:logic|bit|reg)\s*(signed|unsigned)?\s*((?:\[[^\]]+\]\s*)*)([A-Za-z_]\w*)\s*((?:\[[^\]]+\]\s*)*)",
+    re.DOTALL,
+)
+_RE_DIM = re.compile(r"\[([^\]:]+):([^\]]+)\]")
+_RE_STRING = re.compile(r'"((?:\\.|[^"\\])*)"')
+_REALTYPES = {"real": u.DoubleType, "realtime": u.DoubleType, "shortreal": u.FloatType}
+_INTWIDTHS = {"byte": 8, "shortint": 16, "longint": 64}
+
+
+class SvPackage(u.Object):
+    """
+    SystemVerilog Package.
+
+    Attributes:
+        name: Package Name.
+        filepath: File.
+        namespace: Parameters and local parameters as constants.
+            Constants, which are neither string, real nor integer expression, are skipped.
+        typedefs: Vector types by name.
+    """
+
+    name: str
+    filepath: Path
+    namespace: u.Namespace
+    typedefs: dict[str, u.BaseType]
+
+    def get_value(self, name: str) -> int | None:
+        """Return Integer Value of Constant `name` or `None` if there is no integer constant `name`."""
+        const = self.namespace.get(name, None)
+        if const is None:
+            return None
+        default = const.type_.default
+        return default if isinstance(default, int) else None
+
+
+def import_svpackages(filepath: Path) -> tuple[SvPackage, ...]:
+    """
+    Return All Packages Within `filepath`.
+
+    The file is parsed once per content.
+    """
+    stat = filepath.stat()
+    return _import_svpackages(filepath, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=64)
+def _import_svpackages(filepath: Path, mtime_ns: int, size: int) -> tuple[SvPackage, ...]:
+    text = _RE_COMMENT.sub(" ", filepath.read_text())
+    return tuple(_parse_package(filepath, name, body) for name, body in _RE_PACKAGE.findall(text))
+
+
+def _parse_package(filepath: Path, name: str, body: str) -> SvPackage:
+    namespace = u.Namespace()
+    parser = u.ExprParser(namespace=namespace, context=f"{filepath}: package {name}")
+    typedefs: dict[str, u.BaseType] = {}
+    for statement in map(str.strip, body.split(";")):
+        mat = _RE_PARAM.fullmatch(statement)
+        if mat:
+            typestr = None
+            for item in _split(mat.group(1)):
+                assign = _RE_ASSIGN.fullmatch(item.strip())
+                if not assign:
+                    continue
+                head, constname, value = assign.groups()
+                # following declarations of the same statement share the type
+                typestr = head.strip() if typestr is None else typestr
+                type_ = _get_type(parser, typestr, value.strip())
+                if type_ is not None:
+                    namespace.add(u.Const(type_, constname))
+            continue
+        mat = _RE_TYPEDEF.fullmatch(statement)
+        if mat:
+            sign, dims, typename, dims_unpacked = mat.groups()
+            typedefs[typename] = _get_vectortype(parser, sign == "signed", dims, dims_unpacked)
+    namespace.lock()
+    return SvPackage(name=name, filepath=filepath, namespace=namespace, typedefs=typedefs)
+
+
+def _split(text: str) -> list[str]:
+    """Split `text` at commas outside of brackets."""
+    items = []
+    level = 0
+    start = 0
+    for idx, char in enumerate(text):
+        if char in "([{":
+            level += 1
+        elif char in ")]}":
+            level -= 1
+        elif char == "," and not level:
+            items.append(text[start:idx])
+            start = idx + 1
+    items.append(text[start:])
+    return items
+
+
+def _get_type(parser: u.ExprParser, typestr: str, value: str) -> u.BaseScalarType | None:
+    """Type Of Constant Declared As `typestr` With `value` or `None` if not representable."""
+    keywords = typestr.split()
+    if "string" in keywords:
+        mat = _RE_STRING.fullmatch(value)
+        return u.StringType(default=mat.group(1)) if mat else None
+    realtypes = [realtype for keyword, realtype in _REALTYPES.items() if keyword in keywords]
+    try:
+        if realtypes:
+            return realtypes[0](default=float(value))
+        return _get_inttype(parser, typestr, value)
+    except (KeyError, TypeError, ValueError):
+        # i.e. `$clog2(16)`, references to other packages or `parameter type`
+        return None
+
+
+def _get_inttype(parser: u.ExprParser, typestr: str, value: str) -> u.BaseScalarType:
+    default = parser(value)
+    if isinstance(default, (float, str)):
+        raise ValueError(f"{value!r} is not an integer expression")
+    default = int(default)
+    keywords = typestr.split()
+    dims = _RE_DIM.findall(typestr)
+    if dims:
+        width, right = _get_width(parser, *dims[0])
+        signed = "signed" in keywords
+    elif "bit" in keywords or "logic" in keywords or "reg" in keywords:
+        return u.BitType(default=default)
+    else:
+        widths = [width for keyword, width in _INTWIDTHS.items() if keyword in keywords]
+        if not widths:
+            return u.IntegerType(default=default)
+        width, right = widths[0], 0
+        signed = "unsigned" not in keywords
+    if signed:
+        return u.SintType(width, right=right, default=default)
+    return u.UintType(width, right=right, default=default)
+
+
+def _get_vectortype(parser: u.ExprParser, signed: bool, dims: str, dims_unpacked: str) -> u.BaseType:
+    packed = _RE_DIM.findall(dims)
+    if packed:
+        width, right = _get_width(parser, *packed[-1])
+        type_ = u.SintType(width, right=right) if signed else u.UintType(width, right=right)
+    else:
+        type_ = u.BitType()
+    for left, right in reversed(packed[:-1]):
+        type_ = _get_arraytype(parser, type_, left, right, packed=True)
+    for left, right in reversed(_RE_DIM.findall(dims_unpacked)):
+        type_ = _get_arraytype(parser, type_, left, right, packed=False)
+    return type_
+
+
+def _get_arraytype(parser: u.ExprParser, itemtype: u.BaseType, left: str, right: str, packed: bool) -> u.ArrayType:
+    lvalue, rvalue = int(parser(left)), int(parser(right))
+    direction = u.DOWN if lvalue >= rvalue else u.UP
+    width = abs(lvalue - rvalue) + 1
+    return u.ArrayType(itemtype, width, left=lvalue, right=rvalue, direction=direction, packed=packed)
+
+
+def _get_width(parser: u.ExprParser, left: str, right: str) -> tuple[int, int]:
+    lvalue, rvalue = int(parser(left)), int(parser(right))
+    return abs(lvalue - rvalue) + 1, min(lvalue, rvalue)
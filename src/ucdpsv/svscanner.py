@@ -0,0 +1,490 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Fast SystemVerilog Module Header Scanner.
+
+`SvScanner` is a parser backend (see `SvBackend`), which just extracts what `SvImporter` needs:
+module names, parameters, local parameters and ports of ANSI and non-ANSI headers,
+including packed and unpacked dimensions and `ifdef` nesting:
+
+    >>> import ucdpsv as usv
+    >>> from pathlib import Path
+    >>> file = usv.SvScanner().parse_file(Path("tests/testdata/sv/adder.sv"))
+    >>> [port.name for port in file.modules[0].ports]
+    ['A', 'B', 'X', 'byte_p', 'word_p', 'flag_u', 'arr_u']
+
+Module bodies are skipped, except for parameter and port declarations.
+Instances and comments are not extracted.
+"""
+
+# ruff: noqa: S105
+
+import re
+from pathlib import Path
+
+import hdl_parser as hdl
+
+from .svbackend import SvBackend
+
+# Top level: comments and strings are matched, just to skip them.
+_RE_TOP = re.compile(
+    r"//[^\n]*"
+    r"|/\*.*?\*/"
+    r'|"(?:\\.|[^"\\])*"'
+    r"|`(ifdef|ifndef|elsif|else|endif)\b[ \t]*(\w*)"
+    r"|\b((?:macro)?module)\b",
+    re.DOTALL,
+)
+
+# Module body: just declarations relevant for the header and the end of the module.
+_RE_BODY = re.compile(
+    r"//[^\n]*"
+    r"|/\*.*?\*/"
+    r'|"(?:\\.|[^"\\])*"'
+    r"|`(ifdef|ifndef|elsif|else|endif)\b[ \t]*(\w*)"
+    r"|(?<![\w$.])(input|output|inout|parameter|localparam|function|task|endmodule)\b",
+    re.DOTALL,
+)
+
+# Single token: comment, directive or token.
+_RE_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(//[^\n]*|/\*.*?\*/)"
+    r"|`(ifdef|ifndef|elsif|else|endif)\b[ \t]*(\w*)"
+    r'|("(?:\\.|[^"\\])*"'
+    r"|`?[A-Za-z_$][\w$]*"
+    r"|\d[\w.]*(?:'[sS]?[bodhBODH][\w?]+)?"
+    r"|'[sS]?[bodhBODH][\w?]+"
+    r"|::|\*\*|\S)"
+    r")",
+    re.DOTALL,
+)
+
+_RE_ENDFUNCTION = re.compile(r"\bendfunction\b")
+_RE_ENDTASK = re.compile(r"\bendtask\b")
+
+_DIRECTIONS = frozenset(("input", "output", "inout"))
+_PARAMS = frozenset(("parameter", "localparam"))
+_SIGNINGS = frozenset(("signed", "unsigned"))
+_TYPES = frozenset(
+    (
+        "bit",
+        "byte",
+        "int",
+        "integer",
+        "logic",
+        "longint",
+        "real",
+        "realtime",
+        "reg",
+        "shortint",
+        "shortreal",
+        "enum",
+        "string",
+        "struct",
+        "supply0",
+        "supply1",
+        "time",
+        "tri",
+        "tri0",
+        "tri1",
+        "triand",
+        "trior",
+        "type",
+        "union",
+        "uwire",
+        "wand",
+        "wire",
+        "wor",
+    )
+)
+_IGNORED = frozenset(("const", "packed", "tagged", "var"))
+_OPENING = {"(": ")", "[": "]", "{": "}"}
+_CLOSING = frozenset(_OPENING.values())
+
+
+class SvScanner(SvBackend):
+    """Fast Module Header Scanner."""
+
+    def parse_text(self, text: str, filepath: Path | None = None) -> hdl.File:
+        """Parse `text` and return all modules."""
+        modules = tuple(_scan(text))
+        if not modules:
+            raise RuntimeError("No module found.")
+        return hdl.File(path=filepath, modules=modules)
+
+
+class _Ifdefs:
+    """Stack of `ifdef` conditions - identical to `hdl_parser`."""
+
+    def __init__(self):
+        self.stack: list[str] = []
+        self.pops: list[int] = []
+
+    def update(self, directive: str, name: str) -> None:
+        stack = self.stack
+        if directive == "ifdef":
+            stack.append(name)
+            self.pops.append(1)
+        elif directive == "ifndef":
+            stack.append(_flip(name))
+            self.pops.append(1)
+        elif not self.pops:
+            # unbalanced
+            return
+        elif directive == "elsif":
+            stack[-1] = _flip(stack[-1])
+            stack.append(name)
+            self.pops[-1] += 1
+        elif directive == "else":
+            stack[-1] = _flip(stack[-1])
+        else:  # endif
+            del stack[-self.pops.pop() :]
+
+    def get(self) -> tuple[str, ...]:
+        return tuple(self.stack)
+
+
+class _Lexer:
+    """Tokens Of The Module Header, Skipping Comments And Handling Directives."""
+
+    def __init__(self, text: str, pos: int, ifdefs: _Ifdefs):
+        self.text = text
+        self.pos = pos
+        self.ifdefs = ifdefs
+        self.start = pos
+        self.directives = 0
+
+    def next(self, apply: bool = True) -> str:
+        """Return next token or an empty string at the end of the text. Directives are applied, if `apply`."""
+        text = self.text
+        while True:
+            mat = _RE_TOKEN.match(text, self.pos)
+            if mat is None:
+                self.start = self.pos = len(text)
+                return ""
+            self.pos = mat.end()
+            _comment, directive, name, token = mat.groups()
+            if token:
+                self.start = mat.start(4)
+                return token
+            if directive and apply:
+                self.ifdefs.update(directive, name)
+                self.directives += 1
+
+    def peek(self) -> str:
+        """Return next token without consuming it."""
+        pos, start = self.pos, self.start
+        token = self.next(apply=False)
+        self.pos, self.start = pos, start
+        return token
+
+    def skip_group(self, token: str) -> str:
+        """Skip until the bracket opened by `token` is closed and return the text of the group."""
+        start = self.start
+        closing = [_OPENING[token]]
+        while closing:
+            token = self.next()
+            if not token:
+                break
+            if token in _OPENING:
+                closing.append(_OPENING[token])
+            elif token == closing[-1]:
+                closing.pop()
+        return self.text[start : self.pos]
+
+    def skip_until(self, ends: str) -> tuple[str, str]:
+        """
+        Skip until any of `ends` on the current level and return the skipped text and the next token.
+
+        A directive ends the text as well. The next token is returned in this case.
+        """
+        start = last = self.pos
+        directives = self.directives
+        while True:
+            token = self.next()
+            if not token or token in ends:
+                return self.text[start:last].strip(), token
+            if self.directives != directives:
+                # i.e. `ifdef` alternatives without separator
+                return self.text[start:last].strip(), token
+            if token in _OPENING:
+                self.skip_group(token)
+            last = self.pos
+
+
+class _Decl:
+    """Attributes shared by all items of one declaration."""
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.ptype = ""
+        self.dtype = ""
+        self.dim = ""
+
+
+class _Item:
+    """Attributes of one declared item."""
+
+    def __init__(self):
+        self.name = ""
+        self.dim_unpacked = ""
+        self.default = ""
+        self.ifdefs: tuple[str, ...] = ()
+        self.newtype = False
+
+
+def _scan(text: str) -> list[hdl.Module]:
+    modules = []
+    ifdefs = _Ifdefs()
+    pos = 0
+    while True:
+        mat = _RE_TOP.search(text, pos)
+        if mat is None:
+            break
+        pos = mat.end()
+        directive, name, module = mat.groups()
+        if directive:
+            ifdefs.update(directive, name)
+        elif module:
+            module, pos = _scan_module(text, pos, ifdefs)
+            modules.append(module)
+    return modules
+
+
+def _scan_module(text: str, pos: int, ifdefs: _Ifdefs) -> tuple[hdl.Module, int]:
+    modifdefs = ifdefs.get()
+    lexer = _Lexer(text, pos, ifdefs)
+    params: list[hdl.Param] = []
+    localparams: list[hdl.Param] = []
+    ports: list[hdl.Port] = []
+
+    name = lexer.next()
+    if name in ("static", "automatic"):
+        name = lexer.next()
+    token = lexer.next()
+    # package imports
+    while token == "import":
+        lexer.skip_until(";")
+        token = lexer.next()
+    # parameter port list
+    if token == "#":
+        lexer.next()  # (
+        _scan_params(lexer, "parameter", ")", params, localparams)
+        token = lexer.next()
+    # port list
+    ansi = False
+    if token == "(":
+        if lexer.peek() in _DIRECTIONS:
+            ansi = True
+            _scan_ports(lexer, "", ")", ports)
+        else:
+            lexer.skip_group(token)
+        token = lexer.next()
+    if token != ";":
+        # missing semicolon - the body starts with `token`
+        lexer.pos = lexer.start
+
+    # module body
+    pos = _scan_body(text, lexer.pos, ifdefs, ansi=ansi, params=params, localparams=localparams, ports=ports)
+    module = hdl.Module(
+        name=name,
+        params=tuple(params),
+        localparams=tuple(localparams),
+        ports=tuple(ports),
+        ifdefs=modifdefs,
+    )
+    return module, pos
+
+
+def _scan_body(
+    text: str,
+    pos: int,
+    ifdefs: _Ifdefs,
+    *,
+    ansi: bool,
+    params: list[hdl.Param],
+    localparams: list[hdl.Param],
+    ports: list[hdl.Port],
+) -> int:
+    while True:
+        mat = _RE_BODY.search(text, pos)
+        if mat is None:
+            return len(text)
+        pos = mat.end()
+        directive, name, keyword = mat.groups()
+        if directive:
+            ifdefs.update(directive, name)
+        elif keyword == "endmodule":
+            return pos
+        elif keyword == "function":
+            pos = _skip(_RE_ENDFUNCTION, text, pos)
+        elif keyword == "task":
+            pos = _skip(_RE_ENDTASK, text, pos)
+        elif keyword in _PARAMS:
+            lexer = _Lexer(text, pos, ifdefs)
+            _scan_params(lexer, keyword, ";", params, localparams)
+            pos = lexer.pos
+        elif keyword and not ansi:
+            lexer = _Lexer(text, pos, ifdefs)
+            _scan_ports(lexer, keyword, ";", ports)
+            pos = lexer.pos
+
+
+def _skip(regex: re.Pattern, text: str, pos: int) -> int:
+    mat = regex.search(text, pos)
+    return mat.end() if mat else len(text)
+
+
+def _scan_params(  # noqa: C901
+    lexer: _Lexer, keyword: str, end: str, params: list[hdl.Param], localparams: list[hdl.Param]
+) -> None:
+    decl = _Decl(keyword)
+    item = _Item()
+    pending = ""
+    while True:
+        token, pending = pending or lexer.next(), ""
+        if token == "=":
+            item.default, token = lexer.skip_until(f",{end}")
+            if token not in (",", end, ""):
+                # value ended by a directive - `token` starts the next item
+                pending, token = token, ","
+        if token in _PARAMS:
+            decl = _Decl(token)
+        elif token in _TYPES or token in _SIGNINGS or (token == "[" and not item.name):
+            decl = _get_decl(lexer, decl, item, token)
+        elif token == "[":
+            item.dim_unpacked += lexer.skip_group(token)
+        elif token in (",", end, ""):
+            if item.name:
+                param = hdl.Param(
+                    # signing replaces the type - like `hdl_parser`
+                    ptype=decl.dtype or decl.ptype,
+                    name=item.name,
+                    dim=decl.dim,
+                    dim_unpacked=item.dim_unpacked,
+                    default=item.default,
+                    ifdefs=item.ifdefs,
+                )
+                (localparams if decl.keyword == "localparam" else params).append(param)
+            if token != ",":
+                break
+            item = _Item()
+        elif token == "{":
+            lexer.skip_group(token)
+        elif _is_name(token) and token not in _IGNORED:
+            decl = _set_name(lexer, decl, item, token)
+
+
+def _scan_ports(  # noqa: C901
+    lexer: _Lexer, direction: str, end: str, ports: list[hdl.Port]
+) -> None:
+    decl = _Decl(direction)
+    item = _Item()
+    pending = ""
+    while True:
+        token, pending = pending or lexer.next(), ""
+        if token == "=":
+            _, token = lexer.skip_until(f",{end}")
+            if token not in (",", end, ""):
+                # value ended by a directive - `token` starts the next item
+                pending, token = token, ","
+        if token in _DIRECTIONS:
+            decl = _Decl(token)
+            item.newtype = True
+        elif token in _TYPES or token in _SIGNINGS or (token == "[" and not item.name):
+            decl = _get_decl(lexer, decl, item, token)
+        elif token == "[":
+            item.dim_unpacked += lexer.skip_group(token)
+        elif token in (",", end, ""):
+            if item.name:
+                port = hdl.Port(
+                    direction=decl.keyword,
+                    ptype=decl.ptype,
+                    dtype=decl.dtype,
+                    name=item.name,
+                    dim=decl.dim,
+                    dim_unpacked=item.dim_unpacked,
+                    ifdefs=item.ifdefs,
+                )
+                ports.append(port)
+            if token != ",":
+                break
+            item = _Item()
+        elif token == "{":
+            lexer.skip_group(token)
+        elif _is_name(token) and token not in _IGNORED:
+            decl = _set_name(lexer, decl, item, token)
+
+
+def _get_decl(lexer: _Lexer, decl: _Decl, item: "_Item", token: str) -> _Decl:
+    """Apply type `token` to the declaration."""
+    if not item.newtype:
+        # explicit type - not inherited from the previous item
+        decl = _Decl(decl.keyword)
+        item.newtype = True
+    if token == "[":
+        decl.dim += lexer.skip_group(token)
+    elif token in _TYPES:
+        decl.ptype = token
+    else:
+        decl.dtype = token
+    return decl
+
+
+def _set_name(lexer: _Lexer, decl: _Decl, item: "_Item", token: str) -> _Decl:
+    """Apply identifier `token`, which is either a type or the item name."""
+    if _is_typename(lexer):
+        decl = _get_decl(lexer, decl, item, "")
+        decl.ptype = _get_typename(lexer, token)
+    else:
+        item.name = token
+        item.ifdefs = lexer.ifdefs.get()
+    return decl
+
+
+def _is_name(token: str) -> bool:
+    return token[:1].isalpha() or token[:1] == "_"
+
+
+def _is_typename(lexer: _Lexer) -> bool:
+    """Identifier followed by another identifier or a scope is a type."""
+    token = lexer.peek()
+    return token == "::" or _is_name(token)
+
+
+def _get_typename(lexer: _Lexer, token: str) -> str:
+    typename = token
+    while lexer.peek() == "::":
+        lexer.next()
+        typename = f"{typename}::{lexer.next()}"
+    return typename
+
+
+def _flip(name: str) -> str:
+    if name.startswith("!"):
+        return name[1:]
+    return f"!{name}"
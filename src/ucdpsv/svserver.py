@@ -0,0 +1,324 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+SystemVerilog Generation Server.
+
+A long-running process, which keeps loaded modules, the render cache and the compiled templates in memory
+and serves generation requests via a Unix socket:
+
+    >>> import ucdpsv as usv
+    >>> from pathlib import Path
+    >>> server = usv.SvServer(socketpath=Path("/tmp/ucdp-sv.sock"))
+
+`server.serve_forever()` serves until a `stop` request is received.
+Clients send one JSON request per connection and receive one JSON response:
+
+    >>> usv.request_svserver(Path("/tmp/ucdp-sv.sock"), cmd="gen", top="top.top", name="hdl")  # doctest: +SKIP
+    {'status': 'ok', 'elapsed': 0.012, 'stat': 'SvCache: 5 hits, 0 misses, 0 evictions'}
+
+Commands:
+
+* `gen`: Generate `top` (`name` is the filelist name, `target` is optional).
+* `reload`: Drop all loaded modules. They are imported again on the next `gen` request.
+* `status`: Loaded top modules and cache statistics.
+* `stop`: Stop the server.
+
+Before every `gen` request, the python files of all module classes within the hierarchy and all python files
+imported while loading them are checked.
+If any of them changed, all loaded modules are dropped and imported again, as modules
+might import from each other. If just SystemVerilog files imported via `import_params_ports` changed,
+only the top modules depending on them are built again.
+The process environment (i.e. `PRJ`) is the one of the server.
+
+With `watch=True`, an `SvWatcher` detects changed SystemVerilog files immediately and regenerates
+all previously generated top modules depending on them.
+"""
+
+import json
+import socket
+import sys
+import sysconfig
+import time
+from collections.abc import Iterable
+from importlib import invalidate_caches
+from itertools import chain
+from pathlib import Path
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from threading import Lock, Thread
+from typing import Any
+
+import ucdp as u
+from makolator import Makolator
+from ucdp import _modloader  # only used by `_clear_loadcaches`
+
+from .svcache import SvCache
+from .svimporter import SvImport, get_svimports
+from .svoptions import DEFAULT_SVOPTIONS, SvOptions
+from .svwatcher import SvWatcher
+
+
+class _Model(u.Object):
+    """Loaded Top Module And The Modification Time Of All Python And SystemVerilog Files It Depends On."""
+
+    top: Any
+    depends: tuple[tuple[str, Path, int], ...]
+    svdepends: tuple[tuple[str, Path, int], ...]
+    modclss: frozenset[type]
+    lock: Any
+
+
+class SvServer(u.Object):
+    """
+    SystemVerilog Generation Server.
+
+    Attributes:
+        socketpath: Unix Socket Path.
+        paths: Search Path For Data Model And Template Files.
+        svoptions: SystemVerilog Output Options.
+        svcache: Render Cache, shared by all requests.
+        maxworkers: Maximum Number of Threads Per Generation.
+        watch: Watch imported SystemVerilog files and regenerate on change.
+    """
+
+    socketpath: Path
+    paths: tuple[Path, ...] = ()
+    svoptions: SvOptions = DEFAULT_SVOPTIONS
+    svcache: SvCache = u.Field(default_factory=SvCache)
+    maxworkers: int | None = None
+    watch: bool = False
+
+    _models: dict[str, _Model] = u.PrivateField(default_factory=dict)
+    _gens: dict[str, set[tuple[str, str | None]]] = u.PrivateField(default_factory=dict)
+    _toplocks: dict[str, Lock] = u.PrivateField(default_factory=dict)
+    _makolator: Makolator | None = u.PrivateField(default=None)
+    _lock: Lock = u.PrivateField(default_factory=Lock)
+    _server: ThreadingUnixStreamServer | None = u.PrivateField(default=None)
+
+    def serve_forever(self) -> None:
+        """Serve Requests Until `stop` Is Requested."""
+        self.socketpath.unlink(missing_ok=True)
+        handle = self.handle
+
+        class Handler(StreamRequestHandler):
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline())
+                except ValueError as exc:
+                    response = {"status": "error", "error": f"Invalid request: {exc}"}
+                else:
+                    if isinstance(request, dict):
+                        response = handle(request)
+                    else:
+                        response = {"status": "error", "error": "Invalid request: object expected"}
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        watcher = SvWatcher(callback=self.on_svchange) if self.watch else None
+        with ThreadingUnixStreamServer(str(self.socketpath), Handler) as server:
+            # `server_close` joins the handler threads, so requests in progress are finished
+            server.daemon_threads = False
+            server.block_on_close = True
+            self._server = server
+            if watcher:
+                watcher.start()
+            try:
+                server.serve_forever()
+            finally:
+                if watcher:
+                    watcher.stop()
+                self._server = None
+                self.socketpath.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop Serving. Requests in progress are finished."""
+        server = self._server
+        if server is not None:
+            # `shutdown` waits for `serve_forever` and must not be called from the serving thread
+            Thread(target=server.shutdown, daemon=True).start()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle One Request And Return The Response."""
+        cmd = request.get("cmd")
+        start = time.perf_counter()
+        try:
+            if cmd == "gen":
+                self._gen(request["top"], request.get("name", "hdl"), target=request.get("target"))
+            elif cmd == "reload":
+                self.reload()
+            elif cmd == "status":
+                return {"status": "ok", "tops": sorted(self._models), "stat": self.svcache.stat}
+            elif cmd == "stop":
+                self.shutdown()
+            else:
+                return {"status": "error", "error": f"Unknown command {cmd!r}"}
+        except Exception as exc:
+            return {"status": "error", "error": f"{exc.__class__.__name__}: {exc}"}
+        elapsed = round(time.perf_counter() - start, 3)
+        return {"status": "ok", "elapsed": elapsed, "stat": self.svcache.stat}
+
+    def on_svchange(self, svimports: tuple[SvImport, ...]) -> None:
+        """Drop All Top Modules Depending On `svimports` And Regenerate Them."""
+        modclss = {svimport.modcls for svimport in svimports}
+        with self._lock:
+            toprefs = [topref for topref, model in self._models.items() if model.modclss & modclss]
+            for topref in toprefs:
+                self._drop(topref)
+            gens = [(topref, name, target) for topref in toprefs for name, target in self._gens.get(topref, ())]
+        for topref, name, target in gens:
+            self.handle({"cmd": "gen", "top": topref, "name": name, "target": target})
+
+    def reload(self) -> None:
+        """Drop All Loaded Modules And Their Python Modules."""
+        with self._lock:
+            self._reload()
+
+    def _reload(self) -> None:
+        pymodnames = {pymodname for model in self._models.values() for pymodname, _, _ in model.depends}
+        for pymodname in pymodnames:
+            sys.modules.pop(pymodname, None)
+        self._models.clear()
+        self._gens.clear()
+        # templates might have changed too
+        self._makolator = None
+        _clear_loadcaches(modclss=True)
+        invalidate_caches()
+
+    def _drop(self, topref: str) -> None:
+        self._models.pop(topref, None)
+        # the top module is built again, the python modules stay
+        _clear_loadcaches(modclss=False)
+
+    def _get_model(self, topref: str) -> _Model:
+        with self._lock:
+            toplock = self._toplocks.setdefault(topref, Lock())
+        # unrelated top modules are loaded concurrently
+        with toplock:
+            with self._lock:
+                model = self._models.get(topref)
+                # python modules might be shared by all top modules
+                if model is not None and not _is_uptodate(
+                    depend for other in self._models.values() for depend in other.depends
+                ):
+                    self._reload()
+                    model = None
+                if model is not None and not _is_uptodate(model.svdepends):
+                    self._drop(topref)
+                    model = None
+            if model is None:
+                pymodnames = set(sys.modules)
+                top = u.load(topref, paths=self.paths or None)
+                modclss = frozenset(mod.__class__ for mod in u.ModPostIter(top.mod, unique=True))
+                loaded = [pymodname for pymodname in tuple(sys.modules) if pymodname not in pymodnames]
+                depends = tuple(_iter_depends(modclss, loaded))
+                svdepends = tuple(
+                    ("", svimport.filepath, _get_mtime_ns(svimport.filepath))
+                    for svimport in get_svimports()
+                    if svimport.modcls in modclss
+                )
+                model = _Model(top=top, depends=depends, svdepends=svdepends, modclss=modclss, lock=Lock())
+                with self._lock:
+                    self._models[topref] = model
+            return model
+
+    def _get_makolator(self) -> Makolator:
+        """Makolator With Compiled Templates, Shared By All Requests."""
+        with self._lock:
+            if self._makolator is None:
+                self._makolator = u.get_makolator(paths=self.paths or None, verbose=False)
+            return self._makolator
+
+    def _gen(self, topref: str, name: str, target: str | None = None) -> None:
+        model = self._get_model(topref)
+        with self._lock:
+            self._gens.setdefault(topref, set()).add((name, target))
+        data = {"svoptions": self.svoptions, "svcache": self.svcache}
+        makolator = self._get_makolator()
+        with model.lock:
+            u.generate(
+                model.top.mod,
+                name,
+                target=target,
+                makolator=makolator,
+                maxworkers=self.maxworkers,
+                paths=self.paths or None,
+                data=data,
+            )
+
+
+def request_svserver(socketpath: Path, timeout: float | None = None, **request: Any) -> dict[str, Any]:
+    """Send `request` to `SvServer` listening on `socketpath` and return the response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socketpath))
+        with sock.makefile("rwb") as file:
+            file.write(json.dumps(request).encode() + b"\n")
+            file.flush()
+            return json.loads(file.readline())
+
+
+def _clear_loadcaches(modclss: bool) -> None:
+    """Clear The Caches Of `u.load`, Which Memorizes Top Modules And If `modclss`, Module Classes Too."""
+    # ucdp does not provide a public API for this - depends on ucdp internals
+    _modloader.build_top.cache_clear()
+    if modclss:
+        _modloader.load_modcls.cache_clear()
+
+
+_STDLIB = Path(sysconfig.get_paths()["stdlib"])
+
+
+def _iter_depends(modclss: Iterable[type], loaded: Iterable[str] = ()) -> Iterable[tuple[str, Path, int]]:
+    """
+    Python Modules Defining `modclss` And Their Base Classes And `loaded` Modules.
+
+    Installed packages and the standard library are excluded.
+
+    `loaded` are the modules imported while building the model, like type, struct or helper modules.
+    """
+    pymodnames: set[str] = set()
+    for pymodname in chain((cls.__module__ for modcls in modclss for cls in modcls.__mro__), loaded):
+        if pymodname in pymodnames:
+            continue
+        pymodnames.add(pymodname)
+        filename = getattr(sys.modules.get(pymodname), "__file__", None)
+        if not filename:
+            continue
+        filepath = Path(filename)
+        if "site-packages" in filepath.parts or "dist-packages" in filepath.parts or filepath.is_relative_to(_STDLIB):
+            continue
+        mtime_ns = _get_mtime_ns(filepath)
+        if mtime_ns is not None:
+            yield pymodname, filepath, mtime_ns
+
+
+def _is_uptodate(depends: Iterable[tuple[str, Path, int]]) -> bool:
+    return all(_get_mtime_ns(filepath) == mtime_ns for _, filepath, mtime_ns in depends)
+
+
+def _get_mtime_ns(filepath: Path) -> int | None:
+    try:
+        return filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
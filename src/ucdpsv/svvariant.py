@@ -0,0 +1,146 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Define And Parameter Variants.
+
+The same hierarchy is often generated for several define sets and parameter corners:
+
+    >>> import ucdpsv as usv
+    >>> from pathlib import Path
+    >>> variants = (
+    ...     usv.SvVariant(name="asic", defines={"ASIC": None}, outpath=Path("build/asic")),
+    ...     usv.SvVariant(name="fpga", defines={"FPGA": None}, outpath=Path("build/fpga")),
+    ... )
+
+`usv.generate_variants(TopMod, variants, "hdl", basepath=Path("."))` generates all variants in one pass.
+Every variant builds its own model, but all variants share one makolator with its compiled templates
+and one `SvCache`: module bodies, which are not touched by defines or parameters, are rendered once.
+The output of every variant is identical to a separate `u.generate` run.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import ucdp as u
+from makolator import Makolator
+
+from .svcache import SvCache
+
+
+class SvVariant(u.Object):
+    """
+    Define And Parameter Variant.
+
+    Attributes:
+        name: Variant Name.
+        defines: Defines of the top module.
+        params: Keyword arguments for the top module class, i.e. fields of tailored modules.
+        target: Target Filter. The `target` of `generate_variants` by default.
+        outpath: Output Directory. Generated files are relocated from `basepath` to `outpath`.
+            Files are written to their original location, if `None`.
+    """
+
+    name: str
+    defines: dict[str, Any] | None = None
+    params: dict[str, Any] = u.Field(default_factory=dict)
+    target: str | None = None
+    outpath: Path | None = None
+
+
+def generate_variants(
+    modcls: type[u.BaseMod],
+    variants: Iterable[SvVariant],
+    name: str,
+    *,
+    target: str | None = None,
+    basepath: Path | None = None,
+    makolator: Makolator | None = None,
+    maxworkers: int | None = None,
+    paths: Iterable[Path] | None = None,
+    data: dict[str, Any] | None = None,
+) -> dict[str, u.BaseMod]:
+    """
+    Generate All `variants` Of Top Module `modcls`.
+
+    Args:
+        modcls: Top Module Class.
+        variants: Variants.
+        name: Filelist Name.
+
+    Keyword Args:
+        target: Target Filter, if the variant has none.
+        basepath: Directory, which is relocated to `SvVariant.outpath`. Current working directory by default.
+        makolator: Specific Makolator.
+        maxworkers: Maximal Parallelism.
+        paths: Search Path For Data Model And Template Files.
+        data: Data added to the datamodel. An `SvCache` is added, if there is none.
+
+    Returns:
+        Top Module per variant name.
+    """
+    basepath = Path(basepath or Path.cwd()).resolve()
+    makolator = makolator or u.get_makolator(paths=paths)
+    data = dict(data or {})
+    data.setdefault("svcache", SvCache())
+    # check all before generating any
+    variants = tuple(variants)
+    names: set[str] = set()
+    for variant in variants:
+        if variant.name in names:
+            raise ValueError(f"Variant {variant.name!r} is not unique")
+        names.add(variant.name)
+    mods: dict[str, u.BaseMod] = {}
+    for variant in variants:
+        mod = mods[variant.name] = modcls(defines=variant.defines, **variant.params)
+        filelistparser = None
+        if variant.outpath is not None:
+            filelistparser = _RelocatingFileListParser(basepath=basepath, outpath=Path(variant.outpath).resolve())
+        u.generate(
+            mod,
+            name,
+            target=variant.target or target,
+            filelistparser=filelistparser,
+            makolator=makolator,
+            maxworkers=maxworkers,
+            paths=paths,
+            data=data,
+        )
+    return mods
+
+
+class _RelocatingFileListParser(u.FileListParser):
+    """File List Parser, Which Relocates All Files From `basepath` To `outpath`."""
+
+    basepath: Path
+    outpath: Path
+
+    def normalize(self, basedir: Path, path: Path, replace_envvars: bool) -> Path:
+        filepath = super().normalize(basedir, path, replace_envvars)
+        try:
+            return self.outpath / Path(filepath).resolve().relative_to(self.basepath)
+        except ValueError:
+            raise ValueError(f"Generated files must be located within {self.basepath}") from None
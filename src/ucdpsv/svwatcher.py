@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Watcher For Imported SystemVerilog Files.
+
+`import_params_ports` records every imported file (see `get_svimports`).
+`SvWatcher` reports imports, whose file content changed:
+
+    >>> import ucdpsv as usv
+    >>> def on_change(svimports):
+    ...     print(sorted({svimport.modcls.__name__ for svimport in svimports}))
+    >>> watcher = usv.SvWatcher(callback=on_change)
+
+`watcher.start()` watches in a background thread until `watcher.stop()`.
+Linux `inotify` is used if available, otherwise the files are polled every `interval` seconds.
+`watcher.check()` runs one check synchronously.
+
+Affected modules are re-imported by building their top modules again (see `SvServer`).
+Unchanged files are not parsed again, as parse results are cached per file content.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+from collections.abc import Callable
+from pathlib import Path
+from threading import Event, Thread
+
+import ucdp as u
+
+from .svimporter import SvImport, get_filehash, get_svimports
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_IN_NONBLOCK = os.O_NONBLOCK
+_BUFSIZE = 64 * 1024
+
+
+class SvWatcher(u.Object):
+    """
+    Watcher For Imported SystemVerilog Files.
+
+    Attributes:
+        callback: Called with all `SvImport`s, whose file changed.
+        interval: Polling interval in seconds and maximum latency of `stop`.
+        use_inotify: Use Linux `inotify` if available.
+    """
+
+    callback: Callable[[tuple[SvImport, ...]], None]
+    interval: float = 1.0
+    use_inotify: bool = True
+
+    _stats: dict[Path, tuple[tuple[int, int], str]] = u.PrivateField(default_factory=dict)
+    _reported: dict[tuple[type, Path], str] = u.PrivateField(default_factory=dict)
+    _stop: Event = u.PrivateField(default_factory=Event)
+    _thread: Thread | None = u.PrivateField(default=None)
+
+    def check(self) -> tuple[SvImport, ...]:
+        """
+        Check All Imported Files Once.
+
+        Calls `callback` with all imports, whose file content differs from the imported one
+        and returns them. Every change is reported once.
+        """
+        changed = []
+        filehashes: dict[Path, str] = {}
+        for svimport in get_svimports():
+            filepath = svimport.filepath
+            filehash = filehashes.get(filepath)
+            if filehash is None:
+                filehash = filehashes[filepath] = self._get_filehash(filepath)
+            key = (svimport.modcls, filepath)
+            if filehash != svimport.filehash and self._reported.get(key) != filehash:
+                self._reported[key] = filehash
+                changed.append(svimport)
+        if changed:
+            self.callback(tuple(changed))
+        return tuple(changed)
+
+    def _get_filehash(self, filepath: Path) -> str:
+        # hash just files with modified timestamp or size
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            return ""
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._stats.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        filehash = get_filehash(filepath)
+        self._stats[filepath] = key, filehash
+        return filehash
+
+    def start(self) -> None:
+        """Start Watching In A Background Thread."""
+        if self._thread is not None:
+            raise RuntimeError("Watcher is already running")
+        self._stop.clear()
+        self._thread = Thread(target=self.run, daemon=True, name="SvWatcher")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop Watching And Wait For The Background Thread."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def run(self) -> None:
+        """Watch Until `stop`."""
+        inotify = _Inotify.create() if self.use_inotify else None
+        try:
+            while not self._stop.is_set():
+                self.check()
+                if inotify is None:
+                    self._stop.wait(self.interval)
+                else:
+                    inotify.watch({svimport.filepath.parent for svimport in get_svimports()})
+                    inotify.wait(self.interval)
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+class _Inotify:
+    """Minimal Linux inotify binding, just to wake up on directory changes."""
+
+    def __init__(self, libc, fd: int):
+        self.libc = libc
+        self.fd = fd
+        self.dirpaths: set[Path] = set()
+
+    @staticmethod
+    def create() -> "_Inotify | None":
+        libname = ctypes.util.find_library("c")
+        try:
+            libc = ctypes.CDLL(libname, use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return _Inotify(libc, fd)
+
+    def watch(self, dirpaths: set[Path]) -> None:
+        for dirpath in dirpaths - self.dirpaths:
+            # Directories are watched, as editors tend to replace files instead of modifying them.
+            if self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), _IN_MASK) >= 0:
+                self.dirpaths.add(dirpath)
+
+    def wait(self, timeout: float) -> None:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if readable:
+            # drain all pending events - checking files is done by hash anyway
+            try:
+                while os.read(self.fd, _BUFSIZE):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
@@ -22,6 +22,8 @@
 ## SOFTWARE.
 ##
 <%!
+from itertools import chain
+
 import ucdp as u
 import ucdpsv as usv
 %>
@@ -62,13 +64,14 @@ ${self.footer()}\
 </%block>
 
 <%def name="copyright(obj=None)">\
-${u.get_copyright(obj or mod) | comment}
+${usv.get_copyright(obj or mod, datamodel=datamodel) | comment}
 </%def>\
 
 <%def name="fileheader()">\
 <%
 overview = mod.get_overview()
-topmodref = u.TopModRef.from_mod(mod)
+headerinfo = usv.get_fileheader(mod, basedir=output_filepath.parent, datamodel=datamodel)
+topmodref = headerinfo.topmodref
 %>\
 //
 % if topmodref:
@@ -80,7 +83,7 @@ topmodref = u.TopModRef.from_mod(mod)
 // Library:     ${mod.libname}
 // Module:      ${mod.modname}
 // Data Model:  ${mod.__class__.__name__}
-//              ${u.modutil.get_file(mod.__class__, basedir=output_filepath.parent).as_posix()}
+//              ${headerinfo.filepath.as_posix()}
 % if mod.insts:
 // Submodules:
 %   for modinst in mod.insts:
@@ -108,14 +111,14 @@ ${overview | comment}
 
 <%def name="beginmod(wirenames=None)">\
 <%
-rslvr = usv.get_resolver(mod)
+rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
 params = rslvr.get_paramdecls(mod.namespace, indent=2)
 ports = rslvr.get_portdecls(mod.ports, wirenames=wirenames, indent=2)
 %>\
 module ${mod.modname}\
 % if params:
  #(
-${params.get()}
+${self.emit(params)}
 )\
 % endif
 % if ports:
@@ -124,7 +127,7 @@ ${params.get()}
 %   else:
  (
 %   endif
-${ports.get()}
+${self.emit(ports)}
 )\
 % else:
 ()\
@@ -135,23 +138,42 @@ ${ports.get()}
 
 <%def name="params(is_last=False)">\
 <%
-rslvr = usv.get_resolver(mod)
+rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
 params = rslvr.get_paramdecls(mod.namespace, is_last=is_last)
 %>\
-${params.get()}
+${self.emit(params)}
 </%def>
 
 
 <%def name="ports(is_last=False, wirenames=None, no_comments=False)">\
 <%
-rslvr = usv.get_resolver(mod)
+rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
 ports = rslvr.get_portdecls(mod.ports, is_last=is_last, wirenames=wirenames, no_comment=no_comments)
 %>\
-${ports.get()}
+${self.emit(ports)}
 </%def>
 
 
 <%def name="logic(indent=0, skip=None)">\
+## Modules with identical fingerprint share the rendered logic, if an `svcache` is given.
+## The cache needs the logic as one text, so it is captured instead of being emitted line-by-line.
+<%
+  svcache = usv.get_svcache(datamodel)
+%>\
+% if svcache is None:
+${self.uncached_logic(indent=indent, skip=skip)}\
+% else:
+<%
+  fingerprint = usv.get_fingerprint(mod, svoptions=usv.get_svoptions(datamodel))
+  key = f"{self.uri}:{usv.get_templatehash(self)}:{indent}:{skip}:{fingerprint}"
+  text = svcache.get_or_render(key, lambda: capture(self.uncached_logic, indent=indent, skip=skip))
+%>\
+${text}\
+% endif
+</%def>
+
+
+<%def name="uncached_logic(indent=0, skip=None)">\
 <%
 skip = u.split(skip)
 %>\
@@ -178,19 +200,19 @@ ${self.assigns(indent=indent)}\
 
 <%def name="localparams(indent=0, title='Local Parameter')">\
 <%
-rslvr = usv.get_resolver(mod)
+rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
 align = rslvr.get_localparamdecls(mod.namespace, indent=indent)
 pre = " " * indent
 %>\
 % if align:
-%   if title:
+%   if title and not rslvr.lean:
 
 
 ${pre}// ------------------------------------------------------
 ${pre}//  ${title}
 ${pre}// ------------------------------------------------------
 %   endif
-${align.get()}
+${self.emit(align)}
 % endif
 </%def>
 
@@ -199,29 +221,50 @@ ${align.get()}
 <%
 if idents is None:
   idents = mod.portssignals
-rslvr = usv.get_resolver(mod)
+rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
 align = rslvr.get_signaldecls(idents, indent=indent, wirenames=wirenames)
 pre = " " * indent
 %>\
 % if align:
-%   if title:
+%   if title and not rslvr.lean:
 
 
 ${pre}// ------------------------------------------------------
 ${pre}//  ${title}
 ${pre}// ------------------------------------------------------
 %   endif
-${align.get()}
+${self.emit(align)}
 % endif
 </%def>
 
 
 <%def name="insts(indent=0)">\
-% for modinst in mod.insts:
-%   if not modinst.virtual:
+<%
+  svoptions = usv.get_svoptions(datamodel)
+  rslvr = usv.get_resolver(mod, svoptions=svoptions)
+  svinsts = usv.get_svinsts(mod, svoptions=svoptions, datamodel=datamodel)
+  modinsts = [svinst.inst for svinst in svinsts.values() if not svinst.inst.virtual]
+  if svoptions.generate_loops and "idx" not in mod.namespace:
+    groups = rslvr.group_insts(modinsts)
+  else:
+    groups = [[modinst] for modinst in modinsts]
+%>\
+% for group in groups:
+<%
+  sources = None
+  if len(group) > 1:
+    sources = rslvr.get_instloop_sources([svinsts[modinst.name].instcons for modinst in group], "idx")
+%>\
+%   if sources is None:
+%     for modinst in group:
 
 
 ${inst(modinst, indent)}
+%     endfor
+%   else:
+
+
+${instloop(group, sources, indent)}
 %   endif
 % endfor
 </%def>
@@ -229,22 +272,25 @@ ${inst(modinst, indent)}
 
 <%def name="inst(inst, indent=0)">\
 <%
-  inst = mod.get_inst(inst)
+  svinst = usv.get_svinst(mod, inst, svoptions=usv.get_svoptions(datamodel), datamodel=datamodel)
+  inst = svinst.inst
   pre = " " * indent
   comment = inst.doc.comment or f"{inst.libname}.{inst.modname}: {inst.name}"
-  rslvr = usv.get_resolver(mod, inst=inst)
-  params = rslvr.get_instparams(inst, indent=indent+2)
-  ports = rslvr.get_instcons(mod.get_instcons(inst), indent=indent+2)
+  rslvr = svinst.resolver
+  params = rslvr.get_instparams(inst, indent=indent+2, params=svinst.params)
+  ports = rslvr.get_instcons(svinst.instcons, indent=indent+2)
 %>\
+% if not rslvr.lean:
 ${pre}// ------------------------------------------------------
-% for line in comment.split("\n"):
+%   for line in comment.split("\n"):
 ${pre}//  ${line}
-% endfor
+%   endfor
 ${pre}// ------------------------------------------------------
+% endif
 ${pre}${inst.modname}\
 % if params:
  #(
-${params.get()}
+${self.emit(params)}
 ${pre}) ${inst.name}\
 % else:
  ${inst.name}\
@@ -255,7 +301,7 @@ ${pre}) ${inst.name}\
 %   else:
  (
 %   endif
-${ports.get()}
+${self.emit(ports)}
 ${pre})\
 % else:
  ()\
@@ -264,55 +310,122 @@ ${pre})\
 </%def>
 
 
+<%def name="instloop(insts, sources, indent=0)">\
+<%
+  svinst = usv.get_svinst(mod, insts[0], svoptions=usv.get_svoptions(datamodel), datamodel=datamodel)
+  inst = svinst.inst
+  base = inst.name[:-1]
+  pre = " " * indent
+  rslvr = svinst.resolver
+  params = rslvr.get_instparams(inst, indent=indent+4, params=svinst.params)
+  ports = rslvr.get_instcons(svinst.instcons, indent=indent+4, sources=sources)
+%>\
+% if not rslvr.lean:
+${pre}// ------------------------------------------------------
+${pre}//  ${inst.libname}.${inst.modname}: ${base}0..${base}${len(insts) - 1}
+${pre}// ------------------------------------------------------
+% endif
+${pre}for (genvar idx = 0; idx < ${len(insts)}; idx++) begin : gen_${base}
+${pre}  ${inst.modname}\
+% if params:
+ #(
+${self.emit(params)}
+${pre}  ) ${base}\
+% else:
+ ${base}\
+% endif
+% if ports:
+ (
+${self.emit(ports)}
+${pre}  )\
+% else:
+ ()\
+% endif
+;
+${pre}end\
+</%def>
+
+
 <%def name="instparams(inst, is_last=False, indent=0)">\
 <%
-  inst = mod.get_inst(inst)
-  rslvr = usv.get_resolver(mod)
-  align = rslvr.get_instparams(inst, is_last=is_last, indent=indent)
+  svoptions = usv.get_svoptions(datamodel)
+  svinst = usv.get_svinst(mod, inst, svoptions=svoptions, datamodel=datamodel)
+  rslvr = usv.get_resolver(mod, svoptions=svoptions)
+  align = rslvr.get_instparams(svinst.inst, is_last=is_last, indent=indent, params=svinst.params)
 %>\
-${align.get()}
+${self.emit(align)}
 </%def>
 
 
 <%def name="instcons(inst, skips=None, is_last=False, indent=0)">\
 <%
-  inst = mod.get_inst(mod)
-  rslvr = usv.get_resolver(mod)
-  align = rslvr.get_instcons(mod.get_instcons(inst), skips=skips, is_last=is_last, indent=indent)
+  svoptions = usv.get_svoptions(datamodel)
+  svinst = usv.get_svinst(mod, inst, svoptions=svoptions, datamodel=datamodel)
+  rslvr = usv.get_resolver(mod, svoptions=svoptions)
+  align = rslvr.get_instcons(svinst.instcons, skips=skips, is_last=is_last, indent=indent)
 %>\
-${align.get()}
+${self.emit(align)}
 </%def>
 
 
 <%def name="flipflops(indent=0)">\
 <%
-  rslvr = usv.get_resolver(mod)
+  svoptions = usv.get_svoptions(datamodel)
+  rslvr = usv.get_resolver(mod, svoptions=svoptions)
   flipflops = mod.flipflops
   pre = " " * indent
+  dly = f"<= {rslvr.ff_dly}"
 %>\
-% if flipflops:
+% if flipflops and not rslvr.lean:
 
 
 ${pre}// ------------------------------------------------------
 ${pre}//  Flip-Flops
 ${pre}// ------------------------------------------------------
 % endif
-% for idx, flipflop in enumerate(flipflops):
-
+% for idx, group in enumerate(rslvr.group_flipflops(flipflops, merge=svoptions.merge_flipflops)):
+<% flipflop = group[0] %>
 ${pre}always_ff @(posedge ${flipflop.clk.name} or negedge ${flipflop.rst_an.name}) begin: proc_seq_${idx}
+%   if len(group) == 1:
+<% defaults = rslvr.get_defaults(flipflop.defaults(), indent=indent+4, oper="<= ") %>\
 ${pre}  if (${flipflop.rst_an.name} == 1'b0) begin
-${rslvr.get_defaults(flipflop.defaults(), indent=indent+4, oper="<= ").get()}
-% if flipflop.rst is not None:
+${self.emit(defaults)}
+%     if flipflop.rst is not None:
 ${pre}  end else if (${rslvr.resolve(flipflop.rst)}) begin
-${rslvr.get_defaults(flipflop.defaults(), indent=indent+4, oper="<= ").get()}
-% endif
-% if flipflop.ena is not None:
+${self.emit(defaults)}
+%     endif
+%     if flipflop.ena is not None:
 ${pre}  end else if (${rslvr.resolve(flipflop.ena)}) begin
-% else:
+%     else:
 ${pre}  end else begin
-% endif
-${rslvr.get_assigns(flipflop, indent=indent+4, oper=f"<= {rslvr.ff_dly}").get()}
+%     endif
+${self.emit(rslvr.get_assigns(flipflop, indent=indent+4, oper=dly))}
 ${pre}  end
+%   else:
+${pre}  if (${flipflop.rst_an.name} == 1'b0) begin
+${self.emit(rslvr.get_defaults(chain.from_iterable(ff.defaults() for ff in group), indent=indent+4, oper="<= "))}
+${pre}  end else begin
+%     for flipflop in group:
+%       if flipflop.rst is None and flipflop.ena is None:
+${self.emit(rslvr.get_assigns(flipflop, indent=indent+4, oper=dly))}
+%       else:
+%         if flipflop.rst is not None:
+${pre}    if (${rslvr.resolve(flipflop.rst)}) begin
+${self.emit(rslvr.get_defaults(flipflop.defaults(), indent=indent+6, oper="<= "))}
+%           if flipflop.ena is not None:
+${pre}    end else if (${rslvr.resolve(flipflop.ena)}) begin
+%           else:
+${pre}    end else begin
+%           endif
+%         else:
+${pre}    if (${rslvr.resolve(flipflop.ena)}) begin
+%         endif
+${self.emit(rslvr.get_assigns(flipflop, indent=indent+6, oper=dly))}
+${pre}    end
+%       endif
+%     endfor
+${pre}  end
+%   endif
 ${pre}end
 % endfor
 </%def>
@@ -329,38 +442,46 @@ ${mux(mux_, indent)}\
 
 <%def name="mux(mux, indent=0)">\
 <%
-  rslvr = usv.get_resolver(mod)
+  rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
   mux = mod.get_mux(mux)
   pre = " " * indent
   comment = mux.doc.comment or f"Multiplexer {mux.name}"
 %>\
+% if not rslvr.lean:
 ${pre}// ------------------------------------------------------
-% for line in comment.split("\n"):
+%   for line in comment.split("\n"):
 ${pre}//  ${line}
-% endfor
+%   endfor
 ${pre}// ------------------------------------------------------
+% endif
 % if mux:
 ${pre}always_comb begin : proc_${mux.name}
+%   if not rslvr.lean:
 ${pre}  // defaults
-${rslvr.get_assigns(mux.defaults(), indent=indent+2, oper="=").get()}
+%   endif
+${self.emit(rslvr.get_assigns(mux.defaults(), indent=indent+2, oper="="))}
 %   for sel, conds in mux:
 
-${pre}  case (${sel}) inside
+${pre}  case (${rslvr.resolve(sel)}) inside
 <% cases, defaultcase = rslvr.split_mux_conds(sel, conds) %>\
 %     for cond, assigns in cases:
 ${pre}    ${cond}: begin
-${rslvr.get_assigns(assigns, indent=indent+6, oper="=").get()}
+${self.emit(rslvr.get_assigns(assigns, indent=indent+6, oper="="))}
 ${pre}    end
 %     endfor
 %   if defaultcase:
+%     if rslvr.lean:
+${pre}    default: begin
+%     else:
 ${pre}    default: begin // ${defaultcase[0]}
-${rslvr.get_assigns(defaultcase[1], indent=indent+6, oper="=").get()}
+%     endif
+${self.emit(rslvr.get_assigns(defaultcase[1], indent=indent+6, oper="="))}
 ${pre}    end
 %   endif
 ${pre}  endcase
 %   endfor
 ${pre}end
-% else:
+% elif not rslvr.lean:
 ${pre}// empty
 % endif
 </%def>
@@ -368,22 +489,34 @@ ${pre}// empty
 
 <%def name="assigns(indent=0, title='Assigns')">\
 <%
-  rslvr = usv.get_resolver(mod)
+  rslvr = usv.get_resolver(mod, svoptions=usv.get_svoptions(datamodel))
   align = rslvr.get_assigns(mod.assigns, indent=indent)
   pre = " " * indent
 %>\
 % if align:
-%   if title:
+%   if title and not rslvr.lean:
 
 ${pre}// ------------------------------------------------------
 ${pre}//  Assigns
 ${pre}// ------------------------------------------------------
 %   endif
-${align.get()}
+${self.emit(align)}
 % endif
 </%def>
 
 
+<%def name="emit(align)">\
+## Write aligned lines one-by-one to the output, instead of building the whole block as string.
+<%
+  sep = ""
+  for line in align:
+    context.write(sep)
+    context.write(line)
+    sep = "\n"
+%>\
+</%def>
+
+
 <%def name="endmod()">\
 endmodule // ${mod.modname}
 </%def>
@@ -0,0 +1,127 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Generation Time Serial, With Threads And With Processes.
+
+Usage:
+
+    python -m tests.benchmark_svgenerate [TOPREF] [MAXWORKERS]
+
+`TOPREF` is generated (a synthetic hierarchy of `tests.benchmark_svgenerate.BenchTopMod` by default).
+
+* serial: one thread renders all files.
+* threads: `MAXWORKERS` threads render the files of one shared, in-memory model.
+* processes: `MAXWORKERS` processes load the model on their own and render a share of the sub-module trees each.
+
+Threads scale with free-threaded Python (i.e. 3.13t) only, as rendering is CPU bound.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import ucdp as u
+
+NAME = "hdl"
+
+
+class BenchLeafMod(u.ATailoredMod):
+    """Leaf."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (
+        u.ModFileList(name=NAME, gen="full", filepaths=("$PRJ/{mod.modname}.sv",), template_filepaths=("sv.mako",)),
+    )
+    width: int = 8
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(u.UintType(self.width), "data_i")
+        self.add_port(u.UintType(self.width), "data_o")
+        for idx in range(8):
+            self.add_flipflop(u.UintType(self.width), f"data{idx}_r", "main_clk_i", "main_rst_an_i", nxt="data_i")
+        self.assign("data_o", "data7_r")
+
+
+class BenchTopMod(u.AMod):
+    """Top With Many Different Leaves."""
+
+    filelists: u.ClassVar[u.ModFileLists] = BenchLeafMod.filelists
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        for width in range(1, 129):
+            leaf = BenchLeafMod(self, f"u_leaf{width}", width=width)
+            leaf.con("main_i", "main_i")
+            leaf.con("data_i", f"create(data{width}_i)")
+            leaf.con("data_o", f"create(data{width}_o)")
+
+
+def generate(topref: str, prjpath: Path, maxworkers: int = 1, index: int = 0, count: int = 1) -> None:
+    """Generate `topref` Or Share `index` Of `count` - The Top Module And Every `count`-th Sub-Module Tree."""
+    with mock.patch.dict(os.environ, {"PRJ": str(prjpath)}):
+        top = u.load(topref)
+        makolator = u.get_makolator(verbose=False)
+        if count == 1:
+            u.generate(top.mod, NAME, makolator=makolator, maxworkers=maxworkers)
+            return
+        if index == 0:
+            u.generate(top.mod, NAME, makolator=makolator, maxworkers=maxworkers, maxlevel=1)
+        for inst in tuple(top.mod.insts)[index::count]:
+            u.generate(inst, NAME, makolator=makolator, maxworkers=maxworkers)
+
+
+def measure(topref: str, mode: str, maxworkers: int) -> float:
+    """Generation Time Of `topref` In Seconds."""
+    with TemporaryDirectory() as tmpdir:
+        prjpath = Path(tmpdir)
+        start = time.perf_counter()
+        if mode == "serial":
+            generate(topref, prjpath)
+        elif mode == "threads":
+            generate(topref, prjpath, maxworkers=maxworkers)
+        else:
+            with ProcessPoolExecutor(max_workers=maxworkers) as exe:
+                jobs = [exe.submit(generate, topref, prjpath, 1, idx, maxworkers) for idx in range(maxworkers)]
+                for job in jobs:
+                    job.result()
+        return time.perf_counter() - start
+
+
+def main(topref: str, maxworkers: int) -> None:
+    """Print Generation Time Of All Modes."""
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{topref}: {maxworkers} workers, GIL {'enabled' if gil else 'disabled'}")
+    for mode in ("serial", "threads", "processes"):
+        print(f"{mode:10s} {measure(topref, mode, maxworkers):8.2f} s")
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else "tests.benchmark_svgenerate.BenchTopMod",
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,73 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Throughput Of The Parser Backends In MB/s.
+
+Usage:
+
+    python -m tests.benchmark_svscanner [FILE_OR_DIR ...]
+
+All `*.sv` and `*.v` files of the given files and directories are parsed (`tests/testdata/sv` by default).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import ucdpsv as usv
+
+MIN_DURATION = 1.0
+
+
+def measure(backend: usv.SvBackend, texts: list[tuple[Path, str]]) -> float:
+    """Parse `texts` repeatedly for at least `MIN_DURATION` seconds and return the throughput in MB/s."""
+    size = sum(len(text.encode()) for _, text in texts)
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for filepath, text in texts:
+            backend.parse_text(text, filepath=filepath)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_DURATION:
+            return rounds * size / elapsed / 1e6
+
+
+def main(paths: list[Path]) -> None:
+    """Print Throughput Of All Backends."""
+    filepaths = []
+    for path in paths:
+        if path.is_dir():
+            filepaths.extend(sorted((*path.rglob("*.sv"), *path.rglob("*.v"))))
+        else:
+            filepaths.append(path)
+    texts = [(filepath, filepath.read_text()) for filepath in filepaths]
+    size = sum(len(text.encode()) for _, text in texts)
+    print(f"{len(texts)} files, {size / 1e3:.1f} kB")
+    for backend in (usv.HdlParserBackend(), usv.SvScanner()):
+        print(f"{backend.__class__.__name__:20s} {measure(backend, texts):8.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or [Path(__file__).parent / "testdata" / "sv"])
@@ -0,0 +1,120 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.flipflop
+//
+// Library:     top
+// Module:      flipflop
+// Data Model:  FlipflopMod
+//              top/flipflop.py
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module flipflop (
+  // main_i: Clock and Reset
+  input wire       main_clk_i,     // Clock
+  input wire       main_rst_an_i,  // Async Reset (Low-Active)
+  // other_i: Clock and Reset
+  input wire       other_clk_i,    // Clock
+  input wire       other_rst_an_i, // Async Reset (Low-Active)
+  // -
+  input wire       clr_i,
+  input wire       ena_i,
+  input wire [7:0] data_i
+);
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [7:0] plain_r;
+  logic [7:0] clr_r;
+  logic [7:0] ena_r;
+  logic [7:0] both_r;
+  logic [7:0] other_r;
+  logic       plain2_r;
+
+
+  // ------------------------------------------------------
+  //  Flip-Flops
+  // ------------------------------------------------------
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_seq_0
+    if (main_rst_an_i == 1'b0) begin
+      plain_r  <=  8'h00;
+      plain2_r <=  1'b0;
+      clr_r    <=  8'h00;
+      ena_r    <=  8'h00;
+      both_r   <=  8'h03;
+    end else begin
+      plain_r  <=  data_i;
+      plain2_r <=  ena_i;
+      if (clr_i == 1'b1) begin
+        clr_r <=  8'h00;
+      end else begin
+        clr_r <=  data_i;
+      end
+      if (ena_i == 1'b1) begin
+        ena_r <=  data_i;
+      end
+      if (clr_i == 1'b1) begin
+        both_r <=  8'h03;
+      end else if (ena_i == 1'b1) begin
+        both_r <=  data_i;
+      end
+    end
+  end
+
+  always_ff @(posedge other_clk_i or negedge other_rst_an_i) begin: proc_seq_1
+    if (other_rst_an_i == 1'b0) begin
+      other_r <=  8'h00;
+    end else begin
+      other_r <=  data_i;
+    end
+  end
+
+endmodule // flipflop
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,155 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.lanes
+//
+// Library:     top
+// Module:      lanes
+// Data Model:  LanesMod
+//              top/lanes.py
+// Submodules:
+//              lane u_lane0
+//              lane u_lane1
+//              lane u_lane2
+//              lane u_lane3
+//              lane u_other0
+//              lane u_other1
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module lanes (
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,    // Clock
+  input  wire         main_rst_an_i, // Async Reset (Low-Active)
+  // -
+  input  wire  [31:0] data_i,
+  output logic [31:0] data_o,
+  input  wire  [3:0]  ena_i,
+  input  wire  [7:0]  other_i
+);
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [7:0] other_s;
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_lane0
+  // ------------------------------------------------------
+  lane u_lane0 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (data_i[7:0]  ),
+    .data_o       (data_o[7:0]  ),
+    .ena_i        (ena_i[0]     )
+  );
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_lane1
+  // ------------------------------------------------------
+  lane u_lane1 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (data_i[15:8] ),
+    .data_o       (data_o[15:8] ),
+    .ena_i        (ena_i[1]     )
+  );
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_lane2
+  // ------------------------------------------------------
+  lane u_lane2 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (data_i[23:16]),
+    .data_o       (data_o[23:16]),
+    .ena_i        (ena_i[2]     )
+  );
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_lane3
+  // ------------------------------------------------------
+  lane u_lane3 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (data_i[31:24]),
+    .data_o       (data_o[31:24]),
+    .ena_i        (ena_i[3]     )
+  );
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_other0
+  // ------------------------------------------------------
+  lane u_other0 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (other_i      ),
+    .data_o       (other_s      ),
+    .ena_i        (1'b0         )  // TODO
+  );
+
+
+  // ------------------------------------------------------
+  //  top.lane: u_other1
+  // ------------------------------------------------------
+  lane #(
+    .width_p(8)
+  ) u_other1 (
+    .main_clk_i   (main_clk_i   ), // Clock
+    .main_rst_an_i(main_rst_an_i), // Async Reset (Low-Active)
+    .data_i       (other_s      ),
+    .data_o       (             ), // TODO
+    .ena_i        (1'b0         )  // TODO
+  );
+
+endmodule // lanes
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
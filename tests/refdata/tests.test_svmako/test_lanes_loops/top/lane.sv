@@ -0,0 +1,93 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.lanes.LaneMod
+//
+// Library:     top
+// Module:      lane
+// Data Model:  LaneMod
+//              top/lanes.py
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module lane #(
+  parameter integer width_p = 8
+) (
+  // main_i: Clock and Reset
+  input  wire                main_clk_i,    // Clock
+  input  wire                main_rst_an_i, // Async Reset (Low-Active)
+  // -
+  input  wire  [width_p-1:0] data_i,
+  output logic [width_p-1:0] data_o,
+  input  wire                ena_i
+);
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  logic [width_p-1:0] data_r;
+
+
+  // ------------------------------------------------------
+  //  Flip-Flops
+  // ------------------------------------------------------
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_seq_0
+    if (main_rst_an_i == 1'b0) begin
+      data_r <=  {width_p {1'b0}};
+    end else if (ena_i == 1'b1) begin
+      data_r <=  data_i;
+    end
+  end
+
+  // ------------------------------------------------------
+  //  Assigns
+  // ------------------------------------------------------
+  assign data_o = data_r;
+
+endmodule // lane
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
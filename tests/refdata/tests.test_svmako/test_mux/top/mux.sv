@@ -53,7 +53,8 @@ module mux (
   input  wire  [7:0] c1_i,
   output logic [7:0] q1_o,
   output logic [7:0] q2_o,
-  output logic [3:0] q4_o
+  output logic [3:0] q4_o,
+  output logic [3:0] q5_o
 );
 
 
@@ -139,6 +140,30 @@ module mux (
 
   end
 
+
+  // ------------------------------------------------------
+  //  Multiplexer grouped
+  // ------------------------------------------------------
+  always_comb begin : proc_grouped
+    // defaults
+    q5_o = 4'h0;
+
+    case (sel_s) inside
+      3'h1, 3'h3: begin
+        q5_o = b0_i;
+      end
+      3'h2, 3'h5: begin
+        q5_o = a0_i;
+      end
+      3'h4: begin
+        q5_o = c0_i;
+      end
+      default: begin // 3'h0
+        q5_o = a0_i;
+      end
+    endcase
+  end
+
 endmodule // mux
 
 `default_nettype wire
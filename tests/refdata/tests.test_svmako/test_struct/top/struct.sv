@@ -0,0 +1,178 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.struct
+//
+// Library:     top
+// Module:      struct
+// Data Model:  StructMod
+//              top/struct.py
+// Submodules:
+//              struct_sub u_sub0
+//              struct_sub u_sub1
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module struct (
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,    // Clock
+  input  wire         main_rst_an_i, // Async Reset (Low-Active)
+  // pix_i
+  input  wire         pix_valid_i,   // Pixel is valid
+  input  wire  [7:0]  pix_red_i,
+  input  wire  [7:0]  pix_green_i,
+  input  wire  [7:0]  pix_blue_i,
+  // pix_o
+  output logic        pix_valid_o,   // Pixel is valid
+  output logic [7:0]  pix_red_o,
+  output logic [7:0]  pix_green_o,
+  output logic [7:0]  pix_blue_o,
+  // swap_o
+  output logic        swap_valid_o,  // Pixel is valid
+  output logic [7:0]  swap_red_o,
+  output logic [7:0]  swap_green_o,
+  output logic [7:0]  swap_blue_o,
+  // bus_i
+  input  wire  [1:0]  bus_trans_i,
+  input  wire  [31:0] bus_addr_i,
+  input  wire         bus_write_i,
+  input  wire  [31:0] bus_wdata_i,
+  output logic        bus_ready_o,
+  output logic        bus_resp_o,
+  output logic [31:0] bus_rdata_o,
+  // -
+  output logic [7:0]  red_o,
+  output logic [7:0]  color_o
+);
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  // pix_s
+  logic       pix_valid_s; // Pixel is valid
+  logic [7:0] pix_red_s;
+  logic [7:0] pix_green_s;
+  logic [7:0] pix_blue_s;
+  // -
+  logic       valid_r;
+
+
+  // ------------------------------------------------------
+  //  top.struct_sub: u_sub0
+  // ------------------------------------------------------
+  struct_sub u_sub0 (
+    .pix_valid_i(pix_valid_i), // Pixel is valid
+    .pix_red_i  (pix_red_i  ),
+    .pix_green_i(pix_green_i),
+    .pix_blue_i (pix_blue_i ),
+    .pix_valid_o(pix_valid_s), // Pixel is valid
+    .pix_red_o  (pix_red_s  ),
+    .pix_green_o(pix_green_s),
+    .pix_blue_o (pix_blue_s )
+  );
+
+
+  // ------------------------------------------------------
+  //  top.struct_sub: u_sub1
+  // ------------------------------------------------------
+  struct_sub u_sub1 (
+    .pix_valid_i(pix_valid_i), // Pixel is valid
+    .pix_red_i  (pix_green_i),
+    .pix_green_i(8'h00      ), // TODO
+    .pix_blue_i (8'h00      ), // TODO
+    .pix_valid_o(           ), // TODO - Pixel is valid
+    .pix_red_o  (           ), // TODO
+    .pix_green_o(           ), // TODO
+    .pix_blue_o (           )  // TODO
+  );
+
+
+  // ------------------------------------------------------
+  //  Flip-Flops
+  // ------------------------------------------------------
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_seq_0
+    if (main_rst_an_i == 1'b0) begin
+      valid_r <=  1'b0;
+    end else begin
+      valid_r <=  pix_valid_s;
+    end
+  end
+
+
+  // ------------------------------------------------------
+  //  Multiplexer color
+  // ------------------------------------------------------
+  always_comb begin : proc_color
+    // defaults
+    color_o = 8'h00;
+
+    case (pix_valid_s) inside
+      1'b1: begin
+        color_o = pix_blue_s;
+      end
+      default: begin // 1'b0
+        color_o = pix_red_s;
+      end
+    endcase
+  end
+
+  // ------------------------------------------------------
+  //  Assigns
+  // ------------------------------------------------------
+  assign pix_valid_o  = pix_valid_s;
+  assign pix_red_o    = pix_red_s;
+  assign pix_green_o  = pix_green_s;
+  assign pix_blue_o   = pix_blue_s;
+  assign swap_valid_o = pix_valid_i;
+  assign swap_red_o   = pix_blue_i;
+  assign swap_green_o = pix_green_i;
+  assign swap_blue_o  = pix_red_i;
+  assign red_o        = pix_red_i;
+
+endmodule // struct
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,78 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.struct.StructSubMod
+//
+// Library:     top
+// Module:      struct_sub
+// Data Model:  StructSubMod
+//              top/struct.py
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module struct_sub (
+  // pix_i
+  input  wire        pix_valid_i, // Pixel is valid
+  input  wire  [7:0] pix_red_i,
+  input  wire  [7:0] pix_green_i,
+  input  wire  [7:0] pix_blue_i,
+  // pix_o
+  output logic       pix_valid_o, // Pixel is valid
+  output logic [7:0] pix_red_o,
+  output logic [7:0] pix_green_o,
+  output logic [7:0] pix_blue_o
+);
+
+
+  // ------------------------------------------------------
+  //  Assigns
+  // ------------------------------------------------------
+  assign pix_valid_o = pix_valid_i;
+  assign pix_red_o   = pix_red_i;
+  assign pix_green_o = pix_green_i;
+  assign pix_blue_o  = pix_blue_i;
+
+endmodule // struct_sub
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
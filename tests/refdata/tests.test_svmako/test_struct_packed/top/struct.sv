@@ -0,0 +1,147 @@
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// =============================================================================
+//
+// Update via:  ucdp gen top.struct
+//
+// Library:     top
+// Module:      struct
+// Data Model:  StructMod
+//              top/struct.py
+// Submodules:
+//              struct_sub u_sub0
+//              struct_sub u_sub1
+//
+// =============================================================================
+
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+
+module struct (
+  // main_i: Clock and Reset
+  input  wire         main_clk_i,    // Clock
+  input  wire         main_rst_an_i, // Async Reset (Low-Active)
+  // -
+  input  wire struct packed {logic valid; logic [7:0] red; logic [7:0] green; logic [7:0] blue;} pix_i,
+  output struct packed {logic valid; logic [7:0] red; logic [7:0] green; logic [7:0] blue;} pix_o,
+  output struct packed {logic valid; logic [7:0] red; logic [7:0] green; logic [7:0] blue;} swap_o,
+  // bus_i
+  input  wire  [1:0]  bus_trans_i,
+  input  wire  [31:0] bus_addr_i,
+  input  wire         bus_write_i,
+  input  wire  [31:0] bus_wdata_i,
+  output logic        bus_ready_o,
+  output logic        bus_resp_o,
+  output logic [31:0] bus_rdata_o,
+  // -
+  output logic [7:0]  red_o,
+  output logic [7:0]  color_o
+);
+
+
+
+  // ------------------------------------------------------
+  //  Signals
+  // ------------------------------------------------------
+  struct packed {logic valid; logic [7:0] red; logic [7:0] green; logic [7:0] blue;} pix_s;
+  logic valid_r;
+
+
+  // ------------------------------------------------------
+  //  top.struct_sub: u_sub0
+  // ------------------------------------------------------
+  struct_sub u_sub0 (
+    .pix_i(pix_i),
+    .pix_o(pix_s)
+  );
+
+
+  // ------------------------------------------------------
+  //  top.struct_sub: u_sub1
+  // ------------------------------------------------------
+  struct_sub u_sub1 (
+    .pix_i({pix_i.valid, pix_i.green, 8'h00, 8'h00}),
+    .pix_o(                                        )  // TODO
+  );
+
+
+  // ------------------------------------------------------
+  //  Flip-Flops
+  // ------------------------------------------------------
+
+  always_ff @(posedge main_clk_i or negedge main_rst_an_i) begin: proc_seq_0
+    if (main_rst_an_i == 1'b0) begin
+      valid_r <=  1'b0;
+    end else begin
+      valid_r <=  pix_s.valid;
+    end
+  end
+
+
+  // ------------------------------------------------------
+  //  Multiplexer color
+  // ------------------------------------------------------
+  always_comb begin : proc_color
+    // defaults
+    color_o = 8'h00;
+
+    case (pix_s.valid) inside
+      1'b1: begin
+        color_o = pix_s.blue;
+      end
+      default: begin // 1'b0
+        color_o = pix_s.red;
+      end
+    endcase
+  end
+
+  // ------------------------------------------------------
+  //  Assigns
+  // ------------------------------------------------------
+  assign pix_o        = pix_s;
+  assign swap_o.valid = pix_i.valid;
+  assign swap_o.red   = pix_i.blue;
+  assign swap_o.green = pix_i.green;
+  assign swap_o.blue  = pix_i.red;
+  assign red_o        = pix_i.red;
+
+endmodule // struct
+
+`default_nettype wire
+`end_keywords
+
+// =============================================================================
+//
+//   @generated @fully-generated
+//
+//   THIS FILE IS GENERATED!!! DO NOT EDIT MANUALLY. CHANGES ARE LOST.
+//
+// =============================================================================
@@ -0,0 +1,61 @@
+// GENERATE INPLACE BEGIN copyright() ==========================================
+//
+//  MIT License
+//
+//  Copyright (c) 2024-2025 nbiotcloud
+//
+//  Permission is hereby granted, free of charge, to any person obtaining a copy
+//  of this software and associated documentation files (the "Software"), to deal
+//  in the Software without restriction, including without limitation the rights
+//  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+//  copies of the Software, and to permit persons to whom the Software is
+//  furnished to do so, subject to the following conditions:
+//
+//  The above copyright notice and this permission notice shall be included in all
+//  copies or substantial portions of the Software.
+//
+//  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+//  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+//  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+//  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+//  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+//  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+//  SOFTWARE.
+//
+// GENERATE INPLACE END copyright ==============================================
+
+// GENERATE INPLACE BEGIN fileheader() =========================================
+//
+// Update via:  ucdp gen glbl.clk_gate
+//
+// Library:     glbl
+// Module:      clk_gate
+// Data Model:  ClkGateMod
+//              glbl/clk_gate.py
+//
+// GENERATE INPLACE END fileheader =============================================
+
+// GENERATE INPLACE BEGIN header() =============================================
+`begin_keywords "1800-2009"
+`default_nettype none  // implicit wires are forbidden
+// GENERATE INPLACE END header =================================================
+
+// GENERATE INPLACE BEGIN beginmod() ===========================================
+module clk_gate (
+  input wire clk_i,
+  output logic clk_o,
+  input wire ena_i
+);
+// GENERATE INPLACE END beginmod ===============================================
+
+  // GENERATE INPLACE BEGIN logic() ============================================
+  // GENERATE INPLACE END logic ================================================
+
+// GENERATE INPLACE BEGIN endmod() =============================================
+endmodule // clk_gate
+// GENERATE INPLACE END endmod =================================================
+
+// GENERATE INPLACE BEGIN footer() =============================================
+`default_nettype wire
+`end_keywords
+// GENERATE INPLACE END footer =================================================
@@ -23,13 +23,15 @@
 #
 """Test Importer."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import ucdp as u
-from pytest import mark
+from pytest import mark, raises
 from test2ref import assert_refdata
 
 import ucdpsv as usv
+from ucdpsv import svimporter
 
 from .conftest import TESTDATA
 
@@ -296,9 +298,11 @@ class ImportedMod(u.ATailoredMod):
     """Imported Module."""
 
     filepath: Path
+    backend: usv.SvBackend = usv.HdlParserBackend()
+    lazy: bool = False
 
     def _build(self) -> None:
-        usv.import_params_ports(self, filepath=self.filepath)
+        usv.import_params_ports(self, filepath=self.filepath, backend=self.backend, lazy=self.lazy)
 
     @property
     def modname(self):
@@ -312,11 +316,13 @@ DEFINES = {
 }
 
 
+@mark.parametrize("lazy", [False, True])
+@mark.parametrize("backend", [usv.HdlParserBackend(), usv.SvScanner()])
 @mark.parametrize("filepath", TESTDATA.glob("sv/*"))
-def test_sv(tmp_path: Path, filepath: Path):
-    """SystemVerilog Examples."""
+def test_sv(tmp_path: Path, filepath: Path, backend: usv.SvBackend, lazy: bool):
+    """SystemVerilog Examples - All Backends And Modes Result In The Same Parameters and Ports."""
     defines = DEFINES.get(filepath.stem, None)
-    mod = ImportedMod(filepath=filepath, defines=defines)
+    mod = ImportedMod(filepath=filepath, defines=defines, backend=backend, lazy=lazy)
     info_path = tmp_path / f"{filepath.stem}.txt"
     with info_path.open("w") as file:
         for define in mod.defines or []:
@@ -326,3 +332,257 @@ def test_sv(tmp_path: Path, filepath: Path):
         for port in mod.ports:
             file.write(f"{port!r}\n")
     assert_refdata(test_sv, tmp_path, flavor=filepath.stem)
+
+
+class LazyTopMod(u.AMod):
+    """Module With Lazy Imported Ports."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (u.ModFileList(name="hdl", filepaths=("testdata/importer/top.sv",)),)
+
+    @property
+    def modname(self) -> str:
+        """Module Name."""
+        return "top"
+
+    def _build(self) -> None:
+        usv.import_params_ports(self, lazy=True)
+
+
+class LazyParentMod(u.AMod):
+    """Parent Of Modules With Lazy Imported Ports."""
+
+    def _build(self) -> None:
+        self.add_port(u.ClkRstAnType(), "main_i")
+        LazyTopMod(self, "u_used").con("main_clk_i", "main_clk_i")
+        LazyTopMod(self, "u_unused")
+
+
+def test_lazy():
+    """Ports Are Imported On First Access."""
+    top = LazyTopMod()
+    # parameters are imported immediately
+    assert [param.name for param in top.params] == ["param_p", "generic_p", "generic2_p", "has_rx", "has_tx"]
+    assert dict.__len__(top.ports) == 0
+    assert (
+        repr(top.ports["data_i"]) == "Port(UintType(Param(IntegerType(default=10), 'param_p')), 'data_i', direction=IN)"
+    )
+    assert dict.__len__(top.ports) == 20
+    assert tuple(top.ports) == tuple(TopMod().ports)
+    assert tuple(top.namespace) == tuple(TopMod().namespace)
+    assert type(top.ports) is u.Idents
+
+
+def test_lazy_inst():
+    """Ports Of Unused Instances Are Imported After Locking."""
+    top = LazyParentMod()
+    used, unused = top.insts
+    assert dict.__len__(used.ports) == 20
+    assert dict.__len__(unused.ports) == 0
+    assert unused.is_locked
+    assert tuple(unused.ports) == tuple(used.ports)
+    assert unused.ports.is_locked
+    assert len(tuple(top.get_instcons(unused).iter())) == 20
+
+
+class LazyAccessMod(LazyTopMod):
+    """Ports Accessed During Build."""
+
+    def _build(self) -> None:
+        super()._build()
+        self.add_signal(self.ports["data_i"].type_, "data_s")
+
+
+def test_lazy_locked():
+    """Ports Are Added Via `add_port` Before And Completed After Locking."""
+    top = LazyAccessMod()
+    assert tuple(top.ports) == tuple(TopMod().ports)
+    assert "data_s" in top.namespace
+
+    top = LazyTopMod()
+    assert top.namespace.is_locked
+    assert dict.__len__(top.ports) == 0
+    assert "data_i" in top.ports
+    assert top.namespace.is_locked
+    with raises(u.LockError):
+        top.add_port(u.BitType(), "other_i")
+
+
+def test_lazy_threads():
+    """Concurrent First Accesses Wait For One Import."""
+    top = LazyTopMod()
+    with ThreadPoolExecutor(max_workers=8) as exe:
+        results = list(exe.map(lambda _: tuple(top.namespace), range(32)))
+    assert all(result == tuple(TopMod().namespace) for result in results)
+    assert type(top.namespace) is u.Idents
+
+
+def test_lazy_error(tmp_path):
+    """A Failed Import Fails On Every Access."""
+    filepath = tmp_path / "dup.sv"
+    filepath.write_text("module dup #(\n  parameter a = 1\n) (\n  input wire b,\n  input wire a\n);\nendmodule\n")
+    mod = ImportedMod(filepath=filepath, lazy=True)
+    for _ in range(2):
+        with raises(u.DuplicateError):
+            mod.ports["b"]
+        assert dict.__len__(mod.ports) == 0
+
+
+def test_svimports():
+    """Imported Files Are Recorded Per Module Class."""
+    TopMod()
+    (svimport,) = usv.get_svimports(TopMod)
+    assert svimport.modcls is TopMod
+    assert svimport.filelistname == "hdl"
+    assert svimport.filepath.name == "top.sv"
+    assert svimport.filehash == usv.svimporter.get_filehash(svimport.filepath)
+
+
+def test_freeze(tmp_path):
+    """Snapshot Is Used Until The Source Changes."""
+    filepath = tmp_path / "param_module.sv"
+    filepath.write_text((TESTDATA / "sv" / "param_module.sv").read_text())
+    expected = [repr(port) for port in ImportedMod(filepath=TESTDATA / "sv" / "param_module.sv").ports]
+
+    snapshotpath = usv.freeze_svfile(filepath)
+    assert snapshotpath == tmp_path / "param_module.sv.snapshot.json"
+
+    # the snapshot is used instead of parsing
+    snapshot = snapshotpath.read_text()
+    assert snapshot.count('"name":"data_in"') == 1
+    snapshotpath.write_text(snapshot.replace('"name":"data_in"', '"name":"snap_in"'))
+    ports = [repr(port) for port in ImportedMod(filepath=filepath).ports]
+    assert ports == [port.replace("'data_in'", "'snap_in'") for port in expected]
+
+    # snapshot of another backend is not used
+    assert "snap_in" not in repr(tuple(ImportedMod(filepath=filepath, backend=usv.SvScanner()).ports))
+
+    # source changed - snapshot is outdated
+    filepath.write_text(filepath.read_text() + "\n// changed\n")
+    assert [repr(port) for port in ImportedMod(filepath=filepath).ports] == expected
+
+
+def test_shared_types():
+    """Types With Constant Dimensions Are Shared."""
+    top = TopMod()
+    assert top.ports["bus_addr_i"].type_ is top.ports["bus_wdata_i"].type_
+    assert top.ports["bus_addr_i"].type_ is TopMod().ports["bus_rdata_o"].type_
+    assert top.ports["main_clk_i"].type_ is top.ports["bus_write_i"].type_
+    assert repr(top.ports["data_i"].type_) == "UintType(Param(IntegerType(default=10), 'param_p'))"
+
+
+class PkgTopMod(u.AMod):
+    """Module Importing A Package."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (u.ModFileList(name="hdl", filepaths=("testdata/importer/pkg.sv",)),)
+
+    def _build(self) -> None:
+        svpackages = usv.import_svpackages(TESTDATA / "importer" / "pkg.sv")
+        usv.import_params_ports(self, svpackages=svpackages)
+
+
+def test_svpackage():
+    """Package References Are Resolved."""
+    (svpackage,) = usv.import_svpackages(TESTDATA / "importer" / "pkg.sv")
+    assert svpackage.name == "top_pkg"
+    assert tuple(svpackage.namespace) == (
+        u.Const(u.IntegerType(default=8), "WIDTH"),
+        u.Const(u.IntegerType(default=16), "DEPTH"),
+        u.Const(u.UintType(4, default=3), "MODE"),
+        u.Const(u.UintType(4, default=4), "MODE2"),
+    )
+    assert repr(svpackage.typedefs) == (
+        "{'data_t': UintType(8), 'pair_t': ArrayType(SintType(16), 2, direction=DOWN, packed=True)}"
+    )
+    # parsed once
+    assert usv.import_svpackages(TESTDATA / "importer" / "pkg.sv")[0] is svpackage
+
+    top = PkgTopMod()
+    assert tuple(top.params) == (
+        u.Param(u.IntegerType(default=16), "depth_p"),
+        u.Param(u.IntegerType(default=4), "width_p"),
+    )
+    assert tuple(repr(port) for port in top.ports) == (
+        "Port(UintType(8), 'data_i', direction=IN)",
+        "Port(UintType(16), 'cnt_o', direction=OUT)",
+        "Port(UintType(Param(IntegerType(default=4), 'width_p')), 'sub_o', direction=OUT)",
+        "Port(UintType(4), 'mode_o', direction=OUT)",
+    )
+
+
+def test_svpackage_types(tmp_path):
+    """Declared Types Are Respected And Non-Integer Expressions Are Skipped."""
+    filepath = tmp_path / "pkg.sv"
+    filepath.write_text(
+        "package types_pkg;\n"
+        '  localparam string NAME = "abc";\n'
+        "  localparam int W = $clog2(16);\n"
+        "  localparam int Y = other_pkg::Z;\n"
+        "  localparam real R = 1.5;\n"
+        "  localparam shortreal S = 2.5;\n"
+        "  localparam int I = 1.5;\n"
+        "  localparam bit B = 1;\n"
+        "  localparam byte unsigned U = 200;\n"
+        "  localparam longint L = -1;\n"
+        "  parameter type T = logic;\n"
+        "  localparam N = 4;\n"
+        "endpackage\n"
+    )
+    (svpackage,) = usv.import_svpackages(filepath)
+    assert tuple(svpackage.namespace) == (
+        u.Const(u.StringType(default="abc"), "NAME"),
+        u.Const(u.DoubleType(default=1.5), "R"),
+        u.Const(u.FloatType(default=2.5), "S"),
+        u.Const(u.BitType(default=1), "B"),
+        u.Const(u.UintType(8, default=200), "U"),
+        u.Const(u.SintType(64, default=-1), "L"),
+        u.Const(u.IntegerType(default=4), "N"),
+    )
+    assert svpackage.get_value("NAME") is None
+    assert svpackage.get_value("R") is None
+    assert svpackage.get_value("W") is None
+    assert svpackage.get_value("N") == 4
+
+
+def test_pkgimports(tmp_path):
+    """Unqualified Names Are Just Looked Up In Imported Packages."""
+    filepath = TESTDATA / "importer" / "pkg.sv"
+    assert svimporter._get_pkgimports(filepath, svimporter.get_filehash(filepath), "pkg_top") == {"top_pkg"}
+
+    filepath = tmp_path / "lib.sv"
+    filepath.write_text(
+        "import a_pkg::*;\nmodule one\n  import b_pkg::*, c_pkg::X;\n  import d_pkg::*;\n(input wire a);\n"
+        "  import e_pkg::*;\nendmodule\nmodule two;\nendmodule\n"
+    )
+    filehash = svimporter.get_filehash(filepath)
+    assert svimporter._get_pkgimports(filepath, filehash, "one") == {"a_pkg", "b_pkg", "d_pkg"}
+    assert svimporter._get_pkgimports(filepath, filehash, "two") == {"a_pkg"}
+
+
+def test_modfactory():
+    """Module Classes Created From SystemVerilog Files."""
+    factory = usv.SvModFactory(pymodname=__name__, filepaths=(TESTDATA / "sv" / "param_module.sv",))
+    assert factory.modnames == ("param_module", "sub_module")
+    assert "sub_module" in factory
+    assert len(factory) == 2
+
+    modcls = factory["sub_module"]
+    assert modcls is factory.get_modcls_by_clsname("SubModuleMod")
+    assert modcls.__name__ == "SubModuleMod"
+    assert modcls.filelists[0].filepaths == (TESTDATA / "sv" / "param_module.sv",)
+    # imported on instantiation
+    assert not usv.get_svimports(modcls)
+    mod = modcls()
+    assert mod.modname == "sub_module"
+    assert usv.get_svimports(modcls)
+    assert [port.name for port in mod.ports] == ["clk", "reset", "input_data", "output_data", "config_bus"]
+
+    with raises(AttributeError):
+        factory.get_modcls_by_clsname("OtherMod")
+
+
+def test_modfactory_libindex(example):
+    """Module Classes Via Library Index Are Loadable Like Hand-Written Ones."""
+    top = u.load("cells.std.JarbitraryCounterMod")
+    assert top.mod.modname == "jarbitraryCounter"
+    assert top.mod.libname == "cells"
+    assert [port.name for port in top.mod.ports] == ["OUTPUT", "clock", "reset"]
@@ -0,0 +1,130 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Render Cache."""
+
+import os
+
+import ucdp as u
+
+import ucdpsv as usv
+
+
+class LeafMod(u.ATailoredMod):
+    """Leaf."""
+
+    width: int = 8
+
+    def _build(self):
+        self.add_port(u.UintType(self.width), "data_i")
+        self.add_port(u.UintType(self.width), "data_o")
+        self.assign("data_o", "data_i")
+
+
+class ParentMod(u.AMod):
+    """Parent."""
+
+    def _build(self):
+        LeafMod(self, "u_a")
+        LeafMod(self, "u_b")
+        LeafMod(self, "u_c", width=4)
+
+
+def test_fingerprint():
+    """Fingerprint Ignores The Module Name, But Nothing Else."""
+    mod = ParentMod()
+    leaf_a, leaf_b, leaf_c = mod.insts
+    assert leaf_a.modname != leaf_b.modname
+    assert usv.get_fingerprint(leaf_a) == usv.get_fingerprint(leaf_b)
+    assert usv.get_fingerprint(leaf_a) != usv.get_fingerprint(leaf_c)
+    assert usv.get_fingerprint(leaf_a) != usv.get_fingerprint(leaf_a, svoptions=usv.SvOptions(lean=True))
+
+
+def test_svcache():
+    """Render Once Per Key."""
+    svcache = usv.SvCache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "text"
+
+    assert svcache.get_or_render("key", render) == "text"
+    assert svcache.get_or_render("key", render) == "text"
+    assert len(calls) == 1
+    assert len(svcache) == 1
+    assert (svcache.hits, svcache.misses) == (1, 1)
+
+    svcache.clear()
+    assert len(svcache) == 0
+    assert (svcache.hits, svcache.misses) == (0, 0)
+
+
+def test_svcache_path(tmp_path):
+    """Cache Directory Shared Between Caches."""
+    svcache = usv.SvCache(path=tmp_path)
+    assert svcache.get_or_render("key", lambda: "text") == "text"
+    assert (svcache.hits, svcache.misses) == (0, 1)
+
+    other = usv.SvCache(path=tmp_path)
+    assert other.get_or_render("key", lambda: "other") == "text"
+    assert (other.hits, other.misses) == (1, 0)
+    assert other.stat == "SvCache: 1 hits, 0 misses, 0 evictions"
+
+
+def test_svcache_evict(tmp_path):
+    """Least Recently Used Entries Are Removed."""
+    svcache = usv.SvCache(path=tmp_path, max_size=10)
+    svcache.get_or_render("one", lambda: "1111")
+    svcache.get_or_render("two", lambda: "2222")
+    assert svcache.evictions == 0
+    svcache.get_or_render("three", lambda: "3333")
+    assert svcache.evictions == 1
+    assert len(list(tmp_path.glob("*/*"))) == 2
+
+    other = usv.SvCache(path=tmp_path)
+    assert other.get_or_render("one", lambda: "new") == "new"
+    assert other.get_or_render("three", lambda: "new") == "3333"
+
+
+def test_svcache_readonly(tmp_path, monkeypatch):
+    """Read-Only Cache Directory."""
+    usv.SvCache(path=tmp_path).get_or_render("key", lambda: "text")
+
+    def utime(*args, **kwargs):
+        raise PermissionError
+
+    monkeypatch.setattr(os, "utime", utime)
+    svcache = usv.SvCache(path=tmp_path)
+    assert svcache.get_or_render("key", lambda: "other") == "text"
+    assert (svcache.hits, svcache.misses) == (1, 0)
+
+
+def test_svcache_unwritable(tmp_path):
+    """Cache Directory Which Cannot Be Written."""
+    path = tmp_path / "file"
+    path.write_text("")
+    svcache = usv.SvCache(path=path, max_size=10)
+    assert svcache.get_or_render("key", lambda: "text") == "text"
+    assert svcache.get_or_render("key", lambda: "other") == "text"
+    assert (svcache.hits, svcache.misses) == (1, 1)
@@ -23,10 +23,14 @@
 #
 """Test SvExprResolver."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import ucdp as u
-from pytest import fixture
+from makolator import Datamodel
+from pytest import fixture, raises
 
 import ucdpsv as usv
+from ucdpsv.svexprresolver import _get_comment
 
 
 @fixture
@@ -86,3 +90,139 @@ def test_get_ident_expr(rslvr):
     assert get_ident_expr(u.SintType(5, default=-2), "ident", 1) == "5'sh0F"
     assert get_ident_expr(u.SintType(5, default=-2), "ident", "") == "ident"
     assert get_ident_expr(u.SintType(5, default=-2), "ident", "~") == "~ident"
+
+
+def test_interned(rslvr):
+    """Repeated Declarations and Comments Share Storage."""
+    assert rslvr.get_decl(u.UintType(32))[1] is rslvr.get_decl(u.UintType(32))[1]
+    assert rslvr.get_dims(u.ArrayType(u.BitType(), 4)) is rslvr.get_dims(u.ArrayType(u.BitType(), 4))
+    assert _get_comment("Clock - data", pre=" ") is _get_comment("Clock - data", pre=" ")
+
+
+def test_get_int_literals(rslvr):
+    """Batch Formatting Matches Single Value Formatting."""
+    param = rslvr.namespace["param"]
+    literals = [
+        (5, 18, False),
+        (5, 4, False),
+        (0, param, False),
+        (2, param, False),
+        (5, 18, True),
+        (-5, 18, True),
+        (-2, 5, True),
+        (0, param, True),
+        (-2, param, True),
+    ]
+    singles = [
+        rslvr.resolve(u.ConstExpr((u.SintType if signed else u.UintType)(width, default=value)))
+        for value, width, signed in literals
+    ]
+    assert rslvr.get_int_literals(literals) == singles
+    assert singles[:2] == ["18'h00005", "4'h5"]
+    assert singles[5:7] == ["18'sh3FFFB", "5'sh1E"]
+
+
+def test_coalesce_slices(namespace):
+    """Adjacent Slices Of The Same Identifier Are Merged."""
+    ident0, ident1 = namespace["ident0"], namespace["ident1"]
+    expr = u.ConcatExpr((ident0[9], ident0[8], ident0[7:4], ident1, ident0[3], ident0[1], ident0[0]))
+    full = u.ConcatExpr((ident1[9:5], ident1[4], ident1[3:0]))
+
+    rslvr = usv.SvExprResolver(namespace=namespace)
+    assert rslvr.resolve(expr) == "{ident0[9], ident0[8], ident0[7:4], ident1, ident0[3], ident0[1], ident0[0]}"
+
+    rslvr = usv.SvExprResolver(namespace=namespace, coalesce_slices=True)
+    assert rslvr.resolve(expr) == "{ident0[9:4], ident1, ident0[3], ident0[1:0]}"
+    assert rslvr.resolve(full) == "ident1"
+
+
+def test_coalesce_slices_param():
+    """Slices Of Parameterized Vectors Are Never Merged To The Bare Identifier."""
+    param_p = u.Param(u.IntegerType(default=8), "param_p")
+    a_i = u.Port(u.UintType(param_p), "a_i", direction=u.IN)
+    rslvr = usv.SvExprResolver(namespace=u.Idents([param_p, a_i]), coalesce_slices=True)
+    assert rslvr.resolve(u.ConcatExpr((a_i[7:4], a_i[3:0]))) == "a_i[7:0]"
+
+
+class ParamLeafMod(u.AMod):
+    """Leaf With Parameter."""
+
+    def _build(self):
+        width_p = self.add_param(u.IntegerType(default=8), "width_p")
+        self.add_port(u.UintType(width_p), "data_i")
+
+
+class ParamParentMod(u.AMod):
+    """Parent."""
+
+    def _build(self):
+        self.add_port(u.UintType(4), "data_i")
+        ParamLeafMod(self, "u_leaf0", paramdict={"width_p": 4}).con("data_i", "data_i")
+        ParamLeafMod(self, "u_leaf1")
+
+
+def test_svinsts():
+    """Instance Table Is Built Once Per Datamodel."""
+    mod = ParamParentMod()
+    datamodel = Datamodel()
+    svinsts = usv.get_svinsts(mod, datamodel=datamodel)
+    assert tuple(svinsts) == ("u_leaf0", "u_leaf1")
+    assert usv.get_svinsts(mod, datamodel=datamodel) is svinsts
+    assert usv.get_svinsts(mod) is not svinsts
+
+    leaf0 = svinsts["u_leaf0"]
+    assert leaf0.inst is mod.insts["u_leaf0"]
+    assert leaf0.instcons is mod.get_instcons("u_leaf0")
+    assert [param.name for param in leaf0.params] == ["width_p"]
+    assert not svinsts["u_leaf1"].params
+    width = leaf0.inst.ports["data_i"].type_.width
+    assert leaf0.resolver.resolve(width) == usv.get_resolver(mod, inst=leaf0.inst).resolve(width)
+
+    assert usv.get_svinst(mod, leaf0.inst, datamodel=datamodel) is leaf0
+    assert usv.get_svinst(mod, "u_leaf1", datamodel=datamodel) is svinsts["u_leaf1"]
+    with raises(ValueError):
+        usv.get_svinst(mod, "u_other", datamodel=datamodel)
+
+
+def test_svinsts_threads():
+    """Concurrent Lookups Share One Table."""
+    mod = ParamParentMod()
+    datamodel = Datamodel()
+    with ThreadPoolExecutor(max_workers=8) as exe:
+        tables = list(exe.map(lambda _: usv.get_svinsts(mod, datamodel=datamodel), range(64)))
+    assert all(table is tables[0] for table in tables)
+
+
+class PixelType(u.AStructType):
+    """Pixel."""
+
+    def _build(self) -> None:
+        self._add("valid", u.BitType())
+        self._add("red", u.UintType(8))
+
+
+class PixelSubMod(u.AMod):
+    """Sub Module With Struct Ports."""
+
+    def _build(self):
+        self.add_port(PixelType(), "pix_i")
+        self.add_port(PixelType(), "pix_o")
+
+
+class PixelMod(u.AMod):
+    """Partly Connected Output Struct."""
+
+    def _build(self):
+        self.add_port(PixelType(), "pix_i")
+        self.add_port(u.BitType(), "valid_o")
+        sub = PixelSubMod(self, "u_sub")
+        sub.con("pix_i", "pix_i")
+        sub.con("pix_valid_o", "valid_o")
+
+
+def test_instcons_struct_partly():
+    """Partly Connected Output Structs Are Connected Member-Wise."""
+    mod = PixelMod()
+    rslvr = usv.get_resolver(mod, svoptions=usv.SvOptions(structs=True, lean=True))
+    lines = rslvr.get_instcons(mod.get_instcons("u_sub")).get().splitlines()
+    assert lines == [".pix_i(pix_i),", ".pix_valid_o(valid_o),", ".pix_red_o()"]
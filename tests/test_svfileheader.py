@@ -0,0 +1,90 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""File Header Information."""
+
+import os
+from unittest import mock
+
+import ucdp as u
+from makolator import Datamodel
+
+import ucdpsv as usv
+
+from .test_svcache import LeafMod, ParentMod
+
+
+def test_fileheader(tmp_path):
+    """Information Is Determined Once Per Class."""
+    mod = ParentMod()
+    leaf_a, leaf_b, leaf_c = mod.insts
+    datamodel = Datamodel()
+    with mock.patch("ucdp.modutil.get_file", wraps=u.modutil.get_file) as get_file:
+        fileheader = usv.get_fileheader(leaf_a, basedir=tmp_path, datamodel=datamodel)
+        assert usv.get_fileheader(leaf_a, basedir=tmp_path, datamodel=datamodel) is fileheader
+        other = usv.get_fileheader(leaf_c, basedir=tmp_path, datamodel=datamodel)
+        assert get_file.call_count == 1
+
+    assert other is not fileheader
+    assert other.filepath == fileheader.filepath == u.modutil.get_file(LeafMod, basedir=tmp_path)
+    assert fileheader.copyright == u.get_copyright(leaf_b)
+    assert fileheader.topmodref == u.TopModRef.from_mod(leaf_a)
+    assert usv.get_copyright(leaf_b, datamodel=datamodel) is fileheader.copyright
+
+    # new generation - new datamodel
+    assert usv.get_fileheader(leaf_a, basedir=tmp_path, datamodel=Datamodel()) is not fileheader
+    assert usv.get_fileheader(leaf_a, basedir=tmp_path) == fileheader
+
+
+class GenLeafMod(u.ATailoredMod):
+    """Leaf."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (
+        u.ModFileList(name="hdl", gen="full", filepaths=("$PRJ/{mod.modname}.sv",), template_filepaths=("sv.mako",)),
+    )
+    width: int = 8
+
+    def _build(self):
+        self.add_port(u.UintType(self.width), "data_i")
+
+
+class GenParentMod(u.AMod):
+    """Parent."""
+
+    filelists: u.ClassVar[u.ModFileLists] = GenLeafMod.filelists
+
+    def _build(self):
+        for width in range(1, 5):
+            GenLeafMod(self, f"u_leaf{width}", width=width)
+
+
+def test_generate(tmp_path):
+    """Each Class Is Inspected Once Per Generation."""
+    mod = GenParentMod()
+    with (
+        mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}),
+        mock.patch("ucdp.modutil.get_file", wraps=u.modutil.get_file) as get_file,
+    ):
+        u.generate(mod, "hdl")
+    assert len(tuple(tmp_path.glob("*.sv"))) == 5
+    assert get_file.call_count == 2
@@ -0,0 +1,126 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Library Index."""
+
+import ucdp as u
+
+import ucdpsv as usv
+from ucdpsv import svlibindex
+
+from .conftest import TESTDATA
+
+LIBINDEX = usv.SvLibIndex.build([TESTDATA / "sv"])
+
+
+class AdderMod(u.AMod):
+    """Adder Located Via Library Index."""
+
+    def _build(self) -> None:
+        usv.import_params_ports(self, libindex=LIBINDEX)
+
+
+class AdderFileMod(u.AMod):
+    """Adder Located Via File Path."""
+
+    @property
+    def modname(self) -> str:
+        """Module Name."""
+        return "adder"
+
+    def _build(self) -> None:
+        usv.import_params_ports(self, filepath=TESTDATA / "sv" / "adder.sv")
+
+
+def test_build():
+    """Modules And Their Byte Ranges."""
+    entry = LIBINDEX["top2"]
+    assert entry.filepath == TESTDATA / "sv" / "top1.sv"
+    text = entry.filepath.read_bytes()[entry.start : entry.end].decode()
+    assert text.startswith("module top2")
+    assert text.endswith("endmodule")
+    # `ifdef` within `top1`
+    assert "top2" in [module.name for module in LIBINDEX.parse("top2").modules]
+    assert [module.name for module in LIBINDEX.parse("adder").modules] == ["adder"]
+    assert "missing" not in LIBINDEX
+
+
+def test_comments(tmp_path):
+    """Modules In Comments And Strings Are Ignored."""
+    filepath = tmp_path / "lib.sv"
+    filepath.write_text(
+        '// module comment1;\n/* module comment2;\nendmodule */\n$display("module string");\n'
+        "module real1 (input wire a);\nendmodule\nmodule real2;\nendmodule : real2\n"
+    )
+    assert [modrange[0] for modrange in usv.svlibindex.scan_svfile(filepath)] == ["real1", "real2"]
+
+
+def test_import():
+    """Import Via Library Index Matches Import Via File Path."""
+    assert [repr(port) for port in AdderMod().ports] == [repr(port) for port in AdderFileMod().ports]
+    assert [repr(param) for param in AdderMod().params] == [repr(param) for param in AdderFileMod().params]
+
+
+def test_save_load_incremental(tmp_path, monkeypatch):
+    """Persisted Index And Incremental Scan."""
+    (tmp_path / "one.sv").write_text("module one;\nendmodule\n")
+    (tmp_path / "two.v").write_text("module two;\nendmodule\n")
+    index = usv.SvLibIndex.build([tmp_path])
+    assert sorted(index.entries) == ["one", "two"]
+
+    indexpath = tmp_path / "index.json"
+    index.save(indexpath)
+    loaded = usv.SvLibIndex.load(indexpath)
+    assert loaded == index
+
+    scanned = []
+    scan_svfile = svlibindex.scan_svfile
+    monkeypatch.setattr(svlibindex, "scan_svfile", lambda filepath: scanned.append(filepath) or scan_svfile(filepath))
+    (tmp_path / "two.v").write_text("module two;\nendmodule\nmodule three;\nendmodule\n")
+    index = usv.SvLibIndex.build([tmp_path], index=loaded)
+    assert scanned == [tmp_path / "two.v"]
+    assert sorted(index.entries) == ["one", "three", "two"]
+
+
+def test_modified(tmp_path):
+    """Modified Files Are Scanned Again On Parse."""
+    filepath = tmp_path / "lib.sv"
+    filepath.write_text("module one;\nendmodule\nmodule two (input wire a);\nendmodule\n")
+    index = usv.SvLibIndex.build([tmp_path])
+    filepath.write_text("// new header\nmodule two (input wire b);\nendmodule\n")
+    (module,) = index.parse("two").modules
+    assert [port.name for port in module.ports] == ["b"]
+    assert index.files[filepath].modranges == (("two", 14, 50),)
+    assert "one" not in index
+    assert index["two"].start == 14
+
+
+def test_context(tmp_path):
+    """Files With Preprocessor Directives Or Package Imports Outside Of The Module Are Parsed Completely."""
+    (tmp_path / "plain.sv").write_text("module one;\nendmodule\nmodule two;\nendmodule\n")
+    (tmp_path / "define.sv").write_text("`define WIDTH 4\nmodule three;\nendmodule\nmodule four;\nendmodule\n")
+    (tmp_path / "import.sv").write_text("import pkg::*;\nmodule five;\nendmodule\nmodule six;\nendmodule\n")
+    index = usv.SvLibIndex.build([tmp_path])
+    assert [module.name for module in index.parse("two").modules] == ["two"]
+    assert [module.name for module in index.parse("four").modules] == ["three", "four"]
+    assert [module.name for module in index.parse("six").modules] == ["five", "six"]
@@ -30,6 +30,8 @@ from unittest import mock
 import ucdp as u
 from test2ref import assert_refdata
 
+import ucdpsv as usv
+
 
 def test_top(example, tmp_path):
     """Top Module."""
@@ -68,3 +70,111 @@ def test_ifdef(example, tmp_path):
         u.generate(top.mod, "hdl")
 
     assert_refdata(test_ifdef, tmp_path)
+
+
+def test_flipflop(example, tmp_path):
+    """Flip-Flop Module."""
+    top = u.load("top.flipflop")
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+
+    assert_refdata(test_flipflop, tmp_path)
+
+
+def test_flipflop_merged(example, tmp_path):
+    """Flip-Flop Module With Merged Processes."""
+    top = u.load("top.flipflop")
+    data = {"svoptions": usv.SvOptions(merge_flipflops=True)}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+
+    assert_refdata(test_flipflop_merged, tmp_path)
+
+
+def test_struct(example, tmp_path):
+    """Struct Module."""
+    top = u.load("top.struct")
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+
+    assert_refdata(test_struct, tmp_path)
+
+
+def test_struct_packed(example, tmp_path):
+    """Struct Module With Packed Structs."""
+    top = u.load("top.struct")
+    data = {"svoptions": usv.SvOptions(structs=True)}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+
+    assert_refdata(test_struct_packed, tmp_path)
+
+
+def test_lanes(example, tmp_path):
+    """Instance Arrays."""
+    top = u.load("top.lanes")
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl")
+
+    assert_refdata(test_lanes, tmp_path)
+
+
+def test_lanes_loops(example, tmp_path):
+    """Instance Arrays As Generate Loops."""
+    top = u.load("top.lanes")
+    data = {"svoptions": usv.SvOptions(generate_loops=True)}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+
+    assert_refdata(test_lanes_loops, tmp_path)
+
+
+def test_top_lean(example, tmp_path):
+    """Top Module With Lean Output."""
+    copytree(example / "src", tmp_path, dirs_exist_ok=True)
+    top = u.load("top.top")
+    data = {"svoptions": usv.SvOptions(lean=True)}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+
+    assert_refdata(test_top_lean, tmp_path)
+
+
+def test_top_svcache(example, tmp_path):
+    """Top Module With Render Cache."""
+    copytree(example / "src", tmp_path, dirs_exist_ok=True)
+    top = u.load("top.top")
+    svcache = usv.SvCache()
+    data = {"svcache": svcache}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+        misses = svcache.misses
+        assert misses
+        assert svcache.hits == 0
+
+        u.generate(top.mod, "hdl", data=data)
+        assert svcache.misses == misses
+        assert svcache.hits == misses
+
+    assert_refdata(test_top, tmp_path)
+
+
+def test_mux_lean(example, tmp_path):
+    """Mux Module With Lean Output."""
+    top = u.load("top.mux")
+    data = {"svoptions": usv.SvOptions(lean=True)}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", data=data)
+
+    assert_refdata(test_mux_lean, tmp_path)
+
+
+def test_top_threads(example, tmp_path):
+    """Top Module Rendered By Concurrent Threads Sharing One Model And Cache."""
+    copytree(example / "src", tmp_path, dirs_exist_ok=True)
+    top = u.load("top.top")
+    data = {"svcache": usv.SvCache()}
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}):
+        u.generate(top.mod, "hdl", maxworkers=8, data=data)
+
+    assert_refdata(test_top, tmp_path)
@@ -0,0 +1,112 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Fast Module Header Scanner."""
+
+from pathlib import Path
+
+import hdl_parser as hdl
+from pytest import mark
+
+import ucdpsv as usv
+
+from .conftest import TESTDATA
+
+
+def _strip(file: hdl.File) -> list[hdl.Module]:
+    """Modules without instances and comments, which are not extracted by the scanner."""
+    return [
+        module.model_copy(
+            update={
+                "insts": (),
+                "params": tuple(item.model_copy(update={"comment": ()}) for item in module.params),
+                "localparams": tuple(item.model_copy(update={"comment": ()}) for item in module.localparams),
+                "ports": tuple(item.model_copy(update={"comment": ()}) for item in module.ports),
+            }
+        )
+        for module in file.modules
+    ]
+
+
+@mark.parametrize("filepath", [*TESTDATA.glob("sv/*.sv"), *TESTDATA.glob("importer/*.sv")])
+def test_hdl_parser(filepath: Path):
+    """Scanner Results Are Identical To `hdl_parser`."""
+    assert usv.SvScanner().parse_file(filepath).modules == tuple(_strip(hdl.parse_file(filepath)))
+
+
+def test_scanner():
+    """Corner Cases."""
+    text = """
+module /* comment */ mod
+  import pkg::*;
+#(
+  parameter int A = 3, // default (with comment)
+  B [0:1] = '{1, 2},
+  logic [3:0] C = pkg::C,
+`ifdef X
+  parameter D = `X
+`else
+  parameter D = 2
+`endif
+) (
+  input  wire signed [ A - 1 : 0 ] [1:0] a_i, b_i [0:3],
+  output var logic c_o = 1'b0,
+  input  pkg::data_t d_i,
+  output struct packed {logic valid; logic [7:0] data;} e_o
+);
+  localparam E = "endmodule";
+  function automatic int f(input int x);
+    return x;
+  endfunction
+endmodule
+"""
+    (module,) = usv.SvScanner().parse_text(text).modules
+    assert module.name == "mod"
+    assert [
+        (param.ptype, param.name, param.dim, param.dim_unpacked, param.default, param.ifdefs) for param in module.params
+    ] == [
+        ("int", "A", "", "", "3", ()),
+        ("int", "B", "", "[0:1]", "'{1, 2}", ()),
+        ("logic", "C", "[3:0]", "", "pkg::C", ()),
+        ("", "D", "", "", "`X", ("X",)),
+        ("", "D", "", "", "2", ("!X",)),
+    ]
+    assert [(param.name, param.default) for param in module.localparams] == [("E", '"endmodule"')]
+    assert [
+        (port.direction, port.ptype, port.dtype, port.name, port.dim, port.dim_unpacked) for port in module.ports
+    ] == [
+        ("input", "wire", "signed", "a_i", "[ A - 1 : 0 ][1:0]", ""),
+        ("input", "wire", "signed", "b_i", "[ A - 1 : 0 ][1:0]", "[0:3]"),
+        ("output", "logic", "", "c_o", "", ""),
+        ("input", "pkg::data_t", "", "d_i", "", ""),
+        ("output", "struct", "", "e_o", "", ""),
+    ]
+
+
+def test_libindex():
+    """Library Index With Scanner Backend."""
+    libindex = usv.SvLibIndex.build([TESTDATA / "sv"])
+    file = libindex.parse("sub_module", backend=usv.SvScanner())
+    # the whole file is parsed, due to the package import in front of `param_module`
+    assert [module.name for module in file.modules] == ["param_module", "sub_module"]
+    assert file.modules == tuple(_strip(libindex.parse("sub_module")))
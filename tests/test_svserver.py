@@ -0,0 +1,185 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Generation Server."""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import mock
+
+import ucdpsv as usv
+
+LEAF = """
+import ucdp as u
+from fileliststandard import HdlFileList
+
+
+class LeafMod(u.AMod):
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(u.UintType({width}), "data_i")
+        self.add_port(u.UintType({width}), "data_o")
+        self.assign("data_o", "data_i")
+"""
+
+IMPORTED = """
+import ucdp as u
+import ucdpsv as usv
+from fileliststandard import HdlFileList
+
+
+class ImportedMod(u.AMod):
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="no", filepaths=("$LIBPATH/imported.sv",)),)
+
+    def _build(self):
+        usv.import_params_ports(self)
+"""
+
+SV = """
+module imported (
+  input wire [{width}-1:0] data_i
+);
+endmodule
+"""
+
+
+def test_svserver(example, tmp_path):
+    """Generate And Invalidate On Source Change."""
+    libpath = tmp_path / "lib"
+    (libpath / "svserverlib").mkdir(parents=True)
+    (libpath / "svserverlib" / "__init__.py").touch()
+    leafpath = libpath / "svserverlib" / "leaf.py"
+    leafpath.write_text(LEAF.format(width=8))
+    outpath = tmp_path / "out"
+
+    server = usv.SvServer(socketpath=tmp_path / "sock", paths=(libpath,))
+    with mock.patch.dict(os.environ, {"PRJ": str(outpath)}):
+        assert server.handle({"cmd": "gen", "top": "svserverlib.leaf"})["status"] == "ok"
+        (filepath,) = outpath.glob("**/leaf.sv")
+        assert "input  wire  [7:0] data_i" in filepath.read_text()
+
+        response = server.handle({"cmd": "gen", "top": "svserverlib.leaf"})
+        assert response["status"] == "ok"
+        assert response["stat"] == "SvCache: 1 hits, 1 misses, 0 evictions"
+
+        leafpath.write_text(LEAF.format(width=16) + "\n# changed\n")
+        assert server.handle({"cmd": "gen", "top": "svserverlib.leaf"})["status"] == "ok"
+        assert "input  wire  [15:0] data_i" in filepath.read_text()
+
+    assert server.handle({"cmd": "status"})["tops"] == ["svserverlib.leaf"]
+    assert server.handle({"cmd": "reload"})["status"] == "ok"
+    assert server.handle({"cmd": "status"})["tops"] == []
+    assert server.handle({"cmd": "unknown"}) == {"status": "error", "error": "Unknown command 'unknown'"}
+    response = server.handle({"cmd": "gen", "top": "svserverlib.missing"})
+    assert response["status"] == "error"
+
+
+HELPERLEAF = """
+import ucdp as u
+from fileliststandard import HdlFileList
+
+from .width import WIDTH
+
+
+class LeafMod(u.AMod):
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(u.UintType(WIDTH), "data_i")
+"""
+
+
+def test_svserver_helper(example, tmp_path):
+    """Invalidate On Change Of An Imported Helper Module."""
+    libpath = tmp_path / "lib"
+    (libpath / "svserverlib3").mkdir(parents=True)
+    (libpath / "svserverlib3" / "__init__.py").touch()
+    (libpath / "svserverlib3" / "leaf.py").write_text(HELPERLEAF)
+    widthpath = libpath / "svserverlib3" / "width.py"
+    widthpath.write_text("WIDTH = 8\n")
+    outpath = tmp_path / "out"
+
+    server = usv.SvServer(socketpath=tmp_path / "sock", paths=(libpath,))
+    with mock.patch.dict(os.environ, {"PRJ": str(outpath)}):
+        assert server.handle({"cmd": "gen", "top": "svserverlib3.leaf"})["status"] == "ok"
+        (filepath,) = outpath.glob("**/leaf.sv")
+        assert "input wire [7:0] data_i" in filepath.read_text()
+        makolator = server._get_makolator()
+
+        widthpath.write_text("WIDTH = 16  # changed\n")
+        assert server.handle({"cmd": "gen", "top": "svserverlib3.leaf"})["status"] == "ok"
+        assert "input wire [15:0] data_i" in filepath.read_text()
+        # templates are compiled again after reload only
+        assert server._get_makolator() is not makolator
+        assert server._get_makolator() is server._get_makolator()
+
+
+def test_svserver_socket():
+    """Requests Via Unix Socket."""
+    # Unix socket paths are limited to about 100 characters, pytest's tmp_path might be longer
+    with TemporaryDirectory() as tmpdir:
+        socketpath = Path(tmpdir) / "sock"
+        server = usv.SvServer(socketpath=socketpath)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            for _ in range(100):
+                if socketpath.exists():
+                    break
+                thread.join(0.01)
+            assert usv.request_svserver(socketpath, timeout=10, cmd="status")["tops"] == []
+        finally:
+            assert usv.request_svserver(socketpath, timeout=10, cmd="stop")["status"] == "ok"
+            thread.join(10)
+        assert not thread.is_alive()
+        assert not socketpath.exists()
+
+
+def test_svserver_svchange(example, tmp_path):
+    """Rebuild On Changed SystemVerilog File."""
+    libpath = tmp_path / "lib"
+    (libpath / "svserverlib2").mkdir(parents=True)
+    (libpath / "svserverlib2" / "__init__.py").touch()
+    (libpath / "svserverlib2" / "imported.py").write_text(IMPORTED)
+    svpath = libpath / "imported.sv"
+    svpath.write_text(SV.format(width=8))
+
+    server = usv.SvServer(socketpath=tmp_path / "sock", paths=(libpath,))
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path / "out"), "LIBPATH": str(libpath)}):
+        assert server.handle({"cmd": "gen", "top": "svserverlib2.imported"})["status"] == "ok"
+        mod = server._get_model("svserverlib2.imported").top.mod
+        assert repr(mod.ports["data_i"].type_) == "UintType(8)"
+
+        svpath.write_text(SV.format(width=16) + "// changed")
+        mod = server._get_model("svserverlib2.imported").top.mod
+        assert repr(mod.ports["data_i"].type_) == "UintType(16)"
+
+        calls = []
+        with mock.patch.object(usv.SvServer, "handle", lambda self, request: calls.append(request)):
+            (svimport,) = usv.get_svimports(mod.__class__)
+            server.on_svchange((svimport,))
+        assert calls == [{"cmd": "gen", "top": "svserverlib2.imported", "name": "hdl", "target": None}]
+        assert server.handle({"cmd": "status"})["tops"] == []
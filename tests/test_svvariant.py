@@ -0,0 +1,81 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Define And Parameter Variants."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import ucdp as u
+from pytest import raises
+
+import ucdpsv as usv
+
+VARIANTS = (
+    usv.SvVariant(name="default"),
+    usv.SvVariant(name="a", defines={"A": None}),
+    usv.SvVariant(name="b", defines={"A": None, "B": 4}),
+)
+
+
+def _read(path: Path) -> dict[str, str]:
+    return {str(filepath.relative_to(path)): filepath.read_text() for filepath in sorted(path.rglob("*.sv"))}
+
+
+def test_variants(example, tmp_path):
+    """Variants Match Separate Runs."""
+    modcls = u.load("top.ifdef").mod.__class__
+    for variant in VARIANTS:
+        with mock.patch.dict(os.environ, {"PRJ": str(tmp_path / "separate" / variant.name)}):
+            u.generate(modcls(defines=variant.defines), "hdl")
+
+    basepath = tmp_path / "base"
+    variants = [variant.new(outpath=tmp_path / "variants" / variant.name) for variant in VARIANTS]
+    svcache = usv.SvCache()
+    with mock.patch.dict(os.environ, {"PRJ": str(basepath)}):
+        mods = usv.generate_variants(modcls, variants, "hdl", basepath=basepath, data={"svcache": svcache})
+
+    assert tuple(mods) == ("default", "a", "b")
+    assert mods["b"].defines
+    assert not basepath.exists()
+    # sub modules are not touched by the defines
+    assert svcache.hits == 8
+    for variant in VARIANTS:
+        separate = _read(tmp_path / "separate" / variant.name)
+        assert len(separate) == 5
+        assert _read(tmp_path / "variants" / variant.name) == separate
+    assert _read(tmp_path / "variants" / "default") != _read(tmp_path / "variants" / "b")
+
+
+def test_variants_errors(example, tmp_path):
+    """Variant Names Are Unique And Files Are Within The Base Path."""
+    modcls = u.load("top.ifdef").mod.__class__
+    variants = (usv.SvVariant(name="a", outpath=tmp_path / "a"),) * 2
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}), raises(ValueError, match="not unique"):
+        usv.generate_variants(modcls, variants, "hdl", basepath=tmp_path)
+    # nothing generated
+    assert not (tmp_path / "a").exists()
+
+    with mock.patch.dict(os.environ, {"PRJ": str(tmp_path)}), raises(ValueError, match="located within"):
+        usv.generate_variants(modcls, variants[:1], "hdl", basepath=tmp_path / "other")
@@ -0,0 +1,102 @@
+#
+# MIT License
+#
+# Copyright (c) 2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Watcher."""
+
+from pathlib import Path
+from threading import Event
+
+import ucdp as u
+from pytest import mark
+
+import ucdpsv as usv
+
+SV = """
+module watched (
+  input wire [{width}-1:0] data_i
+);
+endmodule
+"""
+
+
+class WatchedMod(u.ATailoredMod):
+    """Watched Module."""
+
+    filepath: Path
+
+    def _build(self) -> None:
+        usv.import_params_ports(self, filepath=self.filepath)
+
+    @property
+    def modname(self):
+        """Module Name."""
+        return "watched"
+
+
+def _get_svimports(filepath: Path) -> list[usv.SvImport]:
+    return [svimport for svimport in usv.get_svimports(WatchedMod) if svimport.filepath == filepath]
+
+
+def test_check(tmp_path):
+    """Changes Are Reported Once."""
+    filepath = tmp_path / "watched.sv"
+    filepath.write_text(SV.format(width=8))
+    mod = WatchedMod(filepath=filepath)
+    assert repr(mod.ports["data_i"].type_) == "UintType(8)"
+
+    reported = []
+    watcher = usv.SvWatcher(callback=reported.append)
+    assert not [svimport for svimport in watcher.check() if svimport.filepath == filepath]
+
+    filepath.write_text(SV.format(width=16))
+    changed = [svimport for svimport in watcher.check() if svimport.filepath == filepath]
+    assert changed == _get_svimports(filepath)
+    assert reported
+    assert not [svimport for svimport in watcher.check() if svimport.filepath == filepath]
+
+    # re-import
+    mod = WatchedMod(filepath=filepath)
+    assert repr(mod.ports["data_i"].type_) == "UintType(16)"
+    assert not [svimport for svimport in watcher.check() if svimport.filepath == filepath]
+
+
+@mark.parametrize("use_inotify", (True, False))
+def test_watch(tmp_path, use_inotify):
+    """Background Watching."""
+    filepath = tmp_path / "watched.sv"
+    filepath.write_text(SV.format(width=8))
+    WatchedMod(filepath=filepath)
+
+    event = Event()
+
+    def callback(svimports):
+        if any(svimport.filepath == filepath for svimport in svimports):
+            event.set()
+
+    watcher = usv.SvWatcher(callback=callback, interval=0.05, use_inotify=use_inotify)
+    watcher.start()
+    try:
+        filepath.write_text(SV.format(width=4))
+        assert event.wait(10)
+    finally:
+        watcher.stop()
@@ -0,0 +1,49 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Example."""
+
+import ucdp as u
+from fileliststandard import HdlFileList
+
+
+class FlipflopMod(u.AMod):
+    """Module using Flip-Flops."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(u.ClkRstAnType(), "other_i")
+        self.add_port(u.BitType(), "clr_i")
+        self.add_port(u.BitType(), "ena_i")
+        self.add_port(u.UintType(8), "data_i")
+
+        self.add_flipflop(u.UintType(8), "plain_r", "main_clk_i", "main_rst_an_i", nxt="data_i")
+        self.add_flipflop(u.UintType(8), "clr_r", "main_clk_i", "main_rst_an_i", nxt="data_i", rst="clr_i")
+        self.add_flipflop(u.UintType(8), "ena_r", "main_clk_i", "main_rst_an_i", nxt="data_i", ena="ena_i")
+        self.add_flipflop(
+            u.UintType(8, default=3), "both_r", "main_clk_i", "main_rst_an_i", nxt="data_i", rst="clr_i", ena="ena_i"
+        )
+        self.add_flipflop(u.UintType(8), "other_r", "other_clk_i", "other_rst_an_i", nxt="data_i")
+        self.add_flipflop(u.BitType(), "plain2_r", "main_clk_i", "main_rst_an_i", nxt="ena_i")
@@ -0,0 +1,73 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Example."""
+
+import ucdp as u
+from fileliststandard import HdlFileList
+
+
+class LanesMod(u.AMod):
+    """Module with Instance Arrays."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(u.UintType(32), "data_i")
+        self.add_port(u.UintType(32), "data_o")
+        self.add_port(u.UintType(4), "ena_i")
+        self.add_port(u.UintType(8), "other_i")
+        self.add_signal(u.UintType(8), "other_s")
+
+        for idx in range(4):
+            lane = LaneMod(self, f"u_lane{idx}")
+            lane.con("main_i", "main_i")
+            lane.con("data_i", f"data_i[{8 * idx + 7}:{8 * idx}]")
+            lane.con("data_o", f"data_o[{8 * idx + 7}:{8 * idx}]")
+            lane.con("ena_i", f"ena_i[{idx}]")
+
+        other = LaneMod(self, "u_other0")
+        other.con("main_i", "main_i")
+        other.con("data_i", "other_i")
+        other.con("data_o", "other_s")
+
+        other = LaneMod(self, "u_other1", paramdict={"width_p": 8})
+        other.con("main_i", "main_i")
+        other.con("data_i", "other_s")
+
+
+class LaneMod(u.AMod):
+    """Lane."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        width_p = self.add_param(u.IntegerType(default=8), "width_p")
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(u.UintType(width_p), "data_i")
+        self.add_port(u.UintType(width_p), "data_o")
+        self.add_port(u.BitType(), "ena_i")
+
+        self.add_flipflop(u.UintType(width_p), "data_r", "main_clk_i", "main_rst_an_i", nxt="data_i", ena="ena_i")
+        self.assign("data_o", "data_r")
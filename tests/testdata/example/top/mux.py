@@ -62,6 +62,7 @@ class MuxMod(u.AMod):
         self.add_signal(u.UintType(4), "q3_s")
 
         self.add_port(u.UintType(4), "q4_o")
+        self.add_port(u.UintType(4), "q5_o")
 
         self.add_type_consts(MyEnumType())
 
@@ -85,3 +86,11 @@ class MuxMod(u.AMod):
         mux.set("sel_s", "3h1", "q2_o", "a1_i")
 
         mux = self.add_mux("empty")
+
+        mux = self.add_mux("grouped")
+        mux.set("sel_s", "3h0", "q5_o", "a0_i")
+        mux.set("sel_s", "3h1", "q5_o", "b0_i")
+        mux.set("sel_s", "3h2", "q5_o", "a0_i")
+        mux.set("sel_s", "3h3", "q5_o", "b0_i")
+        mux.set("sel_s", "3h4", "q5_o", "c0_i")
+        mux.set("sel_s", "3h5", "q5_o", "a0_i")
@@ -0,0 +1,87 @@
+#
+# MIT License
+#
+# Copyright (c) 2024-2025 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Example."""
+
+import ucdp as u
+from fileliststandard import HdlFileList
+from glbl.bus import BusType
+
+
+class PixelType(u.AStructType):
+    """Pixel."""
+
+    def _build(self) -> None:
+        self._add("valid", u.BitType(), title="Pixel is valid")
+        self._add("red", u.UintType(8))
+        self._add("green", u.UintType(8))
+        self._add("blue", u.UintType(8))
+
+
+class StructMod(u.AMod):
+    """Module using Structs."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(u.ClkRstAnType(), "main_i")
+        self.add_port(PixelType(), "pix_i")
+        self.add_port(PixelType(), "pix_o")
+        self.add_port(PixelType(), "swap_o")
+        self.add_port(BusType(), "bus_i")
+        self.add_port(u.UintType(8), "red_o")
+        self.add_port(u.UintType(8), "color_o")
+        self.add_signal(PixelType(), "pix_s")
+
+        self.assign("pix_o", "pix_s")
+        self.assign("red_o", "pix_red_i")
+        self.assign("swap_valid_o", "pix_valid_i")
+        self.assign("swap_red_o", "pix_blue_i")
+        self.assign("swap_green_o", "pix_green_i")
+        self.assign("swap_blue_o", "pix_red_i")
+
+        self.add_flipflop(u.BitType(), "valid_r", "main_clk_i", "main_rst_an_i", nxt="pix_valid_s")
+
+        mux = self.add_mux("color")
+        mux.set("pix_valid_s", "1b0", "color_o", "pix_red_s")
+        mux.set("pix_valid_s", "1b1", "color_o", "pix_blue_s")
+
+        sub = StructSubMod(self, "u_sub0")
+        sub.con("pix_i", "pix_i")
+        sub.con("pix_o", "pix_s")
+
+        sub = StructSubMod(self, "u_sub1")
+        sub.con("pix_valid_i", "pix_valid_i")
+        sub.con("pix_red_i", "pix_green_i")
+
+
+class StructSubMod(u.AMod):
+    """Sub Module using Structs."""
+
+    filelists: u.ClassVar[u.ModFileLists] = (HdlFileList(gen="full"),)
+
+    def _build(self):
+        self.add_port(PixelType(), "pix_i")
+        self.add_port(PixelType(), "pix_o")
+
+        self.assign("pix_o", "pix_i")
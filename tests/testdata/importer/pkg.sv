@@ -0,0 +1,25 @@
+// Package with widths shared by many modules
+package top_pkg;
+
+  localparam int WIDTH = 8; // Data Width
+  parameter DEPTH = WIDTH * 2;
+  localparam logic [3:0] MODE = 4'h3, MODE2 = MODE + 1;
+  /* Types */
+  typedef logic [WIDTH-1:0] data_t;
+  typedef logic signed [1:0][DEPTH-1:0] pair_t;
+
+endpackage
+
+module pkg_top
+  import top_pkg::*;
+#(
+  parameter int  depth_p = top_pkg::DEPTH,
+  parameter int  width_p = 4
+) (
+  input  wire  [top_pkg::WIDTH-1:0] data_i,
+  output logic [DEPTH-1:0]          cnt_o,
+  output logic [width_p-1:0]        sub_o,
+  output logic [MODE:0]             mode_o
+);
+
+endmodule